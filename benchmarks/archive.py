@@ -0,0 +1,190 @@
+"""Uji arsip tugas selesai: ukuran data aktif, pemindahan, dan pencarian arsip
+
+Database sintetis disalin lalu TodoStore.maintain dijalankan sementara
+DatabaseWorker terus menambah tugas (seperti GUI yang dipakai saat pemeliharaan
+latar berjalan). Sebelumnya satu pemindahan dihentikan paksa setelah salinan
+ke arsip tersimpan tapi sebelum tugas dihapus dari tasks, untuk memastikan
+pemindahan ulang tidak menggandakan tugas. Lolos jika semua tugas selesai yang
+cukup lama pindah ke arsip tepat sekali, tidak ada tugas yang hilang, tulisan
+worker tidak gagal, dan arsip bisa dicari. Hasil dalam JSON; exit 1 jika ada
+yang gagal.
+
+Jalankan dari root repo:
+    python benchmarks/archive.py
+    python benchmarks/archive.py --rows 100000 --days 30
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import main  # noqa: E402
+import todo_store  # noqa: E402
+from todo_store import TodoStore  # noqa: E402
+
+
+class Interrupted(Exception):
+    pass
+
+
+def file_size(path):
+    """Ukuran file database beserta -wal (byte)"""
+    return sum(os.path.getsize(p) for p in (path, path + "-wal") if os.path.exists(p))
+
+
+def hot_timings(store, runs):
+    """Median (ms) halaman pertama daftar dan statistik footer seperti TodoApp"""
+    def median(func):
+        samples = []
+        for _ in range(runs):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        return round(statistics.median(samples), 3)
+    
+    return {
+        "list_page_ms": median(lambda: store.list_tasks(main.VIRTUAL_THRESHOLD)),
+        "count_ms": median(store.count_tasks),
+    }
+
+
+def interrupted_move(db_path, days):
+    """Pemindahan yang berhenti di antara dua commit (salin ke arsip, hapus dari tasks)"""
+    store = TodoStore(db_path)
+    
+    def crash(*args):
+        raise Interrupted
+    
+    store.delete_bulk = crash
+    try:
+        store.archive_completed(days, batch_size=500)
+    except Interrupted:
+        pass
+    store.cursor.execute("SELECT count(*) FROM archive.archived_tasks")
+    copied = store.cursor.fetchone()[0]
+    store.close()
+    return copied
+
+
+def run(args):
+    from suite import cached_database
+    
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "archive.db")
+        shutil.copyfile(cached_database(args.cache_dir, args.rows), db_path)
+        store = TodoStore(db_path)
+        cutoff = (datetime.now() - timedelta(days=args.days)).strftime("%Y-%m-%d %H:%M")
+        store.cursor.execute(
+            "SELECT count(*) FROM tasks WHERE status = 'Selesai' AND ifnull(completed_date, created_date) < ?",
+            (cutoff,)
+        )
+        eligible = store.cursor.fetchone()[0]
+        total_before = store.count_tasks()[0]
+        before = hot_timings(store, args.runs)
+        size_before = file_size(db_path)
+        
+        copied = interrupted_move(db_path, args.days)
+        
+        # Penulis bersamaan lewat DatabaseWorker selama maintain berjalan
+        worker = main.DatabaseWorker(None, db_path)
+        stop = threading.Event()
+        added, failures = [], []
+        
+        def write():
+            while not stop.is_set():
+                try:
+                    added.append(worker.submit(
+                        TodoStore.add_task, "ditulis saat arsip", "Sedang", "2030-01-01", "12:00"
+                    ).result())
+                except Exception as exc:
+                    failures.append(repr(exc))
+                time.sleep(0.002)
+        
+        writer = threading.Thread(target=write)
+        writer.start()
+        stats = store.maintain(args.days, background=True)
+        stop.set()
+        writer.join()
+        worker.close()
+        again = store.maintain(args.days)
+        
+        store.attach_archive()
+        store.cursor.execute("SELECT count(*), count(DISTINCT id) FROM archive.archived_tasks")
+        archived, distinct = store.cursor.fetchone()
+        store.cursor.execute("SELECT count(*) FROM archive.archived_tasks WHERE id IN (SELECT id FROM tasks)")
+        both = store.cursor.fetchone()[0]
+        store.cursor.execute(
+            "SELECT count(*) FROM tasks WHERE status = 'Selesai' AND ifnull(completed_date, created_date) < ?",
+            (cutoff,)
+        )
+        left = store.cursor.fetchone()[0]
+        total_after = store.count_tasks()[0]
+        store.cursor.execute("SELECT task FROM archive.archived_tasks ORDER BY id LIMIT 1")
+        row = store.cursor.fetchone()
+        word = row[0].split()[0] if row else ""
+        
+        if archived != eligible or distinct != archived:
+            problems.append(f"arsip berisi {archived} tugas ({distinct} unik), seharusnya {eligible}")
+        if both:
+            problems.append(f"{both} tugas ada di tasks dan arsip sekaligus")
+        if left:
+            problems.append(f"{left} tugas selesai lama masih di tasks")
+        if total_after + archived != total_before + len(added):
+            problems.append(f"jumlah tugas {total_after} + arsip {archived} tidak sesuai")
+        if failures:
+            problems.append(f"{len(failures)} tulisan worker gagal: {failures[0]}")
+        if again["archived"]:
+            problems.append(f"maintain kedua masih memindahkan {again['archived']} tugas")
+        
+        search_ms = []
+        found = 0
+        for _ in range(args.runs):
+            started = time.perf_counter()
+            found = len(store.search_archive(word))
+            search_ms.append((time.perf_counter() - started) * 1000)
+        if word and not found:
+            problems.append(f"pencarian arsip '{word}' tidak menemukan apa-apa")
+        
+        after = hot_timings(store, args.runs)
+        store.close()
+        report = {
+            "rows": args.rows,
+            "days": args.days,
+            "eligible": eligible,
+            "copied_before_interrupt": copied,
+            "archived": stats["archived"],
+            "maintain_s": round(stats["seconds"], 3),
+            "maintain_again_s": round(again["seconds"], 3),
+            "freed_pages": stats["freed_pages"],
+            "concurrent_writes": len(added),
+            "hot_before": before,
+            "hot_after": after,
+            "main_bytes_before": size_before,
+            "main_bytes_after": file_size(db_path),
+            "archive_bytes": file_size(todo_store.archive_path(db_path)),
+            "archive_search_ms": round(statistics.median(search_ms), 3),
+            "archive_search_hits": found,
+            "problems": problems,
+        }
+    print(json.dumps(report, indent=2))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="jumlah tugas awal (default: %(default)s)")
+    parser.add_argument("--days", type=int, default=todo_store.ARCHIVE_AFTER_DAYS,
+                        help="umur tugas selesai yang diarsipkan (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "todo-bench"),
+                        help="lokasi database sintetis yang dipakai ulang (default: %(default)s)")
+    sys.exit(run(parser.parse_args()))
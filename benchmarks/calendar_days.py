@@ -0,0 +1,178 @@
+"""Uji tabel task_days (jumlah tugas per hari deadline) dan TodoStore.calendar_days
+
+Database sintetis disalin lalu diberi campuran tulisan acak: tambah, ubah
+deadline, selesaikan, hapus, ubah massal, undo/redo, hapus semua + undo, dan
+UPDATE sqlite3 mentah seperti skrip lain. Setelahnya task_days harus sama
+dengan GROUP BY langsung atas tabel tasks, dan calendar_days untuk beberapa
+bulan harus sama dengan hasil query agregat lama (scan semua tugas di bulan
+itu). Waktu satu bulan lewat keduanya ikut dilaporkan. Hasil dalam JSON; exit 1
+jika ada yang gagal.
+
+Jalankan dari root repo:
+    python benchmarks/calendar_days.py
+    python benchmarks/calendar_days.py --rows 1000000 --ops 2000
+"""
+import argparse
+import calendar
+import json
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import todo_store  # noqa: E402
+from todo_store import TodoStore  # noqa: E402
+
+MONTHS = ((2025, 6), (2026, 1), (2026, 10), (2027, 3))
+
+# Query sebelum task_days: kelompokkan semua tugas berdeadline di rentang
+SCAN_SQL = (
+    "SELECT deadline_date, count(*), sum(status = 'Selesai'), sum(state = 'overdue'), "
+    "json_group_array(json_array(id, deadline_time, task, state)) FILTER (WHERE n <= ?) "
+    f"FROM (SELECT id, task, status, deadline_date, deadline_time, {todo_store.STATE_SQL} AS state, "
+    "    row_number() OVER (PARTITION BY deadline_date ORDER BY deadline_ts, id) AS n "
+    "    FROM tasks WHERE deadline_ts BETWEEN ? AND ? AND deadline_date IS NOT NULL) "
+    "GROUP BY deadline_date"
+)
+
+
+def random_deadline(rng):
+    day = date(2025, 1, 1) + timedelta(days=rng.randint(0, 3 * 365))
+    return day.isoformat(), f"{rng.randint(0, 23):02d}:{rng.choice(('00', '30'))}"
+
+
+def mutate(db_path, ops, seed):
+    """Campuran tulisan yang menyentuh deadline, status, dan keberadaan tugas"""
+    rng = random.Random(seed)
+    store = TodoStore(db_path)
+    raw = sqlite3.connect(db_path, isolation_level=None)
+    store.cursor.execute("SELECT max(id) FROM tasks")
+    max_id = store.cursor.fetchone()[0]
+    
+    def some_ids(count):
+        return [rng.randint(1, max_id) for _ in range(count)]
+    
+    for op in range(ops):
+        kind = rng.random()
+        if kind < 0.25:
+            max_id = max(max_id, store.add_task(f"kalender {op}", "Sedang", *random_deadline(rng)))
+        elif kind < 0.4:
+            store.update_task(some_ids(1)[0], f"diubah {op}", *random_deadline(rng))
+        elif kind < 0.55:
+            store.complete_tasks(some_ids(rng.randint(1, 20)))
+        elif kind < 0.65:
+            store.delete_tasks(some_ids(rng.randint(1, 20)))
+        elif kind < 0.75:
+            store.reschedule_tasks(some_ids(rng.randint(1, 50)), *random_deadline(rng))
+        elif kind < 0.85:
+            store.undo()
+        elif kind < 0.9:
+            store.redo()
+        elif kind < 0.95:
+            # Tanpa TodoStore: status saja, deadline teks saja, atau epoch tanpa teks
+            raw.execute("UPDATE tasks SET status = 'Belum Selesai' WHERE id = ?", (some_ids(1)[0],))
+            raw.execute("UPDATE tasks SET deadline_date = ?, deadline_ts = NULL WHERE id = ?",
+                        (random_deadline(rng)[0], some_ids(1)[0]))
+            raw.execute("UPDATE tasks SET deadline_ts = ? WHERE id = "
+                        "(SELECT id FROM tasks WHERE deadline_date IS NULL AND id >= ? LIMIT 1)",
+                        (int(time.time()), some_ids(1)[0]))
+        else:
+            store.add_task(f"tanpa deadline {op}", "Rendah")
+    store.clear_all()
+    store.undo()
+    raw.close()
+    store.close()
+
+
+def month_range(year, month):
+    return f"{year}-{month:02d}-01", f"{year}-{month:02d}-{calendar.monthrange(year, month)[1]:02d}"
+
+
+def scan_days(store, date_from, date_to, titles):
+    """Hasil calendar_days dengan query agregat lama (tanpa tugas berulang)"""
+    start_ts = todo_store.deadline_timestamp(date_from, "00:00")
+    end_ts = todo_store.deadline_timestamp(date_to, "23:59")
+    store.cursor.execute(SCAN_SQL, (titles, start_ts, end_ts))
+    return {
+        day: [count, completed, overdue, [tuple(item) for item in json.loads(items)]]
+        for day, count, completed, overdue, items in store.cursor.fetchall()
+    }
+
+
+def median_ms(func, runs):
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def run(args):
+    from suite import cached_database
+    
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "calendar.db")
+        shutil.copyfile(cached_database(args.cache_dir, args.rows), db_path)
+        started = time.perf_counter()
+        mutate(db_path, args.ops, args.seed)
+        mutate_s = time.perf_counter() - started
+        
+        store = TodoStore(db_path)
+        store.cursor.execute("SELECT day, total, completed FROM task_days WHERE total != 0 ORDER BY day")
+        buckets = store.cursor.fetchall()
+        store.cursor.execute(
+            "SELECT deadline_date, count(*), sum(status = 'Selesai') FROM tasks "
+            "WHERE deadline_ts IS NOT NULL AND deadline_date IS NOT NULL GROUP BY deadline_date ORDER BY deadline_date"
+        )
+        expected = store.cursor.fetchall()
+        if buckets != expected:
+            wrong = set(buckets).symmetric_difference(expected)
+            problems.append(f"task_days berbeda dari tasks di {len({row[0] for row in wrong})} hari")
+        
+        months = []
+        for year, month in MONTHS:
+            date_from, date_to = month_range(year, month)
+            got = store.calendar_days(date_from, date_to)
+            want = scan_days(store, date_from, date_to, todo_store.CALENDAR_TITLES)
+            if got != want:
+                problems.append(f"calendar_days {year}-{month:02d} berbeda dari scan")
+            months.append({
+                "month": f"{year}-{month:02d}",
+                "tasks": sum(entry[0] for entry in got.values()),
+                "calendar_days_ms": median_ms(lambda: store.calendar_days(date_from, date_to), args.runs),
+                "scan_ms": median_ms(
+                    lambda: scan_days(store, date_from, date_to, todo_store.CALENDAR_TITLES), args.runs
+                ),
+            })
+        store.close()
+    
+    report = {
+        "rows": args.rows,
+        "ops": args.ops,
+        "mutate_s": round(mutate_s, 3),
+        "task_days": len(buckets),
+        "months": months,
+        "problems": problems,
+    }
+    print(json.dumps(report, indent=2))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="jumlah tugas awal (default: %(default)s)")
+    parser.add_argument("--ops", type=int, default=1000, help="tulisan acak (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=3)
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "todo-bench"),
+                        help="lokasi database sintetis yang dipakai ulang (default: %(default)s)")
+    sys.exit(run(parser.parse_args()))
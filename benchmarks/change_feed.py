@@ -0,0 +1,165 @@
+"""Uji deteksi tulisan proses lain lewat PRAGMA data_version dan tabel changes
+
+Satu proses anak menulis ke file database seperti CLI atau skrip (TodoStore
+dan sqlite3 langsung), sementara proses ini menulis sendiri lewat
+DatabaseWorker dan menyalin daftar tugas ke dict seperti Treeview. Salinan
+hanya diperbarui dari ID yang dikembalikan changes_since (cara kerja
+LocalChangeFeed), tanpa memuat ulang seluruh tabel. Lolos jika salinan akhir
+sama dengan isi database, tidak ada muat ulang, dan tulisan worker sendiri
+tidak ikut dikembalikan. Hasil dalam JSON; exit 1 jika ada yang gagal.
+
+Jalankan dari root repo:
+    python benchmarks/change_feed.py
+    python benchmarks/change_feed.py --rows 100000 --ops 2000
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import main  # noqa: E402
+import todo_store  # noqa: E402
+from todo_store import TodoStore  # noqa: E402
+
+# Interval cek reader di uji ini (ms); TodoApp memakai main.CHANGE_POLL_MS
+POLL_MS = 5
+
+
+def writer(db_path, ops, seed):
+    """Proses anak: campuran tulisan TodoStore dan UPDATE sqlite3 mentah"""
+    rng = random.Random(seed)
+    store = TodoStore(db_path)
+    raw = sqlite3.connect(db_path)
+    added = []
+    for op in range(ops):
+        kind = rng.random()
+        if kind < 0.35 or not added:
+            added.append(store.add_task(f"proses lain {op}", "Sedang", "2030-01-01", "12:00"))
+        elif kind < 0.55:
+            store.complete_task(rng.choice(added))
+        elif kind < 0.7:
+            store.set_notes(rng.choice(added), f"catatan {op}")
+        elif kind < 0.8:
+            store.update_task(rng.choice(added), f"diubah {op}", "2031-02-03", "08:30")
+        elif kind < 0.9:
+            raw.execute("UPDATE tasks SET priority = 'Tinggi' WHERE id = ?", (rng.choice(added),))
+            raw.commit()
+        else:
+            store.delete_task(added.pop(rng.randrange(len(added))))
+        time.sleep(rng.random() / 1000)
+    raw.close()
+    store.close()
+
+
+def snapshot(rows):
+    """Baris tanpa kolom status terlambat (bergantung jam) dan kolom urut"""
+    return {row[0]: row[:7] + row[8:9] for row in rows}
+
+
+def run(args):
+    from suite import cached_database
+    
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "changes.db")
+        shutil.copyfile(cached_database(args.cache_dir, args.rows), db_path)
+        store = TodoStore(db_path)
+        worker = main.DatabaseWorker(None, db_path)
+        
+        started = time.perf_counter()
+        mirror = snapshot(store.list_tasks())
+        reload_ms = (time.perf_counter() - started) * 1000
+        data_version = store.data_version()
+        version = store.change_version()
+        
+        child = subprocess.Popen([sys.executable, os.path.abspath(__file__), "--writer", db_path,
+                                  str(args.ops), str(args.seed)])
+        own_ids = set()
+        delta_ms, delta_rows, idle_us = [], [], []
+        reloads = echoes = 0
+        rng = random.Random(args.seed + 1)
+        while True:
+            finished = child.poll() is not None
+            # Tulisan sendiri: hasilnya langsung diterapkan seperti callback TodoApp
+            if not finished and rng.random() < 0.2:
+                task_id = worker.submit(TodoStore.add_task, "sendiri", "Rendah", "2030-05-05", "09:00").result()
+                own_ids.add(task_id)
+                mirror.update(snapshot(store.get_tasks([task_id])))
+            
+            started = time.perf_counter()
+            current = store.data_version()
+            if current == data_version:
+                idle_us.append((time.perf_counter() - started) * 1e6)
+            else:
+                data_version = current
+                skip = worker.take_own_changes(version)
+                version, task_ids = store.changes_since(version, main.VIRTUAL_THRESHOLD, skip)
+                if task_ids is None:
+                    reloads += 1
+                    mirror = snapshot(store.list_tasks())
+                elif task_ids:
+                    echoes += len(own_ids.intersection(task_ids))
+                    rows = snapshot(store.get_tasks(task_ids))
+                    for task_id in task_ids:
+                        if task_id in rows:
+                            mirror[task_id] = rows[task_id]
+                        else:
+                            mirror.pop(task_id, None)
+                    delta_ms.append((time.perf_counter() - started) * 1000)
+                    delta_rows.append(len(task_ids))
+            # Selesai setelah penulis berhenti dan commit terakhirnya sudah diterapkan
+            if finished and store.change_version() == version:
+                break
+            time.sleep(POLL_MS / 1000)
+        
+        worker.close()
+        if child.returncode != 0:
+            problems.append(f"proses penulis gagal (exit {child.returncode})")
+        expected = snapshot(store.list_tasks())
+        if mirror != expected:
+            wrong = {task_id for task_id in expected.keys() | mirror.keys()
+                     if expected.get(task_id) != mirror.get(task_id)}
+            problems.append(f"{len(wrong)} tugas di salinan berbeda dari database")
+        if reloads:
+            problems.append(f"{reloads} kali muat ulang penuh")
+        if echoes:
+            problems.append(f"{echoes} tulisan worker sendiri dikembalikan changes_since")
+        store.close()
+    
+    report = {
+        "rows": args.rows,
+        "writer_ops": args.ops,
+        "own_writes": len(own_ids),
+        "idle_poll_us": round(statistics.median(idle_us), 2) if idle_us else None,
+        "delta_applies": len(delta_ms),
+        "delta_median_ms": round(statistics.median(delta_ms), 3) if delta_ms else None,
+        "delta_max_rows": max(delta_rows, default=0),
+        "full_reload_ms": round(reload_ms, 1),
+        "own_echoes": echoes,
+        "changes_kept": todo_store.CHANGES_KEEP,
+        "problems": problems,
+    }
+    print(json.dumps(report, indent=2))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--writer":
+        writer(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+        sys.exit(0)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000, help="jumlah tugas awal (default: %(default)s)")
+    parser.add_argument("--ops", type=int, default=1000, help="tulisan proses lain (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "todo-bench"),
+                        help="lokasi database sintetis yang dipakai ulang (default: %(default)s)")
+    sys.exit(run(parser.parse_args()))
@@ -0,0 +1,79 @@
+"""Uji crash-safety group commit: proses penulis dibunuh (SIGKILL) di tengah burst
+
+Setiap tugas yang sudah dikonfirmasi (future selesai) harus tetap ada setelah
+proses mati, dan database harus lolos integrity_check. Versi singkatnya
+dijalankan pytest (tests/test_crash_safety.py).
+
+Jalankan dari root repo:
+    python benchmarks/crash_safety.py --profile seimbang --rounds 5
+"""
+import argparse
+import os
+import random
+import signal
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import main  # noqa: E402
+import todo_store  # noqa: E402
+
+
+def writer(db_path, profile):
+    """Proses anak: tulis burst tanpa henti dan laporkan ID yang sudah di-commit"""
+    worker = main.DatabaseWorker(None, db_path, profile=todo_store.STORAGE_PROFILES[profile])
+    burst = 0
+    while True:
+        burst += 1
+        futures = [
+            worker.submit(todo_store.TodoStore.add_task, f"burst {burst} #{i}", "Sedang", "2026-01-01", "12:00")
+            for i in range(random.randint(1, 300))
+        ]
+        for future in futures:
+            print(future.result(), flush=True)
+
+
+def run_round(profile, acks_before_kill):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "crash.db")
+        child = subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "--writer", db_path, "--profile", profile],
+            stdout=subprocess.PIPE,
+            text=True
+        )
+        acked = set()
+        for line in child.stdout:
+            acked.add(int(line))
+            if len(acked) >= acks_before_kill:
+                break
+        child.send_signal(signal.SIGKILL)
+        child.wait()
+        # Sisa ID yang sudah tercetak sebelum proses mati juga sudah di-commit
+        acked.update(int(line) for line in child.stdout if line.strip())
+        
+        conn = sqlite3.connect(db_path)
+        integrity = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        stored = {row[0] for row in conn.execute("SELECT id FROM tasks")}
+        conn.close()
+    
+    missing = acked - stored
+    ok = integrity == "ok" and not missing
+    print(f"acked={len(acked):6d} stored={len(stored):6d} missing={len(missing)} integrity={integrity} -> {'OK' if ok else 'GAGAL'}")
+    return ok
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--profile", default=todo_store.STORAGE_PROFILE, choices=sorted(todo_store.STORAGE_PROFILES))
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--writer", metavar="DB", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.writer:
+        writer(args.writer, args.profile)
+    
+    results = [run_round(args.profile, random.randint(500, 5000)) for _ in range(args.rounds)]
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,79 @@
+"""Bandingkan deadline teks (deadline_date + deadline_time) dengan epoch deadline_ts
+
+Jalankan dari root repo:
+    python benchmarks/deadline_layout.py --rows 200000
+"""
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import todo_store  # noqa: E402
+from query_plan import fill  # noqa: E402
+
+
+def layouts(now):
+    """Pasangan query (teks, epoch) untuk operasi yang sama"""
+    now_text = now.strftime("%Y-%m-%d %H:%M")
+    week_start = now - timedelta(days=now.weekday())
+    week_end = week_start + timedelta(days=7)
+    return {
+        "sort_page": (
+            ("SELECT id FROM tasks ORDER BY deadline_date, deadline_time, id LIMIT 100 OFFSET 20000", ()),
+            ("SELECT id FROM tasks ORDER BY deadline_ts, id LIMIT 100 OFFSET 20000", ()),
+        ),
+        "overdue_count": (
+            ("SELECT COUNT(*) FROM tasks WHERE status = 'Belum Selesai' "
+             "AND deadline_date || ' ' || deadline_time <= ?", (now_text,)),
+            ("SELECT COUNT(*) FROM tasks WHERE status = 'Belum Selesai' AND deadline_ts <= ?",
+             (int(now.timestamp()),)),
+        ),
+        "due_this_week": (
+            ("SELECT id FROM tasks WHERE deadline_date || ' ' || deadline_time >= ? "
+             "AND deadline_date || ' ' || deadline_time < ? ORDER BY deadline_date, deadline_time",
+             (week_start.strftime("%Y-%m-%d 00:00"), week_end.strftime("%Y-%m-%d 00:00"))),
+            ("SELECT id FROM tasks WHERE deadline_ts >= ? AND deadline_ts < ? ORDER BY deadline_ts",
+             (int(week_start.replace(hour=0, minute=0).timestamp()),
+              int(week_end.replace(hour=0, minute=0).timestamp()))),
+        ),
+    }
+
+
+def timed(conn, sql, params, runs=5):
+    """Waktu rata-rata (ms) dan query plan satu query"""
+    plan = " ; ".join(row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+    started = time.perf_counter()
+    for _ in range(runs):
+        result = conn.execute(sql, params).fetchall()
+    return (time.perf_counter() - started) / runs * 1000, plan, result
+
+
+def run(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        todo_store.migrate_database(conn, target_version=2)
+        fill(conn, rows)
+        queries = layouts(datetime(2026, 6, 15, 12, 0))
+        
+        text_results = {name: timed(conn, *pair[0]) for name, pair in queries.items()}
+        todo_store.migrate_database(conn)
+        epoch_results = {name: timed(conn, *pair[1]) for name, pair in queries.items()}
+        conn.close()
+    
+    print(f"{'query':15s} {'teks (ms)':>10s} {'epoch (ms)':>11s}  sama?")
+    for name in queries:
+        text_ms, text_plan, text_rows = text_results[name]
+        epoch_ms, epoch_plan, epoch_rows = epoch_results[name]
+        print(f"{name:15s} {text_ms:10.2f} {epoch_ms:11.2f}  {text_rows == epoch_rows}")
+        print(f"    teks : {text_plan}")
+        print(f"    epoch: {epoch_plan}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="jumlah tugas sintetis")
+    run(parser.parse_args().rows)
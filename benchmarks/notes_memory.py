@@ -0,0 +1,97 @@
+"""Ukur memori dan waktu memuat daftar tugas dengan catatan besar (skema v5 vs v6)
+
+Jalankan dari root repo:
+    python benchmarks/notes_memory.py --rows 20000 --notes-kb 4
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import todo_store  # noqa: E402
+from query_plan import fill  # noqa: E402
+
+# Versi 5: catatan ada di tasks.notes
+LIST_WITH_NOTES = "SELECT id, task, priority, status, deadline_ts, notes FROM tasks ORDER BY deadline_ts, id"
+LIST_SQL_TRIM = (
+    "SELECT id, task, priority, status, deadline_ts, "
+    "(trim(ifnull(notes, ''), ' ' || char(9, 10, 13)) != '') FROM tasks ORDER BY deadline_ts, id"
+)
+# Versi 6: isi catatan di task_notes, daftar hanya membaca flag
+LIST_HAS_NOTES = "SELECT id, task, priority, status, deadline_ts, has_notes FROM tasks ORDER BY deadline_ts, id"
+
+
+def load_python_strip(conn):
+    """Pola lama load_tasks: fetchall() termasuk isi catatan, lalu notes.strip() per baris"""
+    rows = conn.execute(LIST_WITH_NOTES).fetchall()
+    return [row[:5] + (bool(row[5] and row[5].strip()),) for row in rows]
+
+
+def bytes_read():
+    """Byte yang dibaca proses ini dari file (Linux); None jika tidak tersedia"""
+    try:
+        with open("/proc/self/io") as io:
+            return next(int(line.split()[1]) for line in io if line.startswith("rchar:"))
+    except OSError:
+        return None
+
+
+def load_sql(sql):
+    def load(conn):
+        return conn.execute(sql).fetchall()
+    return load
+
+
+def measure(conn, label, load):
+    """Cetak waktu, puncak alokasi Python, dan byte yang dibaca SQLite untuk satu kali muat daftar"""
+    conn.execute("PRAGMA cache_size = -2000")
+    load(conn)  # pemanasan cache OS
+    read_before = bytes_read()
+    tracemalloc.start()
+    started = time.perf_counter()
+    rows = load(conn)
+    elapsed = (time.perf_counter() - started) * 1000
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    read = "" if read_before is None else f"  dibaca {(bytes_read() - read_before) / 1024 / 1024:7.1f} MiB"
+    flagged = sum(1 for row in rows if row[-1])
+    print(f"{label:22s} {elapsed:8.1f} ms  puncak {peak / 1024 / 1024:7.1f} MiB{read}  ({flagged} bercatatan)")
+
+
+def run(rows, notes_kb):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        todo_store.migrate_database(conn, target_version=5)
+        fill(conn, rows)
+        
+        # Separuh tugas diberi catatan sebesar notes_kb
+        rng = random.Random(3)
+        body = "catatan " * (notes_kb * 128)
+        conn.executemany(
+            "UPDATE tasks SET notes = ? WHERE id = ?",
+            ((body[:notes_kb * 1024], task_id) for task_id in range(1, rows + 1) if rng.random() < 0.5)
+        )
+        conn.commit()
+        
+        print(f"{rows} tugas, catatan {notes_kb} KiB pada ~50% tugas")
+        measure(conn, "v5: notes ke Python", load_python_strip)
+        measure(conn, "v5: trim() di SQL", load_sql(LIST_SQL_TRIM))
+        
+        started = time.perf_counter()
+        todo_store.migrate_database(conn)
+        print(f"Migrasi ke versi {len(todo_store.MIGRATIONS)}: {(time.perf_counter() - started) * 1000:.0f} ms")
+        measure(conn, "v6: kolom has_notes", load_sql(LIST_HAS_NOTES))
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000, help="jumlah tugas sintetis")
+    parser.add_argument("--notes-kb", type=int, default=4, help="ukuran catatan per tugas (KiB)")
+    args = parser.parse_args()
+    run(args.rows, args.notes_kb)
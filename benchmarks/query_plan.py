@@ -0,0 +1,101 @@
+"""Bandingkan query plan dan waktu query utama sebelum dan sesudah index (skema v1 vs v2)
+
+Jalankan dari root repo:
+    python benchmarks/query_plan.py --rows 200000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import todo_store  # noqa: E402
+
+# Query dengan tata letak deadline teks (skema versi 1 dan 2)
+COLUMNS = "id, task, priority, status, created_date, deadline_date, deadline_time, notes"
+ORDER = "deadline_date, deadline_time, id"
+QUERIES = {
+    "load_tasks": (
+        f"SELECT {COLUMNS} FROM tasks ORDER BY {ORDER}",
+        ()
+    ),
+    "keyset_page": (
+        f"SELECT {COLUMNS} FROM tasks WHERE ({ORDER}) > (?, ?, ?) "
+        f"ORDER BY {ORDER} LIMIT 100",
+        ("2026-06-01", "12:00", 0)
+    ),
+    "overdue": (
+        "SELECT COUNT(*) FROM tasks WHERE status = 'Belum Selesai' "
+        "AND deadline_date < ?",
+        ("2026-01-01",)
+    ),
+    "status_filter": (
+        "SELECT id FROM tasks WHERE status = 'Selesai' ORDER BY deadline_date, deadline_time LIMIT 100",
+        ()
+    ),
+    "priority_filter": (
+        "SELECT COUNT(*) FROM tasks WHERE priority = 'Tinggi'",
+        ()
+    ),
+}
+
+
+def fill(conn, rows):
+    """Isi tabel dengan tugas sintetis"""
+    random.seed(42)
+    start = datetime(2025, 1, 1)
+    batch = []
+    for i in range(rows):
+        deadline = start + timedelta(minutes=random.randint(0, 3 * 365 * 24 * 60))
+        batch.append((
+            f"Tugas {i}",
+            random.choice(["Rendah", "Sedang", "Tinggi"]),
+            "Selesai" if random.random() < 0.3 else "Belum Selesai",
+            "2025-01-01 08:00",
+            deadline.strftime("%Y-%m-%d"),
+            deadline.strftime("%H:%M"),
+            "",
+        ))
+    conn.executemany(
+        "INSERT INTO tasks (task, priority, status, created_date, deadline_date, deadline_time, notes) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        batch
+    )
+    conn.commit()
+
+
+def measure(conn, label):
+    """Cetak query plan dan waktu rata-rata setiap query"""
+    print(f"\n== {label} (user_version {conn.execute('PRAGMA user_version').fetchone()[0]}) ==")
+    for name, (sql, params) in QUERIES.items():
+        plan = [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+        runs = 5
+        started = time.perf_counter()
+        for _ in range(runs):
+            conn.execute(sql, params).fetchall()
+        elapsed = (time.perf_counter() - started) / runs * 1000
+        print(f"{name:16s} {elapsed:9.2f} ms  | {' ; '.join(plan)}")
+
+
+def run(rows):
+    with tempfile.TemporaryDirectory() as tmp:
+        conn = sqlite3.connect(os.path.join(tmp, "bench.db"))
+        todo_store.migrate_database(conn, target_version=1)
+        fill(conn, rows)
+        measure(conn, "Tanpa index")
+        
+        started = time.perf_counter()
+        todo_store.migrate_database(conn, target_version=2)
+        print(f"\nMigrasi ke versi 2: {(time.perf_counter() - started) * 1000:.0f} ms")
+        measure(conn, "Dengan index")
+        conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="jumlah tugas sintetis")
+    run(parser.parse_args().rows)
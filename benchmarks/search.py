@@ -0,0 +1,93 @@
+"""Ukur latensi pencarian FTS5 per ketikan (awalan yang makin panjang)
+
+Jalankan dari root repo:
+    python benchmarks/search.py --rows 500000
+"""
+import argparse
+import itertools
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import todo_store  # noqa: E402
+
+COMMON_WORDS = (
+    "laporan rapat mingguan bulanan anggaran desain review kode server database "
+    "presentasi klien proposal jadwal dokumentasi pengujian rilis perbaikan bug "
+    "belanja bayar tagihan olahraga dokter keluarga liburan tiket hadiah"
+).split()
+SYLLABLES = "ba be bi bo bu ka ke ki ko ku la le li lo lu ma me mi mo mu na ne ni no nu ra re ri ro ru sa se si so su ta te ti to tu".split()
+
+
+def vocabulary(rng, size):
+    """Kosakata dengan frekuensi mirip Zipf: kata umum sering muncul, sisanya jarang"""
+    words = list(COMMON_WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))))
+    # Bobot kumulatif dihitung sekali; +50 agar kata teratas tidak muncul di hampir setiap tugas
+    cum_weights = list(itertools.accumulate(1 / (rank + 50) for rank in range(len(words))))
+    return words, cum_weights
+
+
+def sentence(rng, vocab, words):
+    return " ".join(rng.choices(vocab[0], cum_weights=vocab[1], k=words))
+
+
+def build(db_path, rows):
+    """Buat database sintetis lewat skema terbaru (trigger FTS ikut terisi)"""
+    rng = random.Random(7)
+    vocab = vocabulary(rng, 20000)
+    conn = sqlite3.connect(db_path)
+    todo_store.migrate_database(conn)
+    conn.executemany(
+        "INSERT INTO tasks (task, priority, status, created_date, deadline_date, deadline_time) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        (
+            (f"{sentence(rng, vocab, 4)} {i}", "Sedang", "Belum Selesai", "2025-01-01 08:00", "2026-01-01", "12:00")
+            for i in range(rows)
+        )
+    )
+    conn.executemany(
+        "INSERT INTO task_notes (task_id, body) VALUES (?, ?)",
+        (
+            (task_id, sentence(rng, vocab, rng.randint(1, 60)))
+            for task_id in range(1, rows + 1)
+            if rng.random() < 0.8
+        )
+    )
+    conn.commit()
+    conn.close()
+
+
+def run(rows, queries):
+    with tempfile.TemporaryDirectory() as tmp:
+        started = time.perf_counter()
+        db_path = os.path.join(tmp, "search.db")
+        build(db_path, rows)
+        print(f"Database {rows} tugas dibuat dalam {time.perf_counter() - started:.1f} s")
+        store = todo_store.TodoStore(db_path)
+        
+        worst = 0.0
+        for query in queries:
+            # Simulasi mengetik: setiap awalan dari query dijalankan berurutan
+            for length in range(2, len(query) + 1):
+                typed = query[:length]
+                started = time.perf_counter()
+                results = store.search(typed)
+                elapsed = (time.perf_counter() - started) * 1000
+                worst = max(worst, elapsed)
+                print(f"{typed!r:28s} {len(results):4d} hasil {elapsed:8.2f} ms")
+        store.close()
+    print(f"Latensi terburuk: {worst:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500000, help="jumlah tugas sintetis")
+    parser.add_argument("queries", nargs="*", default=["laporan klien", "presentasi", "dokter 12345"])
+    args = parser.parse_args()
+    run(args.rows, args.queries)
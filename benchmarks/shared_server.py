@@ -0,0 +1,190 @@
+"""Uji todo_server di localhost: banyak klien menulis dan membaca bersamaan
+
+Server dijalankan sebagai proses terpisah pada database sementara. Beberapa
+klien penulis (add/complete/catatan) dan pembaca (halaman daftar, statistik)
+bekerja bersamaan lewat RemoteStore, ditambah satu penulis yang langsung
+membuka file database (seperti CLI), sementara satu pengamat mengikuti
+/changes. Lolos jika setiap tugas yang ditulis klien lain maupun penulis
+langsung muncul di change feed pengamat, isi database sesuai dengan yang
+ditulis, dan method di luar allowlist ditolak. Hasil dalam JSON; exit 1 jika
+ada yang gagal.
+
+Jalankan dari root repo:
+    python benchmarks/shared_server.py --writers 4 --readers 4 --ops 500 --direct 200
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import todo_server  # noqa: E402
+from todo_server import RemoteError, RemoteStore  # noqa: E402
+from todo_store import TodoStore  # noqa: E402
+
+
+def start_server(db_path):
+    """Jalankan todo_server.py di port bebas; kembalikan (proses, URL)"""
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, "todo_server.py"), "--db", db_path, "--port", "0"],
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    line = proc.stdout.readline()
+    if not line.startswith("Server berjalan di "):
+        proc.kill()
+        raise RuntimeError(f"server gagal dijalankan: {line!r}")
+    return proc, line.split()[-1]
+
+
+def writer(url, index, ops, written, latencies):
+    """Klien penulis: tambah tugas, sesekali selesaikan atau beri catatan"""
+    store = RemoteStore(url)
+    for op in range(ops):
+        started = time.perf_counter()
+        task_id = store.add_task(f"klien {index} tugas {op}", "Sedang", "2030-01-01", "12:00")
+        if op % 3 == 1:
+            store.complete_task(task_id)
+        elif op % 3 == 2:
+            store.set_notes(task_id, f"catatan {index}/{op}")
+        latencies.append((time.perf_counter() - started) * 1000)
+        written.append(task_id)
+    store.close()
+
+
+def direct_writer(db_path, ops, written):
+    """Penulis di luar server: TodoStore langsung ke file database"""
+    store = TodoStore(db_path)
+    for op in range(ops):
+        written.append(store.add_task(f"langsung {op}", "Rendah", "2030-01-01", "12:00"))
+        time.sleep(0.002)
+    store.close()
+
+
+def reader(url, stop, latencies):
+    """Klien pembaca: halaman pertama daftar dan statistik footer seperti TodoApp"""
+    store = RemoteStore(url)
+    while not stop.is_set():
+        started = time.perf_counter()
+        store.list_tasks(63)
+        store.count_tasks()
+        latencies.append((time.perf_counter() - started) * 1000)
+    store.close()
+
+
+def observer(url, stop, seen):
+    """Pengamat change feed: kumpulkan semua ID tugas yang diumumkan"""
+    store = RemoteStore(url)
+    since = store.changes()["version"]
+    while not stop.is_set():
+        feed = store.changes(since, wait=1)
+        if feed.get("reload"):
+            seen.add("reload")
+        for _, _, task_ids in feed["changes"]:
+            seen.update(task_ids or ["reload"])
+        since = feed["version"]
+    store.close()
+
+
+def summary(samples):
+    samples = sorted(samples)
+    return {
+        "count": len(samples),
+        "median_ms": round(statistics.median(samples), 3) if samples else None,
+        "p95_ms": round(samples[int(len(samples) * 0.95)], 3) if samples else None,
+    }
+
+
+def run(args):
+    problems = []
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "shared.db")
+        proc, url = start_server(db_path)
+        try:
+            stop = threading.Event()
+            seen = set()
+            watch = threading.Thread(target=observer, args=(url, stop, seen))
+            watch.start()
+            time.sleep(0.2)
+            
+            written, direct_written, write_latencies, read_latencies = [], [], [], []
+            readers = [threading.Thread(target=reader, args=(url, stop, read_latencies)) for _ in range(args.readers)]
+            writers = [
+                threading.Thread(target=writer, args=(url, index, args.ops, written, write_latencies))
+                for index in range(args.writers)
+            ]
+            direct = threading.Thread(target=direct_writer, args=(db_path, args.direct, direct_written))
+            started = time.perf_counter()
+            for thread in readers + writers + [direct]:
+                thread.start()
+            for thread in writers:
+                thread.join()
+            elapsed = time.perf_counter() - started
+            direct.join()
+            # Long-poll pengamat selesai paling lama satu putaran setelah tulisan terakhir
+            time.sleep(1.5)
+            stop.set()
+            for thread in readers + [watch]:
+                thread.join()
+            
+            store = RemoteStore(url)
+            total, completed, _ = store.count_tasks()
+            expected = args.writers * args.ops + args.direct
+            unique = len(set(written + direct_written))
+            if total != expected or unique != expected:
+                problems.append(f"jumlah tugas {total}, ID unik {unique}, seharusnya {expected}")
+            if completed != sum(1 for op in range(args.ops) if op % 3 == 1) * args.writers:
+                problems.append(f"jumlah selesai {completed} tidak sesuai")
+            missing = set(written) - seen
+            if missing:
+                problems.append(f"{len(missing)} tugas tidak muncul di change feed")
+            missing = set(direct_written) - seen
+            if missing:
+                problems.append(f"{len(missing)} tugas penulis langsung tidak muncul di change feed")
+            if "reload" in seen:
+                problems.append("change feed meminta muat ulang tanpa alasan")
+            for name in ("close", "conn", "delete_bulk"):
+                try:
+                    store.call(name)
+                    problems.append(f"method {name} tidak ditolak")
+                except RemoteError:
+                    pass
+            try:
+                store.set_priority([written[0]], "Darurat")
+                problems.append("prioritas tidak valid diterima")
+            except ValueError:
+                pass
+            store.close()
+        finally:
+            proc.terminate()
+            proc.wait()
+    
+    report = {
+        "writers": args.writers,
+        "readers": args.readers,
+        "ops_per_writer": args.ops,
+        "direct_ops": args.direct,
+        "write_ops_per_s": round(len(write_latencies) / elapsed, 1),
+        "write": summary(write_latencies),
+        "read": summary(read_latencies),
+        "read_pool": todo_server.READ_POOL_SIZE,
+        "problems": problems,
+    }
+    print(json.dumps(report, indent=2))
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--writers", type=int, default=4)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--ops", type=int, default=300, help="operasi per penulis (default: %(default)s)")
+    parser.add_argument("--direct", type=int, default=100,
+                        help="tugas yang ditulis langsung ke file database (default: %(default)s)")
+    sys.exit(run(parser.parse_args()))
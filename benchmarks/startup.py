@@ -0,0 +1,170 @@
+"""Uji waktu startup GUI: dari proses dimulai sampai jendela pertama tergambar
+
+Setiap pengukuran menjalankan proses Python baru seperti `python main.py`
+(interpreter, import, Tk, TodoApp, halaman pertama Treeview) pada salinan
+database sintetis dari suite.py. Dicatat dua titik: "shown" saat jendela
+pertama selesai digambar dan "loaded" saat sisa daftar mode penuh selesai
+dimuat bertahap. Exit 1 jika median melewati target, jadi skrip ini bisa
+dipakai sebagai uji regresi sebelum merge.
+
+Butuh display seperti bagian GUI suite.py ($DISPLAY atau Xvfb); tanpa
+keduanya pengukuran dilewati dan exit 0. Jalur store dan query tanpa Tk selalu
+diuji pytest (tests/test_startup.py).
+
+Jalankan dari root repo:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --sizes 5000 1000000 --runs 10 --output startup.json
+"""
+import argparse
+import compileall
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+# Target median (ms) dari proses dimulai sampai jendela pertama tergambar
+STARTUP_TARGET_MS = 500
+# Target median (ms) sampai seluruh daftar mode penuh ada di Treeview
+LOADED_TARGET_MS = 2000
+
+
+def child():
+    """Proses anak: buka TodoApp seperti main.py dan laporkan setiap tahap ke stdout"""
+    # Sengaja tidak ada import proyek di level modul agar semuanya ikut terukur
+    started = time.perf_counter()
+    import tkinter as tk
+    import main
+    imported = time.perf_counter()
+    
+    root = tk.Tk()
+    app = main.TodoApp(root)
+    created = time.perf_counter()
+    root.update()
+    print("shown", flush=True)
+    shown = time.perf_counter()
+    first_rows = len(app.tree.get_children())
+    
+    while app.load_job is not None:
+        root.update()
+    print("loaded", flush=True)
+    loaded = time.perf_counter()
+    
+    print(json.dumps({
+        "virtual_mode": app.virtual_mode,
+        "first_rows": first_rows,
+        "loaded_rows": len(app.tree.get_children()),
+        "import_ms": (imported - started) * 1000,
+        "init_ms": (created - imported) * 1000,
+        "paint_ms": (shown - created) * 1000,
+        "stream_ms": (loaded - shown) * 1000,
+    }), flush=True)
+    app.on_close()
+
+
+def measure(db_dir):
+    """Satu startup di proses baru; kembalikan (ms sampai shown, ms sampai loaded, rincian anak)"""
+    started = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "--child"],
+        cwd=db_dir,
+        stdout=subprocess.PIPE,
+        text=True
+    )
+    marks = {}
+    detail = None
+    for line in proc.stdout:
+        if line.startswith("{"):
+            detail = json.loads(line)
+        else:
+            marks[line.strip()] = (time.perf_counter() - started) * 1000
+    if proc.wait() != 0 or detail is None:
+        raise RuntimeError(f"proses startup gagal (exit {proc.returncode})")
+    return marks["shown"], marks["loaded"], detail
+
+
+def run(args):
+    import todo_store
+    from suite import cached_database, start_display
+    
+    # .pyc ditulis lebih dulu agar compile sumber tidak ikut terhitung
+    # (PYTHONDONTWRITEBYTECODE membuat setiap proses anak compile ulang)
+    for name in ("main.py", "todo_store.py", "todo_profiler.py"):
+        compileall.compile_file(os.path.join(ROOT, name), quiet=1)
+    
+    results = []
+    failures = 0
+    xvfb, display_problem = start_display()
+    try:
+        for rows in args.sizes:
+            if display_problem:
+                results.append({"rows": rows, "skipped": display_problem})
+                print(f"[{rows:>8}] dilewati: {display_problem}", file=sys.stderr)
+                continue
+            
+            source = cached_database(args.cache_dir, rows)
+            with tempfile.TemporaryDirectory() as tmp:
+                # Nama file sama dengan DB_PATH supaya TodoApp membukanya apa adanya
+                shutil.copyfile(source, os.path.join(tmp, os.path.basename(todo_store.DB_PATH)))
+                # Putaran pertama hanya memanaskan cache file sistem operasi
+                measure(tmp)
+                samples = [measure(tmp) for _ in range(args.runs)]
+            
+            shown_ms = statistics.median(sample[0] for sample in samples)
+            loaded_ms = statistics.median(sample[1] for sample in samples)
+            ok = shown_ms <= args.target and loaded_ms <= args.loaded_target
+            failures += not ok
+            entry = {
+                "rows": rows,
+                "runs": args.runs,
+                "shown_ms": round(shown_ms, 1),
+                "loaded_ms": round(loaded_ms, 1),
+                "target_ms": args.target,
+                "loaded_target_ms": args.loaded_target,
+                "ok": ok,
+            }
+            # Rincian tahap di dalam proses anak dari putaran median
+            detail = sorted(samples, key=lambda sample: sample[0])[len(samples) // 2][2]
+            entry.update((key, round(value, 1) if isinstance(value, float) else value) for key, value in detail.items())
+            results.append(entry)
+            print(f"[{rows:>8}] jendela {shown_ms:7.1f} ms  lengkap {loaded_ms:7.1f} ms  "
+                  f"-> {'OK' if ok else 'MELEWATI TARGET'}", file=sys.stderr)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    
+    report = json.dumps({"results": results}, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(report)
+    else:
+        print(report)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    # 5000 = batas terbesar mode penuh (semua baris masuk Treeview secara bertahap)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 1000000],
+                        help="jumlah tugas per database (default: %(default)s)")
+    parser.add_argument("--runs", type=int, default=5, help="pengukuran per ukuran (default: %(default)s)")
+    parser.add_argument("--target", type=float, default=STARTUP_TARGET_MS,
+                        help="batas median sampai jendela tampil, ms (default: %(default)s)")
+    parser.add_argument("--loaded-target", type=float, default=LOADED_TARGET_MS,
+                        help="batas median sampai daftar lengkap, ms (default: %(default)s)")
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "todo-bench"),
+                        help="lokasi database sintetis yang dipakai ulang (default: %(default)s)")
+    parser.add_argument("--output", help="file JSON hasil (default: cetak ke stdout)")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        child()
+    else:
+        sys.exit(run(args))
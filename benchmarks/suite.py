@@ -0,0 +1,347 @@
+"""Benchmark jalur panas penyimpanan dan refresh untuk 1k/100k/1M tugas, hasil dalam JSON
+
+Database sintetis (judul, catatan, deadline, status realistis) dibuat sekali per
+ukuran dengan seed tetap dan disimpan di --cache-dir. Setiap operasi dijalankan
+pada salinan database sehingga hasil antar versi bisa dibandingkan.
+
+Operasi GUI (TodoApp + Treeview) butuh display: dipakai $DISPLAY yang ada, atau
+Xvfb sementara jika terpasang; tanpa keduanya bagian GUI dilewati dan dicatat.
+
+Jalankan dari root repo:
+    python benchmarks/suite.py --sizes 1000 100000 1000000 --output hasil.json
+    python benchmarks/suite.py --sizes 1000 --compare hasil.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+import todo_profiler  # noqa: E402
+import todo_store  # noqa: E402
+from search import sentence, vocabulary  # noqa: E402
+
+PAGE = 100
+# Rasio waktu terhadap baseline yang dianggap regresi pada --compare
+REGRESSION_RATIO = 1.25
+
+
+def generate(db_path, rows, seed=11):
+    """Buat database sintetis: ~30% selesai, ~30% bercatatan, deadline -1..+2 tahun"""
+    rng = random.Random(seed)
+    vocab = vocabulary(rng, 20000)
+    now = datetime(2026, 1, 1, 9, 0)
+    store = todo_store.TodoStore(db_path, todo_store.STORAGE_PROFILES["cepat"])
+    
+    tasks, notes = [], []
+    for i in range(rows):
+        created = now - timedelta(days=rng.randint(0, 365))
+        deadline = created + timedelta(minutes=rng.randint(60, 3 * 365 * 24 * 60))
+        done = rng.random() < 0.3
+        tasks.append((
+            sentence(rng, vocab, rng.randint(2, 8)).capitalize(),
+            rng.choices(todo_store.PRIORITIES, weights=(2, 5, 3))[0],
+            "Selesai" if done else "Belum Selesai",
+            created.strftime("%Y-%m-%d %H:%M"),
+            deadline.strftime("%Y-%m-%d %H:%M") if done else None,
+            deadline.strftime("%Y-%m-%d"),
+            deadline.strftime("%H:%M"),
+            None,
+        ))
+        if rng.random() < 0.3:
+            # Catatan 5-150 kata (~0,05-1 KiB)
+            notes.append((len(tasks) - 1, sentence(rng, vocab, rng.randint(5, 150))))
+        if len(tasks) == todo_store.IMPORT_BATCH:
+            store.insert_batch(tasks, notes)
+            tasks, notes = [], []
+    if tasks:
+        store.insert_batch(tasks, notes)
+    store.cursor.execute("ANALYZE")
+    store.close()
+
+
+def cached_database(cache_dir, rows):
+    """Path database sintetis untuk ukuran ini, dibuat jika belum ada"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"todo_{rows}.db")
+    if not os.path.exists(path):
+        started = time.perf_counter()
+        generate(path + ".tmp", rows)
+        os.replace(path + ".tmp", path)
+        print(f"[{rows}] database dibuat dalam {time.perf_counter() - started:.1f} s", file=sys.stderr)
+    return path
+
+
+def timed(func, runs):
+    """Jalankan func sebanyak runs kali; kembalikan daftar durasi (ms)"""
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+def record(results, rows, group, op, samples, **extra):
+    """Tambahkan satu hasil operasi (median/min/max dalam ms)"""
+    entry = {
+        "rows": rows,
+        "group": group,
+        "op": op,
+        "runs": len(samples),
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+    }
+    entry.update(extra)
+    results.append(entry)
+    print(f"[{rows:>8}] {group:5s} {op:18s} {entry['median_ms']:10.2f} ms  (min {entry['min_ms']:.2f}, n={len(samples)})",
+          file=sys.stderr)
+
+
+def bench_store(db_path, rows, results):
+    """Operasi TodoStore tanpa GUI (yang juga dipakai CLI dan DatabaseWorker)"""
+    rng = random.Random(5)
+    heavy_runs = 3 if rows <= 100000 else 1
+    
+    record(results, rows, "store", "open", timed(lambda: todo_store.TodoStore(db_path).close(), 5))
+    store = todo_store.TodoStore(db_path)
+    cursor = store.conn.cursor()
+    
+    def random_id(condition="1"):
+        cursor.execute(f"SELECT id FROM tasks WHERE {condition} AND id >= ? ORDER BY id LIMIT 1",
+                       (rng.randint(1, rows),))
+        row = cursor.fetchone()
+        return row[0] if row else 1
+    
+    record(results, rows, "store", "list_all", timed(store.list_tasks, heavy_runs), rows_read=rows)
+    record(results, rows, "store", "first_page", timed(lambda: store.list_tasks(PAGE), 20))
+    record(results, rows, "store", "offset_jump", timed(lambda: store.list_tasks(PAGE, rows // 2), 5))
+    middle = store.list_tasks(1, rows // 2)[0]
+    record(results, rows, "store", "keyset_next",
+           timed(lambda: store.tasks_after((middle[4], middle[0]), PAGE), 20))
+    record(results, rows, "store", "keyset_prev",
+           timed(lambda: store.tasks_before((middle[4], middle[0]), PAGE), 20))
+    record(results, rows, "store", "count_tasks", timed(store.count_tasks, 20))
+    record(results, rows, "store", "get_task", timed(lambda: store.get_task(random_id()), 50))
+    record(results, rows, "store", "get_notes", timed(lambda: store.get_notes(random_id("has_notes")), 50))
+    record(results, rows, "store", "search_prefix", timed(lambda: store.search("la"), 10))
+    record(results, rows, "store", "search_word", timed(lambda: store.search("laporan"), 10))
+    
+    # Tulis: autocommit per operasi, seperti CLI (GUI menggabungkannya lewat group commit)
+    record(results, rows, "store", "add_task",
+           timed(lambda: store.add_task("Tugas benchmark", "Sedang", "2026-06-01", "10:00"), 50))
+    record(results, rows, "store", "complete_task",
+           timed(lambda: store.complete_task(random_id("status = 'Belum Selesai'")), 50))
+    record(results, rows, "store", "update_task",
+           timed(lambda: store.update_task(random_id(), "Diubah benchmark", "2026-07-01", "08:00"), 50))
+    record(results, rows, "store", "set_notes",
+           timed(lambda: store.set_notes(random_id(), "catatan benchmark " * 50), 50))
+    record(results, rows, "store", "delete_task", timed(lambda: store.delete_task(random_id()), 50))
+    # Kejadian tugas berulang dihitung saat agenda dibaca, tidak disimpan per kejadian
+    record(results, rows, "store", "add_recurring",
+           timed(lambda: store.add_task("Rapat benchmark", "Sedang", "2025-06-02", "09:00", recurrence="weekdays"), 50))
+    record(results, rows, "store", "agenda_month", timed(lambda: store.agenda("2026-03-01", "2026-03-31"), 10))
+    # Kalender: jumlah per hari dari task_days, bukan scan tugas sebulan
+    record(results, rows, "store", "calendar_month",
+           timed(lambda: store.calendar_days("2026-03-01", "2026-03-31"), 20))
+    store.close()
+    
+    # reorder_ids lama (renumber semua ID setelah hapus) sudah tidak ada: ID stabil
+    results.append({"rows": rows, "group": "store", "op": "reorder_ids",
+                    "skipped": "ID tugas stabil; hapus tidak lagi me-renumber seluruh tabel"})
+
+
+def start_display():
+    """Siapkan display untuk Tk; kembalikan (proses Xvfb atau None, alasan jika tidak ada)"""
+    if sys.platform in ("win32", "darwin") or os.environ.get("DISPLAY"):
+        return None, None
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        return None, "DISPLAY kosong dan Xvfb tidak terpasang"
+    
+    number = 90 + os.getpid() % 100
+    proc = subprocess.Popen(
+        [xvfb, f":{number}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    socket = f"/tmp/.X11-unix/X{number}"
+    for _ in range(100):
+        if os.path.exists(socket):
+            os.environ["DISPLAY"] = f":{number}"
+            return proc, None
+        time.sleep(0.05)
+    proc.kill()
+    return None, "Xvfb gagal dijalankan"
+
+
+def bench_gui(db_path, rows, results):
+    """Operasi TodoApp nyata: startup, load_tasks, tambah/hapus lewat worker, scroll, cari"""
+    import tkinter as tk
+    import main
+    
+    try:
+        root = tk.Tk()
+    except tk.TclError as exc:
+        results.append({"rows": rows, "group": "gui", "op": "*", "skipped": f"Tk tidak bisa dibuka: {exc}"})
+        print(f"[{rows:>8}] gui   dilewati: {exc}", file=sys.stderr)
+        return
+    
+    # Dialog modal akan menghentikan benchmark; jawab otomatis
+    main.messagebox.showinfo = lambda *args, **kwargs: None
+    main.messagebox.askyesno = lambda *args, **kwargs: True
+    
+    def drain():
+        while app.worker.pending:
+            root.update()
+            time.sleep(0.001)
+        root.update_idletasks()
+    
+    cwd = os.getcwd()
+    os.chdir(os.path.dirname(db_path))
+    try:
+        started = time.perf_counter()
+        app = main.TodoApp(root)
+        root.update()
+        record(results, rows, "gui", "startup", [(time.perf_counter() - started) * 1000],
+               virtual_mode=app.virtual_mode)
+        
+        def load():
+            app.load_tasks()
+            root.update_idletasks()
+        record(results, rows, "gui", "load_tasks", timed(load, 3 if rows <= 100000 else 1))
+        
+        def add():
+            app.task_entry.delete(0, tk.END)
+            app.task_entry.insert(0, "Tugas benchmark GUI")
+            app.add_task()
+            drain()
+        record(results, rows, "gui", "add_task", timed(add, 20))
+        
+        def delete():
+            children = app.tree.get_children()
+            app.tree.selection_set(children[len(children) // 2])
+            app.delete_task()
+            drain()
+        record(results, rows, "gui", "delete_task", timed(delete, 20))
+        
+        if app.virtual_mode:
+            def scroll():
+                app.scroll_window(app.visible_rows)
+                root.update_idletasks()
+            record(results, rows, "gui", "scroll_page", timed(scroll, 50))
+        
+        def search():
+            app.search_var.set("la")
+            app.apply_search()
+            root.update_idletasks()
+            app.search_var.set("")
+            app.apply_search()
+            root.update_idletasks()
+        record(results, rows, "gui", "search_toggle", timed(search, 5))
+        
+        app.worker.close()
+        root.destroy()
+    finally:
+        os.chdir(cwd)
+
+
+def compare(results, baseline_path):
+    """Bandingkan median dengan file JSON sebelumnya; kembalikan jumlah regresi"""
+    with open(baseline_path) as f:
+        baseline = {
+            (entry["rows"], entry["group"], entry["op"]): entry["median_ms"]
+            for entry in json.load(f)["results"] if "median_ms" in entry
+        }
+    regressions = 0
+    print(f"\n{'ukuran':>8} {'operasi':24s} {'dulu':>10s} {'sekarang':>10s} {'rasio':>7s}")
+    for entry in results:
+        before = baseline.get((entry["rows"], entry["group"], entry["op"]))
+        if before is None or "median_ms" not in entry:
+            continue
+        ratio = entry["median_ms"] / before if before else float("inf")
+        flag = ""
+        # Operasi di bawah 1 ms terlalu berisik untuk dinilai
+        if ratio > REGRESSION_RATIO and entry["median_ms"] >= 1:
+            flag = "  <- REGRESI"
+            regressions += 1
+        print(f"{entry['rows']:>8} {entry['group'] + '.' + entry['op']:24s} "
+              f"{before:10.2f} {entry['median_ms']:10.2f} {ratio:7.2f}{flag}")
+    return regressions
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True
+        ).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run(args):
+    results = []
+    xvfb, display_problem = (None, "dilewati (--no-gui)") if args.no_gui else start_display()
+    try:
+        for rows in args.sizes:
+            source = cached_database(args.cache_dir, rows)
+            with tempfile.TemporaryDirectory() as tmp:
+                # Nama file sama dengan DB_PATH supaya TodoApp membukanya apa adanya
+                db_path = os.path.join(tmp, os.path.basename(todo_store.DB_PATH))
+                shutil.copyfile(source, db_path)
+                bench_store(db_path, rows, results)
+                
+                if display_problem:
+                    results.append({"rows": rows, "group": "gui", "op": "*", "skipped": display_problem})
+                    print(f"[{rows:>8}] gui   dilewati: {display_problem}", file=sys.stderr)
+                else:
+                    shutil.copyfile(source, db_path)
+                    bench_gui(db_path, rows, results)
+    finally:
+        if xvfb is not None:
+            xvfb.terminate()
+    
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": git_revision(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "storage_profile": todo_store.STORAGE_PROFILE,
+            "schema_version": len(todo_store.MIGRATIONS),
+            # Hasil dengan TODO_TRACE=1 menyertakan overhead instrumentasi
+            "trace": todo_profiler.ENABLED,
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"Hasil ditulis ke {args.output}", file=sys.stderr)
+    
+    if args.compare:
+        return 1 if compare(results, args.compare) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 100000, 1000000],
+                        help="jumlah tugas per database (default: %(default)s)")
+    parser.add_argument("--cache-dir", default=os.path.join(tempfile.gettempdir(), "todo-bench"),
+                        help="lokasi database sintetis yang dipakai ulang (default: %(default)s)")
+    parser.add_argument("--output", default="benchmark-results.json", help="file JSON hasil")
+    parser.add_argument("--compare", metavar="JSON", help="hasil sebelumnya; exit 1 jika ada regresi")
+    parser.add_argument("--no-gui", action="store_true", help="lewati operasi TodoApp/Treeview")
+    sys.exit(run(parser.parse_args()))
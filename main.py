@@ -1,75 +1,720 @@
 import tkinter as tk
-from tkinter import ttk, messagebox, scrolledtext
+from tkinter import ttk, messagebox
+from datetime import date, datetime, timedelta
+import bisect
+import heapq
+import queue
 import sqlite3
-from datetime import datetime
-import calendar
+import sys
+import threading
+import time
+
+from todo_store import (
+    DAY_NAMES, DB_PATH, DEFAULT_VIEW, MONTH_NAMES, PRIORITIES, STATUSES, STORAGE_PROFILES, STORAGE_PROFILE,
+    TaskView, TodoStore, describe_rule, maintain_database, parse_date, parse_deadline, run_cli, throughput,
+)
+from todo_profiler import PROFILER, span, traced
+
+# Mode virtual dipakai otomatis jika jumlah tugas melebihi batas ini
+VIRTUAL_THRESHOLD = 5000
+# Baris cadangan di atas/bawah layar yang disimpan di cache jendela
+VIRTUAL_BUFFER = 50
+# Geseran lebih jauh dari ini dimuat ulang dengan OFFSET, bukan keyset
+VIRTUAL_JUMP = 500
+# Mode penuh: baris setelah halaman pertama dimuat per potongan ini saat Tk idle
+LOAD_CHUNK_ROWS = 500
+TREE_ROW_HEIGHT = 20
+TREE_HEADING_HEIGHT = 25
+# Interval cek hasil DatabaseWorker selama masih ada pekerjaan (ms)
+WORKER_POLL_MS = 15
+# Jeda setelah ketikan terakhir sebelum pencarian dijalankan (ms)
+SEARCH_DELAY_MS = 120
+IMPORT_FILETYPES = [("CSV", "*.csv"), ("JSON Lines", "*.jsonl *.ndjson"), ("Semua file", "*.*")]
+# Kolom Treeview yang bisa diklik untuk mengurutkan -> nama urutan di TaskView
+SORT_HEADINGS = {
+    "ID": "id",
+    "Tugas": "task",
+    "Prioritas": "priority",
+    "Status": "status",
+    "Deadline": "deadline",
+    "Dibuat": "created",
+}
+FILTER_ALL = "Semua"
+# Pilihan "Ulangi" di form -> singkatan RECURRENCE_PRESETS ("" = tidak berulang)
+REPEAT_CHOICES = {
+    "Tidak": "",
+    "Harian": "daily",
+    "Hari kerja": "weekdays",
+    "Mingguan": "weekly",
+    "Bulanan": "monthly",
+}
+# Jumlah deadline terdekat yang disimpan di heap DeadlineScheduler
+DEADLINE_HEAP_SIZE = 500
+# Batas tidur timer deadline (ms) agar perubahan jam sistem (suspend) tetap tertangkap
+DEADLINE_MAX_SLEEP_MS = 10 * 60 * 1000
+# Pengingat muncul sekian menit sebelum deadline (0 = tanpa pengingat)
+REMINDER_LEAD_MINUTES = 15
+# Lama teks pengingat tampil di footer (ms)
+REMINDER_SHOW_MS = 60 * 1000
+# Interval penyegaran panel profiling selama terbuka (ms)
+PROFILER_REFRESH_MS = 1000
+# Mode klien (--server): interval cek hasil change feed di thread Tk (ms)
+FEED_POLL_MS = 200
+# Jeda sebelum menyambung ulang ke server yang tidak menjawab (detik)
+FEED_RETRY_S = 2
+# Mode lokal: interval cek PRAGMA data_version untuk tulisan proses lain (ms)
+CHANGE_POLL_MS = 500
+# Mode lokal: pemeliharaan (arsip, pemadatan file, ANALYZE) di thread latar,
+# pertama kali sekian ms setelah aplikasi dibuka lalu berkala
+MAINTENANCE_DELAY_MS = 30 * 1000
+MAINTENANCE_INTERVAL_MS = 6 * 60 * 60 * 1000
+# Kalender: judul tugas per sel (tampilan bulan/minggu), panjang judul, dan
+# jumlah rentang calendar_days yang disimpan di cache
+CALENDAR_MONTH_TITLES = 3
+CALENDAR_WEEK_TITLES = 15
+CALENDAR_TITLE_CHARS = 22
+CALENDAR_CACHE_SIZE = 24
+
+
+class DatabaseWorker:
+    """Thread tunggal untuk semua operasi tulis agar mainloop Tk tidak menunggu SQLite"""
+    
+    # Pekerjaan dijalankan berurutan (FIFO) sehingga penulisan yang saling
+    # bergantung selalu dieksekusi sesuai urutan submit. Hasilnya dikirim
+    # kembali ke thread Tk lewat root.after, jadi callback boleh mengubah widget.
+    
+    def __init__(self, root, db_path, profile=None, on_busy=None, on_error=None):
+        self.root = root
+        self.profile = profile or STORAGE_PROFILES[STORAGE_PROFILE]
+        self.on_busy = on_busy
+        self.on_error = on_error
+        self.jobs = queue.Queue()
+        self.done = queue.Queue()
+        self.pending = 0
+        self.poll_job = None
+        # Rentang versi changes (awal, akhir] yang ditulis worker ini, untuk LocalChangeFeed
+        self.own_changes = []
+        self.batch_start = 0
+        self.own_lock = threading.Lock()
+        self.thread = threading.Thread(target=self.run, args=(db_path,), daemon=True)
+        self.thread.start()
+    
+    def submit(self, func, *args, callback=None, errback=None):
+        """Antrekan func(store, *args); callback(hasil) dipanggil di thread Tk"""
+        # Diimport saat tulis pertama: concurrent.futures ikut memuat logging (~7 ms startup)
+        from concurrent.futures import Future
+        future = Future()
+        self.jobs.put((func, args, future, callback, errback))
+        self.pending += 1
+        if self.pending == 1 and self.on_busy:
+            self.on_busy(True)
+        # Tanpa root (misalnya skrip), hasil cukup diambil dari future
+        if self.root is not None and self.poll_job is None:
+            self.poll_job = self.root.after(WORKER_POLL_MS, self.poll)
+        return future
+    
+    def run(self, db_path):
+        """Loop thread worker: eksekusi pekerjaan berurutan dengan group commit"""
+        # TodoStore milik thread ini; method-nya dipanggil sebagai func(store, *args)
+        store = None
+        window = self.profile["commit_window_ms"] / 1000
+        commits = 0
+        
+        running = True
+        while running:
+            job = self.jobs.get()
+            if job is None:
+                break
+            
+            # Kumpulkan tulisan beruntun ke satu transaksi sampai jendela habis
+            batch = []
+            deadline = time.monotonic() + window
+            try:
+                # Dibuat di sini, bukan sebelum loop: konstruktor (auto_vacuum,
+                # migrasi) juga butuh kunci tulis dan boleh dicoba ulang
+                if store is None:
+                    store = TodoStore(db_path, self.profile)
+                # IMMEDIATE: kunci tulis dipegang sejak awal, jadi versi changes setelah
+                # batch_start sampai COMMIT pasti milik worker ini, bukan proses lain
+                store.cursor.execute("BEGIN IMMEDIATE")
+                self.batch_start = store.change_version()
+            except sqlite3.OperationalError as exc:
+                # Kunci dipegang koneksi lain melewati busy timeout (misalnya proses
+                # lain): pekerjaan ini gagal, pekerjaan berikutnya mencoba lagi
+                self.fail_job(job, exc)
+                continue
+            cursor = store.cursor
+            while True:
+                if not self.execute_job(store, job, batch):
+                    break
+                if len(batch) >= self.profile["commit_batch"]:
+                    break
+                try:
+                    job = self.jobs.get(timeout=max(0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if job is None:
+                    running = False
+                    break
+            
+            self.commit_batch(cursor, batch, (self.batch_start, store.change_version()))
+            commits += 1
+            
+            # Checkpoint WAL hanya saat antrean kosong agar tidak menghambat burst
+            if self.jobs.empty() and commits >= self.profile["checkpoint_every"]:
+                cursor.execute("PRAGMA wal_checkpoint(PASSIVE)")
+                commits = 0
+        
+        if store is not None:
+            cursor = store.cursor
+            try:
+                cursor.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.OperationalError:
+                pass
+            store.close()
+    
+    def execute_job(self, store, job, batch):
+        """Jalankan satu pekerjaan di savepoint sendiri; gagal tidak membatalkan yang lain"""
+        # False jika transaksi batch tidak bisa dibuka lagi (batch harus diakhiri)
+        cursor = store.cursor
+        func, args, future, callback, errback = job
+        if not future.set_running_or_notify_cancel():
+            self.done.put((future, callback, errback))
+            return True
+        
+        cursor.execute("SAVEPOINT job")
+        try:
+            result = func(store, *args)
+            cursor.execute("RELEASE job")
+            batch.append((job, result, None))
+        except Exception as exc:
+            if cursor.connection.in_transaction:
+                cursor.execute("ROLLBACK TO job")
+                cursor.execute("RELEASE job")
+            else:
+                # SQLite membatalkan seluruh transaksi, jadi isi batch ikut gagal
+                batch[:] = [(queued, None, exc) for queued, _, _ in batch]
+                batch.append((job, None, exc))
+                try:
+                    cursor.execute("BEGIN IMMEDIATE")
+                except sqlite3.OperationalError:
+                    return False
+                self.batch_start = store.change_version()
+                return True
+            batch.append((job, None, exc))
+        return True
+    
+    def fail_job(self, job, exc):
+        """Gagalkan satu pekerjaan yang sudah diambil dari antrean tanpa menjalankannya"""
+        func, args, future, callback, errback = job
+        if future.set_running_or_notify_cancel():
+            future.set_exception(exc)
+        self.done.put((future, callback, errback))
+    
+    def commit_batch(self, cursor, batch, own=(0, 0)):
+        """Commit satu transaksi; future baru selesai setelah data benar-benar tersimpan"""
+        # Di luar transaksi (BEGIN ulang di execute_job gagal) tidak ada yang
+        # di-commit; semua pekerjaan batch sudah berisi error
+        if cursor.connection.in_transaction:
+            try:
+                with span("COMMIT", "commit", jobs=len(batch)):
+                    cursor.execute("COMMIT")
+            except Exception as exc:
+                if cursor.connection.in_transaction:
+                    cursor.execute("ROLLBACK")
+                batch = [(job, None, exc) for job, _, _ in batch]
+            else:
+                # Rentang versi worker dicatat setelah COMMIT (versi transaksi yang
+                # batal dipakai ulang penulis lain), tapi sebelum callback berjalan
+                if own[1] > own[0]:
+                    with self.own_lock:
+                        self.own_changes.append(own)
+        
+        for (func, args, future, callback, errback), result, exc in batch:
+            if exc is None:
+                future.set_result(result)
+            else:
+                future.set_exception(exc)
+            self.done.put((future, callback, errback))
+    
+    def take_own_changes(self, version):
+        """Rentang versi milik worker; yang sudah tercakup version dilupakan"""
+        with self.own_lock:
+            ranges = self.own_changes
+            self.own_changes = [(start, end) for start, end in ranges if end > version]
+        return ranges
+    
+    def poll(self):
+        """Kirim hasil pekerjaan yang sudah selesai ke callback di thread Tk"""
+        self.poll_job = None
+        while True:
+            try:
+                future, callback, errback = self.done.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if future.cancelled():
+                continue
+            exc = future.exception()
+            if exc is not None:
+                handler = errback or self.on_error
+                if handler:
+                    handler(exc)
+            elif callback:
+                callback(future.result())
+        
+        if self.pending:
+            self.poll_job = self.root.after(WORKER_POLL_MS, self.poll)
+        elif self.on_busy:
+            self.on_busy(False)
+    
+    def close(self):
+        """Selesaikan semua pekerjaan yang masih antre lalu hentikan thread"""
+        self.jobs.put(None)
+        self.thread.join()
+
+
+class RemoteWorker(DatabaseWorker):
+    """DatabaseWorker mode klien: pekerjaan dikirim berurutan ke todo_server"""
+    
+    # Transaksi dijalankan server per RPC, jadi di sini tidak ada group commit;
+    # urutan FIFO dan pengiriman hasil ke thread Tk tetap sama.
+    
+    def __init__(self, root, url, client_id, on_busy=None, on_error=None):
+        self.client_id = client_id
+        super().__init__(root, url, on_busy=on_busy, on_error=on_error)
+    
+    def run(self, url):
+        """Loop thread worker: satu RPC per pekerjaan"""
+        from todo_server import RemoteStore
+        store = RemoteStore(url, self.client_id)
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                break
+            func, args, future, callback, errback = job
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(store.apply(func, args))
+                except Exception as exc:
+                    future.set_exception(exc)
+            self.done.put((future, callback, errback))
+        store.close()
+
+
+class DeadlineScheduler:
+    """Timer deadline: satu root.after untuk deadline atau pengingat terdekat"""
+    
+    # Min-heap hanya berisi DEADLINE_HEAP_SIZE deadline berikutnya yang dibaca
+    # dari index (status, deadline_ts); sisanya dimuat saat waktu mendekati
+    # deadline terakhir yang sudah dibaca. Entri tugas yang berubah tidak dicari
+    # di heap, cukup diabaikan saat keluar (deadlines menyimpan nilai terbaru).
+    
+    def __init__(self, root, store, on_due, on_reminder=None, reminder_lead=REMINDER_LEAD_MINUTES * 60):
+        self.root = root
+        self.store = store
+        self.on_due = on_due
+        self.on_reminder = on_reminder
+        self.reminder_lead = reminder_lead if on_reminder else 0
+        self.timer = None
+        self.heap = []
+        self.deadlines = {}
+        self.loaded_key = None
+        self.exhausted = True
+        # (id, deadline_ts) yang pengingatnya sudah tampil, agar reload tidak mengulang
+        self.reminded = set()
+    
+    def reload(self):
+        """Bangun ulang heap dari database (startup, resync, import, hapus semua)"""
+        self.heap = []
+        self.deadlines = {}
+        # Deadline yang sudah lewat sudah tampil terlambat dari STATE_SQL
+        self.loaded_key = (int(time.time()), -1)
+        self.exhausted = False
+        self.load_more()
+        self.arm()
+    
+    def load_more(self):
+        """Baca DEADLINE_HEAP_SIZE deadline berikutnya setelah yang sudah ada di heap"""
+        rows = self.store.upcoming_deadlines(self.loaded_key, DEADLINE_HEAP_SIZE)
+        for deadline_ts, task_id in rows:
+            self.push(task_id, deadline_ts)
+        if rows:
+            self.loaded_key = rows[-1]
+        self.exhausted = len(rows) < DEADLINE_HEAP_SIZE
+    
+    def push(self, task_id, deadline_ts):
+        """Masukkan deadline (dan pengingatnya) satu tugas ke heap"""
+        self.deadlines[task_id] = deadline_ts
+        heapq.heappush(self.heap, (deadline_ts, task_id, "due", deadline_ts))
+        # Deadline yang sudah masuk jendela pengingat diingatkan segera
+        if self.reminder_lead and (task_id, deadline_ts) not in self.reminded:
+            heapq.heappush(self.heap, (deadline_ts - self.reminder_lead, task_id, "reminder", deadline_ts))
+    
+    def track(self, task_id):
+        """Sesuaikan heap setelah satu tugas ditambah, diubah, selesai, atau dihapus"""
+        self.track_rows({task_id: self.store.get_task(task_id)})
+    
+    def track_rows(self, rows):
+        """Sesuaikan heap untuk banyak tugas; rows: id -> baris TASK_COLUMNS atau None jika dihapus"""
+        now = time.time()
+        changed = False
+        for task_id, row in rows.items():
+            deadline_ts = None
+            if row is not None and row[3] == "Belum Selesai" and row[4] is not None and row[4] > now:
+                deadline_ts = row[4]
+            if self.deadlines.get(task_id) == deadline_ts:
+                continue
+            
+            changed = True
+            self.deadlines.pop(task_id, None)
+            # Deadline di luar rentang yang sudah dibaca akan ikut dimuat oleh load_more
+            if deadline_ts is not None and (self.exhausted or (deadline_ts, task_id) <= self.loaded_key):
+                self.push(task_id, deadline_ts)
+        if changed:
+            self.arm()
+    
+    def fire(self):
+        """Proses semua deadline dan pengingat yang sudah tiba, lalu pasang timer berikutnya"""
+        self.timer = None
+        now = time.time()
+        # Pengingat tugas yang belum dibaca bisa jatuh sebelum deadline terakhir di heap
+        while not self.exhausted and self.loaded_key[0] - self.reminder_lead <= now:
+            self.load_more()
+        
+        due, reminders = [], []
+        while self.heap and self.heap[0][0] <= now:
+            _, task_id, kind, deadline_ts = heapq.heappop(self.heap)
+            if self.deadlines.get(task_id) != deadline_ts:
+                continue
+            if kind == "due":
+                del self.deadlines[task_id]
+                self.reminded.discard((task_id, deadline_ts))
+                due.append(task_id)
+            elif (task_id, deadline_ts) not in self.reminded:
+                self.reminded.add((task_id, deadline_ts))
+                reminders.append(task_id)
+        
+        if reminders:
+            self.on_reminder(reminders)
+        if due:
+            self.on_due(due)
+        self.arm()
+    
+    def arm(self):
+        """Pasang satu root.after untuk waktu terdekat di heap"""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+        
+        # Buang entri usang di puncak heap agar timer tidak bangun sia-sia
+        while self.heap and self.deadlines.get(self.heap[0][1]) != self.heap[0][3]:
+            heapq.heappop(self.heap)
+        
+        times = []
+        if self.heap:
+            times.append(self.heap[0][0])
+        if not self.exhausted:
+            times.append(self.loaded_key[0] - self.reminder_lead)
+        if not times:
+            return
+        delay = int((min(times) - time.time()) * 1000) + 1
+        self.timer = self.root.after(max(0, min(delay, DEADLINE_MAX_SLEEP_MS)), self.fire)
+    
+    def cancel(self):
+        """Hentikan timer (saat aplikasi ditutup)"""
+        if self.timer is not None:
+            self.root.after_cancel(self.timer)
+            self.timer = None
+
+
+class ChangeFeed:
+    """Long-poll /changes todo_server di thread sendiri; perubahan klien lain diteruskan ke Tk"""
+    
+    # on_change(ID tugas) dipanggil di thread Tk; None berarti daftar perlu dimuat
+    # ulang (server baru dijalankan ulang, tertinggal jauh, atau perubahan massal).
+    
+    def __init__(self, root, url, client_id, on_change):
+        self.root = root
+        self.on_change = on_change
+        self.results = queue.Queue()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(url, client_id), daemon=True)
+        self.thread.start()
+        self.poll_job = self.root.after(FEED_POLL_MS, self.poll)
+    
+    def run(self, url, client_id):
+        """Loop thread feed: satu long-poll terbuka setiap saat"""
+        import http.client
+        from todo_server import RemoteStore
+        store = RemoteStore(url, client_id)
+        epoch = since = None
+        while not self.stopped.is_set():
+            try:
+                feed = store.changes(since, epoch=epoch)
+            except (OSError, ValueError, http.client.HTTPException):
+                # Server mati atau dijalankan ulang: coba lagi; epoch baru berarti muat ulang
+                store.close()
+                self.stopped.wait(FEED_RETRY_S)
+                continue
+            
+            if feed["epoch"] != epoch or feed.get("reload"):
+                if epoch is not None:
+                    self.results.put(None)
+                epoch = feed["epoch"]
+            else:
+                task_ids = set()
+                for _, client, changed in feed["changes"]:
+                    if client == client_id:
+                        continue
+                    if changed is None:
+                        task_ids = None
+                        break
+                    task_ids.update(changed)
+                if task_ids != set():
+                    self.results.put(task_ids)
+            since = feed["version"]
+        store.close()
+    
+    def poll(self):
+        """Gabungkan hasil feed yang menumpuk menjadi satu pembaruan Treeview"""
+        self.poll_job = None
+        task_ids = set()
+        while task_ids is not None:
+            try:
+                changed = self.results.get_nowait()
+            except queue.Empty:
+                break
+            task_ids = None if changed is None else task_ids | changed
+        if task_ids != set():
+            self.on_change(task_ids)
+        self.poll_job = self.root.after(FEED_POLL_MS, self.poll)
+    
+    def stop(self):
+        """Hentikan polling (saat aplikasi ditutup); long-poll yang terbuka dibiarkan habis"""
+        self.stopped.set()
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+
+
+class LocalChangeFeed:
+    """Mode lokal: deteksi tulisan proses lain ke file database dan teruskan ID tugasnya"""
+    
+    # PRAGMA data_version koneksi baca Tk hanya berubah jika koneksi lain commit,
+    # jadi cek berkala hampir tanpa biaya; tabel changes baru dibaca setelahnya.
+    # Versi milik DatabaseWorker dilewati karena callback-nya sudah memperbarui
+    # Treeview (commit yang belum sempat dicatat worker cukup diterapkan dua kali).
+    
+    def __init__(self, root, store, worker, on_change):
+        self.root = root
+        self.store = store
+        self.worker = worker
+        self.on_change = on_change
+        self.data_version = store.data_version()
+        self.version = store.change_version()
+        self.poll_job = self.root.after(CHANGE_POLL_MS, self.poll)
+    
+    def poll(self):
+        """Terapkan perubahan sejak cek terakhir jika data_version berubah"""
+        self.poll_job = None
+        data_version = self.store.data_version()
+        if data_version != self.data_version:
+            self.data_version = data_version
+            skip = self.worker.take_own_changes(self.version)
+            self.version, task_ids = self.store.changes_since(self.version, VIRTUAL_THRESHOLD, skip)
+            if task_ids != []:
+                self.on_change(task_ids)
+        self.poll_job = self.root.after(CHANGE_POLL_MS, self.poll)
+    
+    def stop(self):
+        """Hentikan pengecekan (saat aplikasi ditutup)"""
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+
+
+class CalendarCache:
+    """Cache LRU hasil calendar_days per rentang tampilan, dengan prefetch saat Tk idle"""
+    
+    # Satu rentang (bulan atau minggu yang tampil) = satu query calendar_days.
+    # Setiap perubahan tugas mengosongkan seluruh cache: hari lama tugas yang
+    # berubah tidak diketahui, dan mengisi ulang satu bulan hanya ~31 baris
+    # task_days. Tampilan yang terbuka digambar ulang sekali per giliran idle.
+    
+    def __init__(self, root, store, size=CALENDAR_CACHE_SIZE):
+        self.root = root
+        self.store = store
+        self.size = size
+        # (dari, sampai, judul) -> hasil calendar_days; urutan dict = urutan pemakaian
+        self.ranges = {}
+        self.pending = []
+        self.prefetch_job = None
+        self.change_job = None
+        self.on_change = None
+    
+    def get(self, date_from, date_to, titles):
+        """Hari berdeadline di rentang: dari cache, atau satu query jika belum ada"""
+        key = (date_from, date_to, titles)
+        days = self.ranges.pop(key, None)
+        if days is None:
+            days = self.store.calendar_days(date_from, date_to, titles)
+            if len(self.ranges) >= self.size:
+                del self.ranges[next(iter(self.ranges))]
+        self.ranges[key] = days
+        return days
+    
+    def prefetch(self, keys):
+        """Muat rentang (dari, sampai, judul) yang belum ada di cache, satu per giliran idle"""
+        self.pending = [key for key in keys if key not in self.ranges]
+        if self.pending and self.prefetch_job is None:
+            self.prefetch_job = self.root.after_idle(self.load_pending)
+    
+    def load_pending(self):
+        """Muat satu rentang prefetch; sisanya dijadwalkan lagi agar Tk tetap responsif"""
+        self.prefetch_job = None
+        if self.pending:
+            self.get(*self.pending.pop(0))
+        if self.pending:
+            self.prefetch_job = self.root.after_idle(self.load_pending)
+    
+    def invalidate(self):
+        """Buang isi cache setelah tugas berubah dan gambar ulang tampilan yang terbuka"""
+        self.ranges.clear()
+        self.pending = []
+        if self.on_change is not None and self.change_job is None:
+            self.change_job = self.root.after_idle(self.notify)
+    
+    def notify(self):
+        """Panggil on_change sekali untuk semua perubahan sejak giliran idle sebelumnya"""
+        self.change_job = None
+        if self.on_change is not None:
+            self.on_change()
+
 
 class TodoApp:
-    def __init__(self, root):
+    def __init__(self, root, server_url=None):
         self.root = root
         self.root.title("Aplikasi To-Do List")
         self.root.geometry("900x650")
         self.root.resizable(True, True)
         
+        # State daftar tugas (mode penuh atau virtual)
+        self.virtual_mode = False
+        self.visible_rows = 13
+        self.total_rows = 0
+        self.window_rows = []
+        self.window_start = 0
+        self.view_offset = 0
+        self.moveto_job = None
+        self.pending_moveto = 0.0
+        self.search_query = ""
+        self.search_job = None
+        # Pemuatan bertahap mode penuh: kunci baris terakhir dan timer potongan berikutnya
+        self.load_key = None
+        self.load_job = None
+        # Penomoran kolom No untuk baris yang terlihat, dijadwalkan saat Tk idle
+        self.number_job = None
+        # Urutan dan filter daftar; dijalankan di SQLite, bukan di Python
+        self.view = DEFAULT_VIEW
+        # Alamat todo_server jika database dipakai bersama (None = file lokal)
+        self.server_url = server_url
+        
         # Inisialisasi database
         self.init_database()
         
         # Setup GUI
         self.setup_gui()
         
-        # Load data
+        # Load data: hanya halaman pertama sebelum jendela tampil, sisanya menyusul
         self.load_tasks()
+        
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
     
     def init_database(self):
         """Inisialisasi database SQLite"""
-        self.conn = sqlite3.connect('todo_list.db')
-        self.cursor = self.conn.cursor()
-        
-        # Buat tabel jika belum ada
-        self.cursor.execute('''
-            CREATE TABLE IF NOT EXISTS tasks (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task TEXT NOT NULL,
-                priority TEXT DEFAULT 'Sedang',
-                status TEXT DEFAULT 'Belum Selesai',
-                created_date TEXT,
-                completed_date TEXT,
-                deadline_date TEXT,
-                deadline_time TEXT,
-                notes TEXT DEFAULT ''
+        self.feed = None
+        self.maintenance_job = None
+        self.maintenance_thread = None
+        if self.server_url:
+            # Mode klien: baca, tulis, dan change feed lewat todo_server
+            from todo_server import RemoteStore
+            self.store = RemoteStore(self.server_url)
+            self.worker = RemoteWorker(
+                self.root,
+                self.server_url,
+                self.store.client_id,
+                on_busy=self.set_busy,
+                on_error=self.show_db_error
             )
-        ''')
-        self.conn.commit()
-    
-    def reset_autoincrement(self):
-        """Reset autoincrement ID ke 1"""
-        self.cursor.execute("DELETE FROM sqlite_sequence WHERE name='tasks'")
-        self.conn.commit()
-    
-    def reorder_ids(self):
-        """Mengatur ulang ID dari 1 secara berurutan"""
-        self.cursor.execute("SELECT * FROM tasks ORDER BY id")
-        all_tasks = self.cursor.fetchall()
-        
-        if not all_tasks:
-            self.reset_autoincrement()
-            return
-        
-        # Hapus semua data
-        self.cursor.execute("DELETE FROM tasks")
-        self.reset_autoincrement()
-        
-        # Insert ulang dengan ID berurutan
-        for task in all_tasks:
-            self.cursor.execute('''
-                INSERT INTO tasks (task, priority, status, created_date, completed_date, deadline_date, deadline_time, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (task[1], task[2], task[3], task[4], task[5], task[6], task[7], task[8] if len(task) > 8 else ''))
-        
-        self.conn.commit()
+            self.feed = ChangeFeed(self.root, self.server_url, self.store.client_id, self.apply_external_changes)
+        else:
+            # Store baca untuk thread Tk; membuat tabel atau upgrade skema database lama
+            self.store = TodoStore(DB_PATH)
+            # VACUUM penuh satu kali untuk file lama tanpa auto_vacuum, sebelum
+            # DatabaseWorker ada; pemeliharaan latar hanya incremental_vacuum
+            if self.store.needs_vacuum():
+                self.store.compact()
+            
+            # Semua operasi tulis dijalankan di thread terpisah
+            self.worker = DatabaseWorker(
+                self.root,
+                DB_PATH,
+                on_busy=self.set_busy,
+                on_error=self.show_db_error
+            )
+            # Tulisan CLI, skrip, atau TodoApp lain ke file yang sama
+            self.feed = LocalChangeFeed(self.root, self.store, self.worker, self.apply_external_changes)
+            # Di mode klien pemeliharaan file menjadi urusan proses server
+            self.maintenance_job = self.root.after(MAINTENANCE_DELAY_MS, self.start_maintenance)
+        
+        # Status terlambat dan pengingat diperbarui tepat saat deadline tiba
+        self.scheduler = DeadlineScheduler(
+            self.root,
+            self.store,
+            on_due=self.mark_overdue,
+            on_reminder=self.show_reminder if REMINDER_LEAD_MINUTES else None
+        )
+        self.reminder_job = None
+        # Jumlah tugas per hari untuk jendela kalender
+        self.calendar = CalendarCache(self.root, self.store)
+        self.calendar_window = None
     
     def setup_gui(self):
         """Setup antarmuka GUI"""
+        # Menu File: import/export massal
+        menubar = tk.Menu(self.root)
+        file_menu = tk.Menu(menubar, tearoff=0)
+        file_menu.add_command(label="Import Tugas (CSV/JSONL)...", command=self.import_tasks)
+        file_menu.add_command(label="Export Tugas (CSV/JSONL)...", command=self.export_tasks)
+        file_menu.add_command(label="Arsip Tugas Selesai...", command=self.open_archive)
+        file_menu.add_separator()
+        file_menu.add_command(label="Keluar", command=self.on_close)
+        menubar.add_cascade(label="File", menu=file_menu)
+        
+        # Menu Edit: undo/redo dari journal operasi di database
+        self.edit_menu = tk.Menu(menubar, tearoff=0)
+        self.edit_menu.add_command(label="Undo", accelerator="Ctrl+Z", command=self.undo, state=tk.DISABLED)
+        self.edit_menu.add_command(label="Redo", accelerator="Ctrl+Y", command=self.redo, state=tk.DISABLED)
+        menubar.add_cascade(label="Edit", menu=self.edit_menu)
+        self.root.bind("<Control-z>", lambda e: self.undo())
+        self.root.bind("<Control-y>", lambda e: self.redo())
+        self.root.bind("<Control-Z>", lambda e: self.redo())
+        
+        # Menu Tampilan: kalender bulan/minggu
+        view_menu = tk.Menu(menubar, tearoff=0)
+        view_menu.add_command(label="Kalender...", accelerator="Ctrl+K", command=self.open_calendar)
+        menubar.add_cascade(label="Tampilan", menu=view_menu)
+        self.root.bind("<Control-k>", lambda e: self.open_calendar())
+        
+        # Menu Debug hanya ada jika instrumentasi diaktifkan (TODO_TRACE=1)
+        if PROFILER is not None:
+            debug_menu = tk.Menu(menubar, tearoff=0)
+            debug_menu.add_command(label="Profiling...", accelerator="F12", command=self.open_profiler)
+            menubar.add_cascade(label="Debug", menu=debug_menu)
+            self.root.bind("<F12>", lambda e: self.open_profiler())
+        self.root.config(menu=menubar)
+        
         # Header
         header_frame = tk.Frame(self.root, bg="#2c3e50", height=80)
         header_frame.pack(fill=tk.X)
@@ -110,7 +755,7 @@ class TodoApp:
         priority_dropdown = ttk.Combobox(
             input_frame, 
             textvariable=self.priority_var,
-            values=["Rendah", "Sedang", "Tinggi"],
+            values=PRIORITIES,
             state="readonly",
             width=10
         )
@@ -198,6 +843,21 @@ class TodoApp:
         )
         minute_spin.pack(side=tk.LEFT)
         
+        # Tugas berulang
+        repeat_frame = tk.Frame(input_frame, bg="#ecf0f1")
+        repeat_frame.grid(row=1, column=3, padx=5, pady=5, sticky="w")
+        
+        tk.Label(repeat_frame, text="Ulangi:", font=("Arial", 10, "bold"), bg="#ecf0f1").pack(side=tk.LEFT)
+        
+        self.repeat_var = tk.StringVar(value="Tidak")
+        ttk.Combobox(
+            repeat_frame,
+            textvariable=self.repeat_var,
+            values=list(REPEAT_CHOICES),
+            state="readonly",
+            width=10
+        ).pack(side=tk.LEFT, padx=2)
+        
         # Add Button
         add_btn = tk.Button(
             input_frame,
@@ -265,45 +925,179 @@ class TodoApp:
         )
         clear_btn.pack(side=tk.LEFT, padx=5)
         
+        resync_btn = tk.Button(
+            btn_frame,
+            text="⟳ Muat Ulang",
+            command=self.load_tasks,
+            bg="#7f8c8d",
+            fg="white",
+            font=("Arial", 9),
+            cursor="hand2",
+            padx=10
+        )
+        resync_btn.pack(side=tk.LEFT, padx=5)
+        self.root.bind("<F5>", lambda e: self.load_tasks())
+        
         # Info label untuk notes
         info_label = tk.Label(
             btn_frame,
-            text="💡 Double-click tugas untuk menambah catatan",
+            text="💡 Double-click tugas untuk menambah catatan, Ctrl/Shift+klik untuk memilih banyak",
             bg="#ecf0f1",
             fg="#7f8c8d",
             font=("Arial", 8, "italic")
         )
         info_label.pack(side=tk.RIGHT, padx=10)
         
+        # Search Frame
+        search_frame = tk.Frame(self.root, bg="#ecf0f1")
+        search_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(
+            search_frame,
+            text="🔍 Cari:",
+            font=("Arial", 10, "bold"),
+            bg="#ecf0f1"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.search_var = tk.StringVar()
+        search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=40, font=("Arial", 10))
+        search_entry.pack(side=tk.LEFT, padx=5)
+        search_entry.bind('<Escape>', lambda e: self.search_var.set(""))
+        self.search_var.trace_add("write", lambda *args: self.schedule_search())
+        
+        tk.Button(
+            search_frame,
+            text="✕",
+            command=lambda: self.search_var.set(""),
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 8),
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+        
+        self.search_info = tk.Label(
+            search_frame,
+            text="",
+            bg="#ecf0f1",
+            fg="#7f8c8d",
+            font=("Arial", 8, "italic")
+        )
+        self.search_info.pack(side=tk.LEFT, padx=10)
+        
+        # Filter Frame
+        filter_frame = tk.Frame(self.root, bg="#ecf0f1")
+        filter_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        tk.Label(filter_frame, text="Status:", font=("Arial", 9, "bold"), bg="#ecf0f1").pack(side=tk.LEFT, padx=5)
+        self.filter_status_var = tk.StringVar(value=FILTER_ALL)
+        status_filter = ttk.Combobox(
+            filter_frame,
+            textvariable=self.filter_status_var,
+            values=(FILTER_ALL,) + STATUSES,
+            state="readonly",
+            width=13
+        )
+        status_filter.pack(side=tk.LEFT)
+        status_filter.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        
+        tk.Label(filter_frame, text="Prioritas:", font=("Arial", 9, "bold"), bg="#ecf0f1").pack(side=tk.LEFT, padx=5)
+        self.filter_priority_var = tk.StringVar(value=FILTER_ALL)
+        priority_filter = ttk.Combobox(
+            filter_frame,
+            textvariable=self.filter_priority_var,
+            values=(FILTER_ALL,) + PRIORITIES,
+            state="readonly",
+            width=8
+        )
+        priority_filter.pack(side=tk.LEFT)
+        priority_filter.bind("<<ComboboxSelected>>", lambda e: self.apply_filters())
+        
+        self.filter_overdue_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            filter_frame,
+            text="Terlambat",
+            variable=self.filter_overdue_var,
+            command=self.apply_filters,
+            bg="#ecf0f1"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(filter_frame, text="Deadline:", font=("Arial", 9, "bold"), bg="#ecf0f1").pack(side=tk.LEFT, padx=5)
+        self.filter_from_entry = tk.Entry(filter_frame, width=11, font=("Arial", 9))
+        self.filter_from_entry.pack(side=tk.LEFT)
+        self.filter_from_entry.bind('<Return>', lambda e: self.apply_filters())
+        tk.Label(filter_frame, text="s/d", bg="#ecf0f1").pack(side=tk.LEFT, padx=2)
+        self.filter_to_entry = tk.Entry(filter_frame, width=11, font=("Arial", 9))
+        self.filter_to_entry.pack(side=tk.LEFT)
+        self.filter_to_entry.bind('<Return>', lambda e: self.apply_filters())
+        
+        tk.Button(
+            filter_frame,
+            text="Terapkan",
+            command=self.apply_filters,
+            bg="#3498db",
+            fg="white",
+            font=("Arial", 8),
+            cursor="hand2"
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            filter_frame,
+            text="Reset",
+            command=self.reset_filters,
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 8),
+            cursor="hand2"
+        ).pack(side=tk.LEFT)
+        
+        tk.Label(
+            filter_frame,
+            text="(DD/MM/YYYY) 💡 Klik judul kolom untuk mengurutkan",
+            bg="#ecf0f1",
+            fg="#7f8c8d",
+            font=("Arial", 8, "italic")
+        ).pack(side=tk.LEFT, padx=5)
+        
         # Treeview Frame
         tree_frame = tk.Frame(self.root)
         tree_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
         
         # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar = ttk.Scrollbar(tree_frame)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         # Treeview
         self.tree = ttk.Treeview(
             tree_frame,
-            columns=("ID", "Tugas", "Prioritas", "Status", "Deadline", "Dibuat"),
+            columns=("No", "ID", "Tugas", "Prioritas", "Status", "Deadline", "Dibuat"),
             show="headings",
-            yscrollcommand=scrollbar.set,
+            selectmode="extended",
+            yscrollcommand=self.on_tree_scroll,
             height=13
         )
-        scrollbar.config(command=self.tree.yview)
+        self.scrollbar.config(command=self.tree.yview)
         
         # Define columns
-        self.tree.heading("ID", text="ID")
-        self.tree.heading("Tugas", text="Tugas")
-        self.tree.heading("Prioritas", text="Prioritas")
-        self.tree.heading("Status", text="Status")
-        self.tree.heading("Deadline", text="Deadline")
-        self.tree.heading("Dibuat", text="Tanggal Dibuat")
+        self.heading_texts = {
+            "No": "No",
+            "ID": "ID",
+            "Tugas": "Tugas",
+            "Prioritas": "Prioritas",
+            "Status": "Status",
+            "Deadline": "Deadline",
+            "Dibuat": "Tanggal Dibuat",
+        }
+        for column, text in self.heading_texts.items():
+            if column in SORT_HEADINGS:
+                self.tree.heading(column, text=text, command=lambda c=column: self.sort_by(c))
+            else:
+                self.tree.heading(column, text=text)
+        self.update_headings()
         
         # Column widths
-        self.tree.column("ID", width=40, anchor="center")
-        self.tree.column("Tugas", width=280)
+        self.tree.column("No", width=45, anchor="center")
+        self.tree.column("ID", width=45, anchor="center")
+        self.tree.column("Tugas", width=240)
         self.tree.column("Prioritas", width=80, anchor="center")
         self.tree.column("Status", width=100, anchor="center")
         self.tree.column("Deadline", width=150, anchor="center")
@@ -314,6 +1108,15 @@ class TodoApp:
         # Bind double-click event
         self.tree.bind("<Double-1>", self.open_notes)
         
+        # Scroll manual untuk mode virtual
+        self.tree.bind("<MouseWheel>", self.on_mouse_wheel)
+        self.tree.bind("<Button-4>", self.on_mouse_wheel)
+        self.tree.bind("<Button-5>", self.on_mouse_wheel)
+        self.tree.bind("<Prior>", lambda e: self.on_page_key(-1))
+        self.tree.bind("<Next>", lambda e: self.on_page_key(1))
+        self.tree.bind("<Configure>", self.on_tree_resize)
+        self.tree.bind("<Delete>", lambda e: self.delete_task())
+        
         # Tags untuk warna
         self.tree.tag_configure("completed", background="#d5f4e6")
         self.tree.tag_configure("has_notes", background="#4BCAF0")
@@ -324,6 +1127,24 @@ class TodoApp:
         footer_frame = tk.Frame(self.root, bg="#34495e", height=30)
         footer_frame.pack(fill=tk.X, side=tk.BOTTOM)
         
+        self.busy_label = tk.Label(
+            footer_frame,
+            text="",
+            bg="#34495e",
+            fg="#f1c40f",
+            font=("Arial", 9, "italic")
+        )
+        self.busy_label.pack(side=tk.RIGHT, padx=10)
+        
+        self.reminder_label = tk.Label(
+            footer_frame,
+            text="",
+            bg="#34495e",
+            fg="#f39c12",
+            font=("Arial", 9, "bold")
+        )
+        self.reminder_label.pack(side=tk.LEFT, padx=10)
+        
         self.status_label = tk.Label(
             footer_frame,
             text="Total Tugas: 0 | Selesai: 0 | Belum Selesai: 0 | Terlambat: 0",
@@ -339,14 +1160,11 @@ class TodoApp:
         if not selected:
             return
         
-        item = self.tree.item(selected[0])
-        task_id = item['values'][0]
-        task_name = item['values'][1]
+        task_id = int(selected[0])
+        task_name = self.tree.set(selected[0], "Tugas")
         
-        # Ambil notes dari database
-        self.cursor.execute("SELECT notes FROM tasks WHERE id = ?", (task_id,))
-        result = self.cursor.fetchone()
-        current_notes = result[0] if result and result[0] else ""
+        # Isi catatan baru dibaca saat window dibuka, bukan saat memuat daftar
+        current_notes = self.store.get_notes(task_id)
         
         # Buat window notes
         notes_window = tk.Toplevel(self.root)
@@ -370,6 +1188,7 @@ class TodoApp:
         text_frame = tk.Frame(notes_window)
         text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        from tkinter import scrolledtext
         notes_text = scrolledtext.ScrolledText(
             text_frame,
             font=("Arial", 10),
@@ -385,28 +1204,24 @@ class TodoApp:
         btn_frame = tk.Frame(notes_window)
         btn_frame.pack(fill=tk.X, padx=10, pady=10)
         
-        def save_notes():
-            new_notes = notes_text.get("1.0", tk.END).strip()
-            self.cursor.execute(
-                "UPDATE tasks SET notes = ? WHERE id = ?",
-                (new_notes, task_id)
-            )
-            self.conn.commit()
-            self.load_tasks()
+        def notes_saved(_):
+            self.refresh_task(task_id)
             notes_window.destroy()
             messagebox.showinfo("Sukses", "Catatan berhasil disimpan!")
         
+        def notes_cleared(_):
+            self.refresh_task(task_id)
+            messagebox.showinfo("Sukses", f"Catatan pada '{task_name}' berhasil dihapus")
+        
+        def save_notes():
+            new_notes = notes_text.get("1.0", tk.END).strip()
+            self.worker.submit(TodoStore.set_notes, task_id, new_notes, callback=notes_saved)
+        
         def clear_notes():
             if messagebox.askyesno("Konfirmasi", "Hapus semua catatan?"):
-                self.cursor.execute(
-                    "UPDATE tasks SET notes = ? WHERE id = ?",
-                    ("", task_id)
-                )
-                self.conn.commit()
-                self.load_tasks()
+                self.worker.submit(TodoStore.set_notes, task_id, "", callback=notes_cleared)
                 notes_text.delete("1.0", tk.END)
                 notes_window.destroy()
-                messagebox.showinfo("Sukses", f"Catatan pada '{task_name}' berhasil dihapus")
         
         tk.Button(
             btn_frame,
@@ -450,131 +1265,688 @@ class TodoApp:
             messagebox.showwarning("Peringatan", "Mohon masukkan tugas!")
             return
         
-        # Validasi tanggal
+        # Validasi tanggal (aturan yang sama dipakai saat import)
         try:
-            day = int(self.day_var.get())
-            month = int(self.month_var.get())
-            year = int(self.year_var.get())
-            
-            # Cek apakah tanggal valid
-            datetime(year, month, day)
+            deadline_date, deadline_time = parse_deadline(
+                f"{self.year_var.get()}-{self.month_var.get()}-{self.day_var.get()}",
+                f"{self.hour_var.get()}:{self.minute_var.get()}"
+            )
         except ValueError:
             messagebox.showerror("Error", "Tanggal tidak valid!")
             return
         
         created_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        recurrence = REPEAT_CHOICES[self.repeat_var.get()]
         
-        # Get deadline
-        deadline_date = f"{year}-{month:02d}-{day:02d}"
-        deadline_time = f"{self.hour_var.get().zfill(2)}:{self.minute_var.get().zfill(2)}"
+        def task_added(task_id):
+            self.refresh_task(task_id)
+            messagebox.showinfo("Sukses", "Tugas berhasil ditambahkan!")
         
-        self.cursor.execute(
-            "INSERT INTO tasks (task, priority, status, created_date, deadline_date, deadline_time, notes) VALUES (?, ?, ?, ?, ?, ?, ?)",
-            (task, priority, "Belum Selesai", created_date, deadline_date, deadline_time, "")
+        self.worker.submit(
+            TodoStore.add_task, task, priority, deadline_date, deadline_time, created_date, recurrence,
+            callback=task_added
         )
-        self.conn.commit()
-        
         self.task_entry.delete(0, tk.END)
-        self.load_tasks()
-        messagebox.showinfo("Sukses", "Tugas berhasil ditambahkan!")
     
-    def is_overdue(self, deadline_date, deadline_time, status):
-        """Cek apakah tugas sudah melewati deadline"""
-        if status == "Selesai":
-            return False
-        
-        try:
-            deadline_str = f"{deadline_date} {deadline_time}"
-            deadline_dt = datetime.strptime(deadline_str, "%Y-%m-%d %H:%M")
-            return datetime.now() > deadline_dt
-        except:
-            return False
+    def format_task(self, row, number):
+        """Ubah satu baris hasil TASK_COLUMNS menjadi nilai, tag, dan status Treeview"""
+        task_id, task, priority, status, _, deadline_display, created_display, state, has_notes = row[:9]
+        
+        # Tag warna sudah ditentukan oleh SQLite (STATE_SQL dan HAS_NOTES_SQL)
+        tags = (state, "has_notes") if has_notes else (state,)
+        values = (number, task_id, task, priority, status, deadline_display, created_display)
+        return values, tags
     
+    def sort_key(self, task_id, deadline_ts):
+        """Kunci urutan baris untuk bisect, sama dengan ORDER BY deadline_ts, id"""
+        return (deadline_ts is not None, deadline_ts or 0, task_id)
+    
+    def clear_task_rows(self):
+        """Kosongkan Treeview beserta peta id tugas -> item"""
+        if self.load_job is not None:
+            self.root.after_cancel(self.load_job)
+            self.load_job = None
+        self.tree.delete(*self.tree.get_children())
+        self.task_items = {}
+        self.task_rows = {}
+        self.task_keys = {}
+        self.sorted_keys = []
+    
+    @traced("widget")
     def load_tasks(self):
-        """Load semua tugas dari database"""
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        """Load ulang semua tugas dari database (hanya saat startup atau resync)"""
+        self.clear_task_rows()
+        self.scheduler.reload()
+        self.calendar.invalidate()
         
-        # Load from database
-        self.cursor.execute(
-            "SELECT id, task, priority, status, created_date, deadline_date, deadline_time, notes FROM tasks ORDER BY deadline_date, deadline_time"
-        )
-        rows = self.cursor.fetchall()
+        if self.search_query:
+            self.run_search()
+            return
+        
+        self.total_rows = self.store.count_view(self.view)
+        # Urutan/filter selain bawaan selalu memakai jendela keyset dari SQLite,
+        # sehingga refresh_task tidak perlu meniru urutan SQL di Python
+        self.virtual_mode = self.total_rows > VIRTUAL_THRESHOLD or not self.view.is_default()
+        
+        if self.virtual_mode:
+            # Scrollbar dikendalikan manual sesuai posisi jendela
+            self.tree.configure(yscrollcommand="")
+            self.scrollbar.config(command=self.on_virtual_scroll)
+            self.window_rows = []
+            self.load_window(0)
+            self.update_status_bar()
+            return
         
-        total = len(rows)
-        completed = 0
-        overdue = 0
+        self.tree.configure(yscrollcommand=self.on_tree_scroll)
+        self.scrollbar.config(command=self.tree.yview)
         
+        # Halaman pertama langsung ditampilkan; sisa daftar dimuat per potongan saat
+        # Tk idle, jadi jendela tidak menunggu ribuan insert Treeview
+        limit = self.visible_rows + VIRTUAL_BUFFER
+        self.append_rows(self.store.list_tasks(limit), limit)
+        self.update_status_bar()
+    
+    def append_rows(self, rows, limit):
+        """Tambahkan baris urut di akhir Treeview; jadwalkan potongan berikutnya jika masih ada"""
         for row in rows:
-            task_id, task, priority, status, created_date, deadline_date, deadline_time, notes = row
-            
-            # Format deadline untuk display
-            try:
-                deadline_dt = datetime.strptime(f"{deadline_date} {deadline_time}", "%Y-%m-%d %H:%M")
-                deadline_display = deadline_dt.strftime("%d/%m/%Y %H:%M")
-            except:
-                deadline_display = "Tidak ada"
-            
-            # Format created date
-            try:
-                created_dt = datetime.strptime(created_date, "%Y-%m-%d %H:%M")
-                created_display = created_dt.strftime("%d/%m/%Y %H:%M")
-            except:
-                created_display = created_date
-
-            # Cek status notes apakah ada atau tidak
-            current_tags = []
+            task_id = row[0]
+            # Sudah dimuat tetapi deadline-nya baru dipindah ke belakang;
+            # posisinya diperbaiki oleh refresh_task/refresh_tasks
+            if task_id in self.task_items:
+                continue
+            values, tags = self.format_task(row, len(self.sorted_keys) + 1)
+            self.task_items[task_id] = self.tree.insert("", tk.END, iid=task_id, values=values, tags=tags)
+            self.task_keys[task_id] = self.sort_key(task_id, row[4])
+            self.sorted_keys.append(self.task_keys[task_id])
+        
+        if len(rows) == limit:
+            self.load_key = self.row_key(rows[-1])
+            self.load_job = self.root.after_idle(self.load_more_rows)
+    
+    @traced("widget")
+    def load_more_rows(self):
+        """Muat potongan berikutnya dari daftar mode penuh (keyset setelah baris terakhir)"""
+        self.load_job = None
+        self.append_rows(self.store.tasks_after(self.load_key, LOAD_CHUNK_ROWS), LOAD_CHUNK_ROWS)
+    
+    def finish_loading(self):
+        """Muat sisa daftar sekarang juga, agar bisect pada sorted_keys melihat semua baris"""
+        while self.load_job is not None:
+            self.root.after_cancel(self.load_job)
+            self.load_more_rows()
+    
+    @traced("widget")
+    def refresh_task(self, task_id):
+        """Terapkan perubahan satu tugas ke Treeview (insert, update, atau pindah posisi)"""
+        self.scheduler.track(task_id)
+        self.calendar.invalidate()
+        if self.search_query:
+            self.run_search()
+            return
+        if self.virtual_mode:
+            self.refresh_window()
+            return
+        
+        self.finish_loading()
+        row = self.store.get_task(task_id)
+        if row is None:
+            self.remove_task_row(task_id)
+            return
+        
+        key = self.sort_key(task_id, row[4])
+        old_key = self.task_keys.get(task_id)
+        if old_key is not None:
+            old_index = bisect.bisect_left(self.sorted_keys, old_key)
+            del self.sorted_keys[old_index]
+        
+        index = bisect.bisect_left(self.sorted_keys, key)
+        self.sorted_keys.insert(index, key)
+        values, tags = self.format_task(row, index + 1)
+        
+        if old_key is None:
+            # Baris baru: sisipkan langsung di posisi urutnya
+            self.task_items[task_id] = self.tree.insert("", index, iid=task_id, values=values, tags=tags)
+            self.schedule_numbering()
+        else:
+            item = self.task_items[task_id]
+            self.tree.item(item, values=values, tags=tags)
             
-            # Tentukan tag berdasarkan status dan deadline
-            if status == "Selesai":
-                current_tags.append("completed")
-                completed += 1
-            elif self.is_overdue(deadline_date, deadline_time, status):
-                current_tags.append("overdue")
-                overdue += 1
+            # Pindahkan baris hanya jika posisinya berubah
+            if old_index != index:
+                self.tree.move(item, "", index)
+                self.schedule_numbering()
+        
+        self.task_keys[task_id] = key
+        self.update_status_bar()
+    
+    @traced("widget")
+    def remove_task_row(self, task_id):
+        """Hapus satu baris dari Treeview tanpa memuat ulang daftar"""
+        self.scheduler.track(task_id)
+        self.calendar.invalidate()
+        if self.search_query:
+            self.run_search()
+            return
+        if self.virtual_mode:
+            self.refresh_window()
+            return
+        
+        item = self.task_items.pop(task_id, None)
+        if item is None:
+            return
+        
+        self.tree.delete(item)
+        index = bisect.bisect_left(self.sorted_keys, self.task_keys.pop(task_id))
+        del self.sorted_keys[index]
+        self.schedule_numbering()
+        self.update_status_bar()
+    
+    @traced("widget")
+    def refresh_tasks(self, task_ids):
+        """Terapkan perubahan banyak tugas ke Treeview dalam satu pembaruan"""
+        rows = {task_id: None for task_id in task_ids}
+        rows.update((row[0], row) for row in self.store.get_tasks(list(rows)))
+        self.scheduler.track_rows(rows)
+        self.calendar.invalidate()
+        if self.search_query:
+            self.run_search()
+            return
+        if self.virtual_mode:
+            self.refresh_window()
+            return
+        
+        self.finish_loading()
+        # Baris yang posisinya tetap (selesai, ganti prioritas) cukup diganti nilainya;
+        # sisanya dilepas dulu, baris lain tetap berurutan di antara mereka
+        start = None
+        moved = []
+        for task_id, row in rows.items():
+            old_key = self.task_keys.get(task_id)
+            key = None if row is None else self.sort_key(task_id, row[4])
+            if old_key == key:
+                continue
+            moved.append(task_id)
+            if old_key is None:
+                continue
+            index = bisect.bisect_left(self.sorted_keys, old_key)
+            del self.sorted_keys[index]
+            start = index if start is None else min(start, index)
+            del self.task_keys[task_id]
+            item = self.task_items[task_id]
+            if row is None:
+                del self.task_items[task_id]
+                self.tree.delete(item)
             else:
-                current_tags.append("pending")
-
-            if notes and notes.strip():
-                current_tags.append("has_notes")
-            
-            self.tree.insert(
-                "", 
-                tk.END, 
-                values=(task_id, task, priority, status, deadline_display, created_display),
-                tags=tuple(current_tags)
-            )
+                self.tree.detach(item)
+        
+        for task_id in moved:
+            if rows[task_id] is not None:
+                self.task_keys[task_id] = self.sort_key(task_id, rows[task_id][4])
+                bisect.insort(self.sorted_keys, self.task_keys[task_id])
+        
+        # Pasang kembali dari posisi terkecil, sehingga setiap index sudah final
+        for key in sorted(self.task_keys[task_id] for task_id in moved if rows[task_id] is not None):
+            task_id = key[2]
+            index = bisect.bisect_left(self.sorted_keys, key)
+            start = index if start is None else min(start, index)
+            values, tags = self.format_task(rows[task_id], index + 1)
+            item = self.task_items.get(task_id)
+            if item is None:
+                self.task_items[task_id] = self.tree.insert("", index, iid=task_id, values=values, tags=tags)
+            else:
+                self.tree.item(item, values=values, tags=tags)
+                self.tree.move(item, "", index)
+        
+        if start is not None:
+            self.schedule_numbering()
+        for task_id, row in rows.items():
+            if row is not None and task_id in self.task_items and task_id not in moved:
+                number = bisect.bisect_left(self.sorted_keys, self.task_keys[task_id]) + 1
+                values, tags = self.format_task(row, number)
+                self.tree.item(self.task_items[task_id], values=values, tags=tags)
+        self.update_status_bar()
+    
+    def on_tree_scroll(self, first, last):
+        """yscrollcommand mode penuh: geser scrollbar lalu beri nomor baris yang terlihat"""
+        self.scrollbar.set(first, last)
+        self.schedule_numbering()
+    
+    def schedule_numbering(self):
+        """Jadwalkan number_visible_rows sekali saat Tk idle"""
+        if self.number_job is None:
+            self.number_job = self.root.after_idle(self.number_visible_rows)
+    
+    def number_visible_rows(self):
+        """Perbarui kolom No (nomor urut tampilan) hanya untuk baris yang terlihat"""
+        # Nomor baris di luar layar boleh basi: setiap geseran memanggil ini lagi
+        # lewat on_tree_scroll, jadi satu tambah/hapus cukup menyentuh satu layar,
+        # bukan semua baris di bawahnya. Hasil pencarian diberi nomor oleh sync_rows.
+        self.number_job = None
+        if self.virtual_mode or self.search_query or not self.sorted_keys:
+            return
+        # Posisi pecahan yview bisa meleset satu baris karena pembulatan
+        top = max(0, min(int(self.tree.yview()[0] * len(self.sorted_keys)), len(self.sorted_keys) - 1) - 1)
+        item = self.task_items.get(self.sorted_keys[top][2])
+        if item is None:
+            return
+        number = self.tree.index(item) + 1
+        for _ in range(self.visible_rows + 3):
+            if not item:
+                break
+            self.tree.set(item, "No", number)
+            item = self.tree.next(item)
+            number += 1
+    
+    @traced("widget")
+    def mark_overdue(self, task_ids):
+        """Perbarui baris yang deadline-nya baru lewat tanpa memuat ulang daftar"""
+        if self.search_query:
+            if any(task_id in self.task_items for task_id in task_ids):
+                self.run_search()
+            else:
+                self.update_status_bar()
+            return
+        if self.virtual_mode:
+            # Cache jendela ikut menyimpan status lama, jadi diambil ulang sekali
+            window_ids = {row[0] for row in self.window_rows}
+            # Filter terlambat berubah isinya saat deadline lewat
+            if self.view.overdue or window_ids.intersection(task_ids):
+                self.refresh_window()
+            else:
+                self.update_status_bar()
+            return
         
+        # Posisi baris tidak berubah, cukup nilai dan tag warnanya
+        for task_id in task_ids:
+            item = self.task_items.get(task_id)
+            row = self.store.get_task(task_id) if item is not None else None
+            if row is None:
+                continue
+            number = bisect.bisect_left(self.sorted_keys, self.task_keys[task_id]) + 1
+            values, tags = self.format_task(row, number)
+            self.tree.item(item, values=values, tags=tags)
+        self.update_status_bar()
+    
+    def show_reminder(self, task_ids):
+        """Tampilkan pengingat deadline di footer tanpa dialog yang menghentikan kerja"""
+        rows = [row for row in map(self.store.get_task, task_ids) if row is not None]
+        if not rows:
+            return
+        if len(rows) == 1:
+            text = f"⏰ '{rows[0][1][:40]}' jatuh tempo {rows[0][5]}"
+        else:
+            text = f"⏰ {len(rows)} tugas jatuh tempo dalam {REMINDER_LEAD_MINUTES} menit ke depan"
+        self.reminder_label.config(text=text)
+        self.root.bell()
+        
+        if self.reminder_job is not None:
+            self.root.after_cancel(self.reminder_job)
+        self.reminder_job = self.root.after(REMINDER_SHOW_MS, lambda: self.reminder_label.config(text=""))
+    
+    def update_status_bar(self):
+        """Perbarui footer dari counter di SQLite"""
+        total, completed, overdue = self.store.count_tasks()
         pending = total - completed
-        self.status_label.config(
-            text=f"Total Tugas: {total} | Selesai: {completed} | Belum Selesai: {pending} | Terlambat: {overdue}"
+        text = f"Total Tugas: {total} | Selesai: {completed} | Belum Selesai: {pending} | Terlambat: {overdue}"
+        if self.view.filtered() and not self.search_query:
+            text += f" | Ditampilkan: {self.total_rows}"
+        self.status_label.config(text=text)
+        self.update_undo_menu()
+    
+    def update_undo_menu(self):
+        """Tampilkan operasi yang akan dibatalkan/diulang di menu Edit"""
+        undo_label, redo_label = self.store.journal_labels()
+        self.edit_menu.entryconfig(
+            0,
+            label=f"Undo: {undo_label}" if undo_label else "Undo",
+            state=tk.NORMAL if undo_label else tk.DISABLED
+        )
+        self.edit_menu.entryconfig(
+            1,
+            label=f"Redo: {redo_label}" if redo_label else "Redo",
+            state=tk.NORMAL if redo_label else tk.DISABLED
+        )
+    
+    def undo(self):
+        """Batalkan operasi terakhir (Ctrl+Z)"""
+        self.worker.submit(TodoStore.undo, callback=self.journal_applied)
+    
+    def redo(self):
+        """Ulangi operasi yang terakhir dibatalkan (Ctrl+Y)"""
+        self.worker.submit(TodoStore.redo, callback=self.journal_applied)
+    
+    def journal_applied(self, result):
+        """Terapkan hasil undo/redo ke Treeview hanya untuk tugas yang disentuh"""
+        if result is None:
+            self.root.bell()
+            return
+        _, task_ids = result
+        if len(task_ids) > VIRTUAL_THRESHOLD:
+            # Misalnya undo hapus semua: mode tampilan bisa berubah, jadi muat ulang
+            self.load_tasks()
+        else:
+            self.refresh_tasks(task_ids)
+    
+    def apply_external_changes(self, task_ids):
+        """Terapkan perubahan dari klien atau proses lain; None berarti muat ulang semua"""
+        if task_ids is None or len(task_ids) > VIRTUAL_THRESHOLD:
+            self.load_tasks()
+        else:
+            self.refresh_tasks(task_ids)
+    
+    # ------------------------------------------------------------------
+    # Urutan kolom dan filter
+    # ------------------------------------------------------------------
+    
+    def update_headings(self):
+        """Tandai kolom urut aktif dengan panah arah urutan"""
+        for column, sort in SORT_HEADINGS.items():
+            text = self.heading_texts[column]
+            if sort == self.view.sort:
+                text += " ▼" if self.view.descending else " ▲"
+            self.tree.heading(column, text=text)
+    
+    def sort_by(self, column):
+        """Klik judul kolom: urutkan naik, klik lagi untuk urutan turun"""
+        sort = SORT_HEADINGS[column]
+        descending = sort == self.view.sort and not self.view.descending
+        self.set_view(sort=sort, descending=descending)
+    
+    def apply_filters(self):
+        """Terapkan filter status/prioritas/terlambat/rentang deadline dari form"""
+        try:
+            date_from = parse_date(self.filter_from_entry.get())
+            date_to = parse_date(self.filter_to_entry.get())
+        except ValueError:
+            messagebox.showerror("Error", "Tanggal filter tidak valid! Gunakan DD/MM/YYYY")
+            return
+        
+        status = self.filter_status_var.get()
+        priority = self.filter_priority_var.get()
+        self.set_view(
+            status=None if status == FILTER_ALL else status,
+            priority=None if priority == FILTER_ALL else priority,
+            overdue=self.filter_overdue_var.get(),
+            date_from=date_from,
+            date_to=date_to
+        )
+    
+    def reset_filters(self):
+        """Kosongkan semua filter (urutan kolom tetap)"""
+        self.filter_status_var.set(FILTER_ALL)
+        self.filter_priority_var.set(FILTER_ALL)
+        self.filter_overdue_var.set(False)
+        self.filter_from_entry.delete(0, tk.END)
+        self.filter_to_entry.delete(0, tk.END)
+        self.apply_filters()
+    
+    def set_view(self, **changes):
+        """Ganti urutan/filter lalu muat daftar dari awal"""
+        options = {
+            "sort": self.view.sort,
+            "descending": self.view.descending,
+            "status": self.view.status,
+            "priority": self.view.priority,
+            "overdue": self.view.overdue,
+            "date_from": self.view.date_from,
+            "date_to": self.view.date_to,
+        }
+        options.update(changes)
+        self.view = TaskView(**options)
+        if self.view.is_default():
+            # Kembali ke urutan bawaan: daftar penuh bisa di-update per baris lagi
+            self.view = DEFAULT_VIEW
+        self.update_headings()
+        self.load_tasks()
+    
+    # ------------------------------------------------------------------
+    # Pencarian full-text
+    # ------------------------------------------------------------------
+    
+    def schedule_search(self):
+        """Tunda pencarian sampai pengguna berhenti mengetik sejenak"""
+        if self.search_job is not None:
+            self.root.after_cancel(self.search_job)
+        self.search_job = self.root.after(SEARCH_DELAY_MS, self.apply_search)
+    
+    def apply_search(self):
+        """Masuk, perbarui, atau keluar dari mode hasil pencarian"""
+        self.search_job = None
+        text = self.search_var.get().strip()
+        if text == self.search_query:
+            return
+        
+        if not text:
+            # Kembali ke daftar lengkap
+            self.search_query = ""
+            self.search_info.config(text="")
+            self.load_tasks()
+            return
+        
+        if not self.search_query:
+            # Hasil pencarian sedikit, jadi Treeview kembali ke scroll biasa
+            self.virtual_mode = False
+            self.tree.configure(yscrollcommand=self.on_tree_scroll)
+            self.scrollbar.config(command=self.tree.yview)
+            self.clear_task_rows()
+        self.search_query = text
+        self.run_search()
+    
+    @traced("widget")
+    def run_search(self):
+        """Tampilkan hasil pencarian untuk search_query saat ini"""
+        started = time.perf_counter()
+        rows = self.store.search(self.search_query, view=self.view)
+        elapsed = (time.perf_counter() - started) * 1000
+        
+        self.sync_rows(rows, 1)
+        self.search_info.config(text=f"{len(rows)} hasil ({elapsed:.1f} ms)")
+        self.update_status_bar()
+    
+    # ------------------------------------------------------------------
+    # Mode virtual: Treeview hanya berisi baris yang terlihat di layar
+    # ------------------------------------------------------------------
+    
+    def row_key(self, row):
+        """Kunci urut (nilai kolom urut, id) dari baris hasil query view"""
+        return (row[9], row[0])
+    
+    @traced("widget")
+    def load_window(self, offset):
+        """Muat ulang cache jendela di sekitar posisi offset (untuk lompatan scrollbar)"""
+        offset = max(0, min(offset, self.total_rows - self.visible_rows))
+        start = max(0, offset - VIRTUAL_BUFFER)
+        
+        # OFFSET hanya dipakai untuk lompatan jauh; scroll biasa memakai keyset
+        self.window_rows = self.store.list_tasks(
+            offset - start + self.visible_rows + VIRTUAL_BUFFER, start, view=self.view
         )
+        self.window_start = start
+        self.view_offset = offset
+        self.render_window()
+    
+    @traced("widget")
+    def scroll_window(self, delta):
+        """Geser jendela sebanyak delta baris, memuat halaman baru lewat keyset bila perlu"""
+        if not self.window_rows:
+            return
+        
+        offset = max(0, min(self.view_offset + delta, self.total_rows - self.visible_rows))
+        window_end = self.window_start + len(self.window_rows)
+        
+        # Lompatan jauh lebih murah dimuat ulang daripada dirambati halaman demi halaman
+        if abs(offset - self.view_offset) > VIRTUAL_JUMP:
+            self.load_window(offset)
+            return
+        
+        if offset + self.visible_rows > window_end:
+            more = self.store.tasks_after(
+                self.row_key(self.window_rows[-1]),
+                offset + self.visible_rows - window_end + VIRTUAL_BUFFER,
+                view=self.view
+            )
+            self.window_rows.extend(more)
+            
+            # Buang baris yang sudah jauh di atas agar memori tetap konstan
+            drop = max(0, offset - VIRTUAL_BUFFER - self.window_start)
+            del self.window_rows[:drop]
+            self.window_start += drop
+        elif offset < self.window_start:
+            earlier = self.store.tasks_before(
+                self.row_key(self.window_rows[0]),
+                self.window_start - offset + VIRTUAL_BUFFER,
+                view=self.view
+            )
+            self.window_rows[:0] = earlier
+            self.window_start -= len(earlier)
+            del self.window_rows[offset - self.window_start + self.visible_rows + VIRTUAL_BUFFER:]
+        
+        # Data bisa lebih pendek dari perkiraan (misalnya baris dihapus proses lain)
+        window_end = self.window_start + len(self.window_rows)
+        self.view_offset = max(self.window_start, min(offset, window_end - self.visible_rows))
+        self.render_window()
+    
+    @traced("widget")
+    def refresh_window(self):
+        """Ambil ulang jendela yang sedang tampil setelah ada perubahan data"""
+        self.total_rows = self.store.count_view(self.view)
+        
+        rows = []
+        if self.window_rows:
+            rows = self.store.tasks_after(
+                self.row_key(self.window_rows[0]),
+                self.view_offset - self.window_start + self.visible_rows + VIRTUAL_BUFFER,
+                inclusive=True,
+                view=self.view
+            )
+        
+        if len(rows) < self.view_offset - self.window_start + self.visible_rows:
+            # Jendela kehabisan baris di akhir tabel, posisikan ulang
+            self.load_window(self.view_offset)
+        else:
+            self.window_rows = rows
+            self.render_window()
+        self.update_status_bar()
+    
+    def render_window(self):
+        """Tampilkan baris yang terlihat dan atur posisi scrollbar"""
+        first = self.view_offset - self.window_start
+        self.sync_rows(self.window_rows[first:first + self.visible_rows], self.view_offset + 1)
+        
+        if self.total_rows:
+            self.scrollbar.set(
+                self.view_offset / self.total_rows,
+                min(1.0, (self.view_offset + self.visible_rows) / self.total_rows)
+            )
+        else:
+            self.scrollbar.set(0.0, 1.0)
+    
+    @traced("widget")
+    def sync_rows(self, rows, first_number):
+        """Samakan isi Treeview dengan daftar baris, hanya mengubah item yang berbeda"""
+        wanted = {row[0] for row in rows}
+        for task_id in [task_id for task_id in self.task_items if task_id not in wanted]:
+            self.tree.delete(self.task_items.pop(task_id))
+            del self.task_rows[task_id]
+        
+        for index, row in enumerate(rows):
+            task_id = row[0]
+            number = first_number + index
+            item = self.task_items.get(task_id)
+            if item is None:
+                values, tags = self.format_task(row, number)
+                self.task_items[task_id] = self.tree.insert("", index, iid=task_id, values=values, tags=tags)
+            else:
+                if self.task_rows[task_id] != (row, number):
+                    values, tags = self.format_task(row, number)
+                    self.tree.item(item, values=values, tags=tags)
+                if self.tree.index(item) != index:
+                    self.tree.move(item, "", index)
+            self.task_rows[task_id] = (row, number)
+    
+    def on_virtual_scroll(self, *args):
+        """Handler scrollbar pada mode virtual"""
+        if args[0] == "moveto":
+            # Gabungkan event drag beruntun menjadi satu query per siklus idle
+            self.pending_moveto = float(args[1])
+            if self.moveto_job is None:
+                self.moveto_job = self.root.after_idle(self.apply_moveto)
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self.visible_rows
+            self.scroll_window(step)
+    
+    def apply_moveto(self):
+        """Terapkan posisi scrollbar terakhir hasil drag"""
+        self.moveto_job = None
+        offset = int(self.pending_moveto * self.total_rows)
+        if self.window_start <= offset and offset + self.visible_rows <= self.window_start + len(self.window_rows):
+            self.view_offset = offset
+            self.render_window()
+        else:
+            self.scroll_window(offset - self.view_offset)
+    
+    def on_mouse_wheel(self, event):
+        """Scroll roda mouse; pada mode virtual digeser manual per baris"""
+        if not self.virtual_mode:
+            return None
+        if event.num == 4 or event.delta > 0:
+            self.scroll_window(-3)
+        else:
+            self.scroll_window(3)
+        return "break"
+    
+    def on_page_key(self, step):
+        """Tombol Page Up/Page Down pada mode virtual"""
+        if not self.virtual_mode:
+            return None
+        self.scroll_window(step * self.visible_rows)
+        return "break"
+    
+    def on_tree_resize(self, event):
+        """Hitung ulang jumlah baris yang muat di layar"""
+        visible = max(1, (event.height - TREE_HEADING_HEIGHT) // TREE_ROW_HEIGHT)
+        if visible != self.visible_rows:
+            self.visible_rows = visible
+            if self.virtual_mode:
+                self.scroll_window(0)
+    
+    def selected_ids(self):
+        """ID semua tugas yang dipilih (Ctrl/Shift+klik untuk memilih banyak)"""
+        return [int(item) for item in self.tree.selection()]
     
     def complete_task(self):
-        """Tandai tugas sebagai selesai"""
+        """Tandai tugas yang dipilih sebagai selesai"""
         selected = self.tree.selection()
         if not selected:
             messagebox.showwarning("Peringatan", "Pilih tugas terlebih dahulu!")
             return
         
-        item = self.tree.item(selected[0])
-        task_id = item['values'][0]
-        current_status = item['values'][3]
-        
-        if current_status == "Selesai":
+        task_ids = [int(item) for item in selected if self.tree.set(item, "Status") != "Selesai"]
+        if not task_ids:
             messagebox.showinfo("Info", "Tugas sudah selesai!")
             return
         
-        completed_date = datetime.now().strftime("%Y-%m-%d %H:%M")
-        self.cursor.execute(
-            "UPDATE tasks SET status = ?, completed_date = ? WHERE id = ?",
-            ("Selesai", completed_date, task_id)
-        )
-        self.conn.commit()
+        if len(selected) == 1:
+            # Tugas berulang (ditandai ↻) tidak selesai, deadline-nya maju ke kejadian berikutnya
+            recurring = self.tree.set(selected[0], "Deadline").endswith("↻")
+            
+            def task_completed(_):
+                self.refresh_task(task_ids[0])
+                if recurring:
+                    messagebox.showinfo("Sukses", "Tugas berulang dijadwalkan ke deadline berikutnya!")
+                else:
+                    messagebox.showinfo("Sukses", "Tugas ditandai selesai!")
+            
+            self.worker.submit(TodoStore.complete_task, task_ids[0], callback=task_completed)
+            return
         
-        self.load_tasks()
-        messagebox.showinfo("Sukses", "Tugas ditandai selesai!")
+        def tasks_completed(count):
+            self.refresh_tasks(task_ids)
+            messagebox.showinfo("Sukses", f"{count} tugas ditandai selesai!")
+        
+        self.worker.submit(TodoStore.complete_tasks, task_ids, callback=tasks_completed)
     
     def edit_task(self):
         """Edit tugas yang dipilih"""
@@ -582,22 +1954,20 @@ class TodoApp:
         if not selected:
             messagebox.showwarning("Peringatan", "Pilih tugas terlebih dahulu!")
             return
+        if len(selected) > 1:
+            self.edit_tasks(self.selected_ids())
+            return
         
-        item = self.tree.item(selected[0])
-        task_id = item['values'][0]
-        current_task = item['values'][1]
+        task_id = int(selected[0])
+        current_task = self.tree.set(selected[0], "Tugas")
         
         # Get current deadline
-        self.cursor.execute(
-            "SELECT deadline_date, deadline_time FROM tasks WHERE id = ?",
-            (task_id,)
-        )
-        deadline_data = self.cursor.fetchone()
+        deadline_data = self.store.get_deadline(task_id)
         
         # Dialog edit
         edit_window = tk.Toplevel(self.root)
         edit_window.title("Edit Tugas")
-        edit_window.geometry("450x240")
+        edit_window.geometry("450x280")
         edit_window.resizable(False, False)
         
         tk.Label(edit_window, text="Edit Tugas:", font=("Arial", 10, "bold")).pack(pady=10)
@@ -709,6 +2079,30 @@ class TodoApp:
         )
         minute_edit_spin.pack(side=tk.LEFT)
         
+        # Aturan berulang: tidak diubah selama pilihan awal tidak diganti
+        repeat_edit_frame = tk.Frame(deadline_frame)
+        repeat_edit_frame.pack(pady=5)
+        
+        tk.Label(repeat_edit_frame, text="Ulangi:", font=("Arial", 10, "bold")).pack(side=tk.LEFT)
+        
+        current_repeat = "Tidak"
+        if deadline_data and deadline_data[2]:
+            try:
+                current_repeat = describe_rule(deadline_data[2])
+            except ValueError:
+                current_repeat = deadline_data[2]
+        repeat_choices = list(REPEAT_CHOICES)
+        if current_repeat not in REPEAT_CHOICES:
+            repeat_choices.insert(0, current_repeat)
+        edit_repeat_var = tk.StringVar(value=current_repeat)
+        ttk.Combobox(
+            repeat_edit_frame,
+            textvariable=edit_repeat_var,
+            values=repeat_choices,
+            state="readonly",
+            width=28
+        ).pack(side=tk.LEFT, padx=5)
+        
         def save_edit():
             new_task = edit_entry.get().strip()
             if not new_task:
@@ -717,25 +2111,26 @@ class TodoApp:
             
             # Validasi tanggal
             try:
-                day = int(edit_day_var.get())
-                month = int(edit_month_var.get())
-                year = int(edit_year_var.get())
-                datetime(year, month, day)
+                new_deadline_date, new_deadline_time = parse_deadline(
+                    f"{edit_year_var.get()}-{edit_month_var.get()}-{edit_day_var.get()}",
+                    f"{edit_hour_var.get()}:{edit_minute_var.get()}"
+                )
             except ValueError:
                 messagebox.showerror("Error", "Tanggal tidak valid!")
                 return
             
-            new_deadline_date = f"{year}-{month:02d}-{day:02d}"
-            new_deadline_time = f"{edit_hour_var.get().zfill(2)}:{edit_minute_var.get().zfill(2)}"
+            repeat = edit_repeat_var.get()
+            recurrence = None if repeat == current_repeat else REPEAT_CHOICES[repeat]
+            
+            def task_updated(_):
+                self.refresh_task(task_id)
+                messagebox.showinfo("Sukses", "Tugas berhasil diupdate!")
             
-            self.cursor.execute(
-                "UPDATE tasks SET task = ?, deadline_date = ?, deadline_time = ? WHERE id = ?",
-                (new_task, new_deadline_date, new_deadline_time, task_id)
+            self.worker.submit(
+                TodoStore.update_task, task_id, new_task, new_deadline_date, new_deadline_time, recurrence,
+                callback=task_updated
             )
-            self.conn.commit()
-            self.load_tasks()
             edit_window.destroy()
-            messagebox.showinfo("Sukses", "Tugas berhasil diupdate!")
         
         tk.Button(
             edit_window, 
@@ -747,6 +2142,86 @@ class TodoApp:
             cursor="hand2"
         ).pack(pady=10)
     
+    def edit_tasks(self, task_ids):
+        """Ubah prioritas dan/atau deadline banyak tugas sekaligus"""
+        edit_window = tk.Toplevel(self.root)
+        edit_window.title("Edit Tugas")
+        edit_window.geometry("380x220")
+        edit_window.resizable(False, False)
+        
+        tk.Label(
+            edit_window,
+            text=f"Edit {len(task_ids)} tugas terpilih",
+            font=("Arial", 10, "bold")
+        ).pack(pady=10)
+        
+        form = tk.Frame(edit_window)
+        form.pack(pady=5)
+        
+        tk.Label(form, text="Prioritas:", font=("Arial", 10)).grid(row=0, column=0, sticky=tk.W, pady=5)
+        priority_var = tk.StringVar(value="Tetap")
+        ttk.Combobox(
+            form,
+            textvariable=priority_var,
+            values=("Tetap",) + PRIORITIES,
+            state="readonly",
+            width=10
+        ).grid(row=0, column=1, sticky=tk.W, padx=5)
+        
+        reschedule_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            form,
+            text="Deadline baru:",
+            variable=reschedule_var,
+            font=("Arial", 10)
+        ).grid(row=1, column=0, sticky=tk.W, pady=5)
+        
+        date_entry = tk.Entry(form, width=12, font=("Arial", 10))
+        date_entry.grid(row=1, column=1, sticky=tk.W, padx=5)
+        date_entry.insert(0, datetime.now().strftime("%d/%m/%Y"))
+        time_entry = tk.Entry(form, width=6, font=("Arial", 10))
+        time_entry.grid(row=1, column=2, sticky=tk.W)
+        time_entry.insert(0, "12:00")
+        
+        def save_edit():
+            priority = priority_var.get()
+            deadline = None
+            if reschedule_var.get():
+                try:
+                    # Tanggal kosong menjadi "" agar ditolak parse_deadline
+                    deadline = parse_deadline(parse_date(date_entry.get()) or "", time_entry.get().strip())
+                except ValueError:
+                    messagebox.showerror("Error", "Tanggal tidak valid!")
+                    return
+            if priority == "Tetap" and deadline is None:
+                edit_window.destroy()
+                return
+            
+            def tasks_updated(_):
+                self.refresh_tasks(task_ids)
+                messagebox.showinfo("Sukses", f"{len(task_ids)} tugas berhasil diupdate!")
+            
+            # Satu method TodoStore (satu RPC di mode klien), jadi prioritas dan
+            # deadline berhasil atau gagal bersama sebagai satu entri Undo
+            self.worker.submit(
+                TodoStore.update_tasks,
+                task_ids,
+                None if priority == "Tetap" else priority,
+                *(deadline or (None, None)),
+                callback=tasks_updated
+            )
+            edit_window.destroy()
+        
+        tk.Button(
+            edit_window,
+            text="Simpan",
+            command=save_edit,
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 10),
+            cursor="hand2"
+        ).pack(pady=10)
+    
     def delete_task(self):
         """Hapus tugas yang dipilih"""
         selected = self.tree.selection()
@@ -754,38 +2229,414 @@ class TodoApp:
             messagebox.showwarning("Peringatan", "Pilih tugas terlebih dahulu!")
             return
         
+        if len(selected) > 1:
+            task_ids = self.selected_ids()
+            if messagebox.askyesno("Konfirmasi", f"Yakin ingin menghapus {len(task_ids)} tugas terpilih?"):
+                def tasks_deleted(count):
+                    self.refresh_tasks(task_ids)
+                    messagebox.showinfo("Sukses", f"{count} tugas berhasil dihapus!")
+                
+                self.worker.submit(TodoStore.delete_tasks, task_ids, callback=tasks_deleted)
+            return
+        
         if messagebox.askyesno("Konfirmasi", "Yakin ingin menghapus tugas ini?"):
-            item = self.tree.item(selected[0])
-            task_id = item['values'][0]
+            task_id = int(selected[0])
             
-            self.cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
-            self.conn.commit()
+            def task_deleted(_):
+                self.remove_task_row(task_id)
+                messagebox.showinfo("Sukses", "Tugas berhasil dihapus!")
             
-            # Reset ID setelah hapus
-            self.reorder_ids()
-            
-            self.load_tasks()
-            messagebox.showinfo("Sukses", "Tugas berhasil dihapus!")
+            # ID tugas lain tetap stabil, hanya nomor urut tampilan yang bergeser
+            self.worker.submit(TodoStore.delete_task, task_id, callback=task_deleted)
     
     def clear_all(self):
         """Hapus semua tugas"""
         if messagebox.askyesno("Konfirmasi", "Yakin ingin menghapus SEMUA tugas?"):
-            self.cursor.execute("DELETE FROM tasks")
-            self.conn.commit()
-            
-            # Reset autoincrement
-            self.reset_autoincrement()
+            def all_cleared(_):
+                # Tabel sudah kosong, jadi resync di sini murah
+                self.load_tasks()
+                messagebox.showinfo("Sukses", "Semua tugas berhasil dihapus! (Ctrl+Z untuk membatalkan)")
             
+            self.worker.submit(TodoStore.clear_all, callback=all_cleared)
+    
+    def import_tasks(self):
+        """Import tugas dari file CSV/JSONL lewat DatabaseWorker"""
+        from tkinter import filedialog
+        path = filedialog.askopenfilename(title="Import Tugas", filetypes=IMPORT_FILETYPES)
+        if not path:
+            return
+        
+        def tasks_imported(stats):
             self.load_tasks()
-            messagebox.showinfo("Sukses", "Semua tugas berhasil dihapus!")
+            message = f"Import selesai: {throughput(stats['imported'], stats['seconds'])}"
+            if stats["skipped"]:
+                message += f"\n\n{stats['skipped']} baris dilewati:\n" + "\n".join(stats["errors"])
+            messagebox.showinfo("Import", message)
+        
+        def import_failed(exc):
+            messagebox.showerror("Error", f"Gagal mengimport file: {exc}")
+        
+        # Satu pekerjaan worker = satu transaksi; gagal di tengah berarti tidak ada yang masuk
+        self.worker.submit(TodoStore.import_tasks, path, callback=tasks_imported, errback=import_failed)
+    
+    def export_tasks(self):
+        """Export semua tugas ke file CSV/JSONL lewat DatabaseWorker"""
+        from tkinter import filedialog
+        path = filedialog.asksaveasfilename(
+            title="Export Tugas", defaultextension=".csv", filetypes=IMPORT_FILETYPES
+        )
+        if not path:
+            return
+        
+        def tasks_exported(stats):
+            messagebox.showinfo("Export", f"Export selesai: {throughput(stats['exported'], stats['seconds'])}")
+        
+        def export_failed(exc):
+            messagebox.showerror("Error", f"Gagal mengexport file: {exc}")
+        
+        # Dijalankan setelah tulisan yang masih antre, jadi isi file selalu terbaru
+        self.worker.submit(TodoStore.export_tasks, path, callback=tasks_exported, errback=export_failed)
+    
+    def start_maintenance(self):
+        """Jalankan pemeliharaan database di thread latar lalu jadwalkan yang berikutnya"""
+        # Tugas yang diarsipkan sampai ke Treeview lewat LocalChangeFeed (penanda
+        # perubahan massal dari delete_bulk), jadi thread ini tidak menyentuh Tk
+        # Putaran sebelumnya yang masih berjalan (file besar, disk lambat) tidak ditumpuk
+        if self.maintenance_thread is None or not self.maintenance_thread.is_alive():
+            self.maintenance_thread = threading.Thread(target=maintain_database, args=(DB_PATH,), daemon=True)
+            self.maintenance_thread.start()
+        self.maintenance_job = self.root.after(MAINTENANCE_INTERVAL_MS, self.start_maintenance)
+    
+    def open_archive(self):
+        """Cari tugas selesai yang sudah dipindah ke arsip (hanya baca)"""
+        archive_window = tk.Toplevel(self.root)
+        archive_window.title("Arsip Tugas Selesai")
+        archive_window.geometry("760x420")
+        
+        search_frame = tk.Frame(archive_window)
+        search_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Label(search_frame, text="🔍 Cari di arsip:", font=("Arial", 10, "bold")).pack(side=tk.LEFT, padx=5)
+        archive_var = tk.StringVar()
+        archive_entry = tk.Entry(search_frame, textvariable=archive_var, width=40, font=("Arial", 10))
+        archive_entry.pack(side=tk.LEFT, padx=5)
+        archive_entry.focus()
+        info_label = tk.Label(search_frame, text="", fg="#7f8c8d", font=("Arial", 8, "italic"))
+        info_label.pack(side=tk.LEFT, padx=10)
+        
+        columns = ("ID", "Tugas", "Prioritas", "Deadline", "Selesai", "Diarsipkan")
+        archive_tree = ttk.Treeview(archive_window, columns=columns, show="headings", height=14)
+        for column in columns:
+            archive_tree.heading(column, text=column)
+            if column == "Tugas":
+                archive_tree.column(column, width=260)
+            else:
+                archive_tree.column(column, width=95, anchor="center")
+        archive_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        
+        search_job = None
+        
+        def run_search():
+            nonlocal search_job
+            search_job = None
+            started = time.perf_counter()
+            rows = self.store.search_archive(archive_var.get())
+            elapsed = (time.perf_counter() - started) * 1000
+            archive_tree.delete(*archive_tree.get_children())
+            for row in rows:
+                archive_tree.insert("", tk.END, values=row)
+            label = "terbaru" if not archive_var.get().strip() else "hasil"
+            info_label.config(text=f"{len(rows)} {label} ({elapsed:.1f} ms)")
+        
+        def schedule_search(*args):
+            nonlocal search_job
+            if search_job is not None:
+                archive_window.after_cancel(search_job)
+            search_job = archive_window.after(SEARCH_DELAY_MS, run_search)
+        
+        archive_var.trace_add("write", schedule_search)
+        run_search()
+    
+    def open_calendar(self):
+        """Kalender bulan/minggu: jumlah dan judul tugas per hari deadline"""
+        if self.calendar_window is not None and self.calendar_window.winfo_exists():
+            self.calendar_window.lift()
+            return
+        # Modul calendar hanya dibutuhkan jendela ini
+        import calendar
+        month_weeks = calendar.Calendar().monthdatescalendar
+        
+        calendar_window = tk.Toplevel(self.root)
+        calendar_window.title("Kalender Tugas")
+        calendar_window.geometry("980x640")
+        self.calendar_window = calendar_window
+        
+        nav_frame = tk.Frame(calendar_window)
+        nav_frame.pack(fill=tk.X, padx=10, pady=10)
+        tk.Button(nav_frame, text="◀", width=3, command=lambda: move(-1)).pack(side=tk.LEFT)
+        title_label = tk.Label(nav_frame, text="", width=24, font=("Arial", 13, "bold"))
+        title_label.pack(side=tk.LEFT, padx=5)
+        tk.Button(nav_frame, text="▶", width=3, command=lambda: move(1)).pack(side=tk.LEFT)
+        tk.Button(nav_frame, text="Hari Ini", command=lambda: go_to(date.today())).pack(side=tk.LEFT, padx=10)
+        mode_var = tk.StringVar(value="Bulan")
+        for mode in ("Bulan", "Minggu"):
+            tk.Radiobutton(nav_frame, text=mode, variable=mode_var, value=mode,
+                           command=lambda: render()).pack(side=tk.LEFT)
+        info_label = tk.Label(nav_frame, text="", fg="#7f8c8d", font=("Arial", 8, "italic"))
+        info_label.pack(side=tk.RIGHT)
+        
+        grid_frame = tk.Frame(calendar_window)
+        grid_frame.pack(fill=tk.BOTH, expand=True, padx=10)
+        for column, name in enumerate(DAY_NAMES):
+            tk.Label(grid_frame, text=name, bg="#2c3e50", fg="white",
+                     font=("Arial", 9, "bold")).grid(row=0, column=column, sticky="nsew")
+            grid_frame.columnconfigure(column, weight=1, uniform="day")
+        # 6 minggu x 7 hari; tampilan minggu hanya memakai baris pertama
+        cells = []
+        for index in range(42):
+            cell = tk.Label(grid_frame, text="", anchor="nw", justify=tk.LEFT, relief=tk.RIDGE,
+                            bd=1, padx=4, pady=2, font=("Arial", 8))
+            cell.grid(row=index // 7 + 1, column=index % 7, sticky="nsew")
+            cell.bind("<Double-Button-1>", lambda e, index=index: show_day(index))
+            cells.append(cell)
+        tk.Label(
+            calendar_window,
+            text="Klik dua kali sebuah hari untuk menampilkan tugasnya di daftar",
+            fg="#7f8c8d",
+            font=("Arial", 8, "italic")
+        ).pack(pady=5)
+        
+        shown = []
+        anchor = date.today()
+        
+        def visible_days(day):
+            """Tanggal yang tampil untuk bulan/minggu yang memuat day"""
+            if mode_var.get() == "Bulan":
+                return [cell_day for week in month_weeks(day.year, day.month) for cell_day in week]
+            start = day - timedelta(days=day.weekday())
+            return [start + timedelta(days=offset) for offset in range(7)]
+        
+        def shifted(day, step):
+            """Tanggal di bulan/minggu sebelah"""
+            if mode_var.get() == "Minggu":
+                return day + timedelta(days=7 * step)
+            month = day.year * 12 + day.month - 1 + step
+            return date(month // 12, month % 12 + 1, 1)
+        
+        def range_key(day):
+            days = visible_days(day)
+            titles = CALENDAR_MONTH_TITLES if mode_var.get() == "Bulan" else CALENDAR_WEEK_TITLES
+            return days[0].isoformat(), days[-1].isoformat(), titles
+        
+        def cell_text(day, entry):
+            lines = [str(day.day)]
+            if entry is None:
+                return lines[0]
+            count, completed, _, items = entry
+            lines[0] += f"    {count} tugas" + (f", {completed} selesai" if completed else "")
+            for _, time_text, task, state in items:
+                if len(task) > CALENDAR_TITLE_CHARS:
+                    task = task[:CALENDAR_TITLE_CHARS - 1] + "…"
+                mark = "✓" if state == "completed" else "!" if state == "overdue" else "•"
+                lines.append(f"{mark} {time_text} {task}")
+            if count > len(items):
+                lines.append(f"+{count - len(items)} lainnya")
+            return "\n".join(lines)
+        
+        def render():
+            """Gambar bulan/minggu anchor dari cache (satu query jika belum ada), lalu prefetch tetangga"""
+            if not calendar_window.winfo_exists():
+                return
+            shown[:] = visible_days(anchor)
+            key = range_key(anchor)
+            cached = key in self.calendar.ranges
+            started = time.perf_counter()
+            days = self.calendar.get(*key)
+            elapsed = (time.perf_counter() - started) * 1000
+            
+            today = date.today()
+            month_view = mode_var.get() == "Bulan"
+            for index, cell in enumerate(cells):
+                if index >= len(shown):
+                    cell.grid_remove()
+                    continue
+                day = shown[index]
+                entry = days.get(day.isoformat())
+                outside = month_view and day.month != anchor.month
+                if outside:
+                    fg = "#95a5a6"
+                elif entry is not None and entry[2]:
+                    fg = "#c0392b"
+                elif entry is not None and entry[1] == entry[0]:
+                    fg = "#27ae60"
+                else:
+                    fg = "#2c3e50"
+                bg = "#d6eaf8" if day == today else "#f4f6f6" if outside else "white"
+                cell.config(text=cell_text(day, entry), fg=fg, bg=bg)
+                cell.grid()
+            for row in range(1, 7):
+                grid_frame.rowconfigure(row, weight=1 if row <= len(shown) // 7 else 0)
+            
+            if month_view:
+                title_label.config(text=f"{MONTH_NAMES[anchor.month - 1]} {anchor.year}")
+            else:
+                title_label.config(text=f"{shown[0]:%d/%m} - {shown[-1]:%d/%m/%Y}")
+            info_label.config(text="dari cache" if cached else f"{elapsed:.1f} ms")
+            # Bulan/minggu sebelah biasanya dibuka berikutnya
+            self.calendar.prefetch([range_key(shifted(anchor, -1)), range_key(shifted(anchor, 1))])
+        
+        def go_to(day):
+            nonlocal anchor
+            anchor = day
+            render()
+        
+        def move(step):
+            go_to(shifted(anchor, step))
+        
+        def show_day(index):
+            """Filter daftar utama ke tugas berdeadline di hari itu"""
+            if index >= len(shown):
+                return
+            text = f"{shown[index]:%d/%m/%Y}"
+            for entry in (self.filter_from_entry, self.filter_to_entry):
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+            self.apply_filters()
+            self.root.lift()
+        
+        def close():
+            self.calendar.on_change = None
+            self.calendar_window = None
+            calendar_window.destroy()
+        
+        calendar_window.protocol("WM_DELETE_WINDOW", close)
+        calendar_window.bind("<Left>", lambda e: move(-1))
+        calendar_window.bind("<Right>", lambda e: move(1))
+        calendar_window.bind("<Home>", lambda e: go_to(date.today()))
+        self.calendar.on_change = render
+        render()
+    
+    def set_busy(self, busy):
+        """Tampilkan indikator sibuk selama DatabaseWorker masih memproses antrean"""
+        self.busy_label.config(text="⏳ Menyimpan..." if busy else "")
+        self.root.config(cursor="watch" if busy else "")
+    
+    def show_db_error(self, exc):
+        """Tampilkan error dari operasi database di background"""
+        messagebox.showerror("Error", f"Gagal menyimpan ke database: {exc}")
+    
+    def open_profiler(self):
+        """Panel ringkasan instrumentasi: waktu per operasi, statement SQL, dan baris"""
+        profiler_window = tk.Toplevel(self.root)
+        profiler_window.title("Profiling")
+        profiler_window.geometry("820x420")
+        
+        columns = ("Kategori", "Operasi", "Jumlah", "Total", "Rata2", "Maks", "Baris", "SQL")
+        stats_tree = ttk.Treeview(profiler_window, columns=columns, show="headings", height=14)
+        headings = {
+            "Total": "Total (ms)", "Rata2": "Rata-rata (ms)", "Maks": "Maks (ms)", "SQL": "Statement SQL",
+        }
+        for column in columns:
+            stats_tree.heading(column, text=headings.get(column, column))
+            if column == "Operasi":
+                stats_tree.column(column, width=240)
+            else:
+                stats_tree.column(column, width=75, anchor="center")
+        stats_tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        sql_label = tk.Label(profiler_window, text="", fg="#7f8c8d", font=("Arial", 9), anchor="w")
+        sql_label.pack(fill=tk.X, padx=10)
+        
+        def refresh():
+            if not profiler_window.winfo_exists():
+                return
+            stats_tree.delete(*stats_tree.get_children())
+            for row in PROFILER.summary():
+                stats_tree.insert("", tk.END, values=(
+                    row["category"], row["name"], row["count"], f"{row['total_ms']:.1f}",
+                    f"{row['avg_ms']:.2f}", f"{row['max_ms']:.1f}", row["rows"], row["statements"],
+                ))
+            counts = PROFILER.statement_counts()
+            sql_label.config(
+                text="SQL: " + (" | ".join(f"{kind} {count}" for kind, count in counts.items()) or "-")
+            )
+            profiler_window.after(PROFILER_REFRESH_MS, refresh)
+        
+        def reset():
+            PROFILER.reset()
+            stats_tree.delete(*stats_tree.get_children())
+        
+        def save_trace():
+            from tkinter import filedialog
+            path = filedialog.asksaveasfilename(
+                parent=profiler_window, title="Simpan Trace", defaultextension=".json",
+                filetypes=[("Chrome Trace", "*.json")]
+            )
+            if path:
+                written = PROFILER.write_trace(path)
+                messagebox.showinfo("Profiling", f"{written} span disimpan ke {path}", parent=profiler_window)
+        
+        btn_frame = tk.Frame(profiler_window)
+        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        
+        tk.Button(
+            btn_frame,
+            text="💾 Simpan Trace...",
+            command=save_trace,
+            bg="#27ae60",
+            fg="white",
+            font=("Arial", 9),
+            cursor="hand2",
+            padx=10
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            btn_frame,
+            text="Reset",
+            command=reset,
+            bg="#e67e22",
+            fg="white",
+            font=("Arial", 9),
+            cursor="hand2",
+            padx=10
+        ).pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            btn_frame,
+            text="Tutup",
+            command=profiler_window.destroy,
+            bg="#95a5a6",
+            fg="white",
+            font=("Arial", 9),
+            cursor="hand2",
+            padx=10
+        ).pack(side=tk.RIGHT, padx=5)
+        
+        refresh()
+    
+    def on_close(self):
+        """Tunggu antrean tulis selesai sebelum menutup aplikasi"""
+        self.scheduler.cancel()
+        if self.feed is not None:
+            self.feed.stop()
+        if self.maintenance_job is not None:
+            self.root.after_cancel(self.maintenance_job)
+        self.worker.close()
+        self.root.destroy()
     
     def __del__(self):
         """Tutup koneksi database saat aplikasi ditutup"""
-        if hasattr(self, 'conn'):
-            self.conn.close()
+        if hasattr(self, 'store'):
+            self.store.close()
 
 # Main Program
 if __name__ == "__main__":
+    # --server URL: GUI sebagai klien todo_server.py (database dipakai bersama)
+    server_url = None
+    if len(sys.argv) == 3 and sys.argv[1] == "--server":
+        server_url = sys.argv[2]
+    # Argumen baris perintah (add/list/import/...) dijalankan tanpa GUI
+    elif len(sys.argv) > 1:
+        sys.exit(run_cli(sys.argv[1:]))
     root = tk.Tk()
-    app = TodoApp(root)
+    app = TodoApp(root, server_url)
     root.mainloop()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""Uji otomatis pytest; modul proyek diimport dari root repo seperti benchmarks/
+
+Jalankan dari root repo:
+    python -m pytest -q
+"""
+import os
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
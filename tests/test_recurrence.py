@@ -0,0 +1,62 @@
+"""Tugas berulang bulanan: tanggal BYMONTHDAY mengikuti deadline yang dipindah"""
+from datetime import datetime
+
+import pytest
+
+from todo_store import TodoStore, move_rule
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = TodoStore(str(tmp_path / "todo_list.db"))
+    yield store
+    store.close()
+
+
+def recurrence(store, task_id):
+    store.cursor.execute("SELECT recurrence FROM tasks WHERE id = ?", (task_id,))
+    return store.cursor.fetchone()[0]
+
+
+def agenda_dates(store, task_id, date_from, date_to):
+    return [
+        datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M")
+        for timestamp, row in store.agenda(date_from, date_to) if row[0] == task_id
+    ]
+
+
+def test_reschedule_then_complete_monthly(store):
+    task_id = store.add_task("Tagihan", deadline_date="2040-10-15", deadline_time="09:00", recurrence="monthly")
+    assert recurrence(store, task_id) == "FREQ=MONTHLY;BYMONTHDAY=15"
+    
+    assert store.reschedule_tasks([task_id], "2040-10-20", "09:00") == 1
+    assert recurrence(store, task_id) == "FREQ=MONTHLY;BYMONTHDAY=20"
+    assert agenda_dates(store, task_id, "2040-10-01", "2040-12-31") == [
+        "2040-10-20 09:00", "2040-11-20 09:00", "2040-12-20 09:00",
+    ]
+    
+    assert store.complete_task(task_id)
+    assert store.get_deadline(task_id)[:2] == ("2040-11-20", "09:00")
+
+
+def test_update_task_keeps_rule_but_moves_day(store):
+    task_id = store.add_task("Tagihan", deadline_date="2040-10-15", deadline_time="09:00", recurrence="monthly")
+    # recurrence None = aturan tetap (form edit tanpa mengubah pilihan Ulangi)
+    store.update_task(task_id, "Tagihan", "2040-10-03", "08:00")
+    assert recurrence(store, task_id) == "FREQ=MONTHLY;BYMONTHDAY=3"
+    store.update_tasks([task_id], priority="Tinggi", deadline_date="2040-10-25", deadline_time="08:00")
+    assert recurrence(store, task_id) == "FREQ=MONTHLY;BYMONTHDAY=25"
+    store.undo()
+    assert recurrence(store, task_id) == "FREQ=MONTHLY;BYMONTHDAY=3"
+
+
+def test_move_rule():
+    # Tanggal 31 yang dipotong ke akhir Februari tetap dianggap berasal dari deadline
+    assert move_rule("FREQ=MONTHLY;BYMONTHDAY=31", "2041-02-28", "2041-03-05") == "FREQ=MONTHLY;BYMONTHDAY=5"
+    # Tanggal yang sengaja berbeda dari deadline tidak diubah
+    assert move_rule("FREQ=MONTHLY;BYMONTHDAY=15", "2040-10-10", "2040-10-12") == "FREQ=MONTHLY;BYMONTHDAY=15"
+    assert move_rule("FREQ=MONTHLY;INTERVAL=2;BYMONTHDAY=15;UNTIL=20411231", "2040-10-15", "2040-10-20") == (
+        "FREQ=MONTHLY;INTERVAL=2;BYMONTHDAY=20;UNTIL=20411231"
+    )
+    assert move_rule("FREQ=WEEKLY;BYDAY=MO", "2040-10-15", "2040-10-20") == "FREQ=WEEKLY;BYDAY=MO"
+    assert move_rule(None, "2040-10-15", "2040-10-20") is None
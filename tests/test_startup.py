@@ -0,0 +1,90 @@
+"""Waktu startup tanpa Tk: import todo_store, buka database, dan query halaman pertama
+
+Jalur yang sama dengan TodoApp.load_tasks sebelum jendela pertama tergambar
+(count_view, list_tasks halaman pertama, footer, heap deadline), diukur di
+proses Python baru pada database 100k tugas. Bagian GUI-nya diukur
+benchmarks/startup.py yang butuh display.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+from todo_store import STORAGE_PROFILES, TodoStore
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+# Jumlah tugas database uji (jauh di atas VIRTUAL_THRESHOLD)
+ROWS = 100000
+# Target median (ms) dari import pertama sampai halaman pertama terbaca (~10 ms
+# di laptop biasa; longgar agar mesin CI yang lambat tidak gagal palsu)
+STARTUP_TARGET_MS = 100
+RUNS = 5
+# Modul yang sengaja ditunda sampai dipakai (CLI, import/export, worker, server)
+DEFERRED_MODULES = ("tkinter", "argparse", "csv", "concurrent.futures", "asyncio", "http.client")
+
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+sys.path.insert(0, sys.argv[1])
+import todo_store
+imported = time.perf_counter()
+store = todo_store.TodoStore(sys.argv[2])
+total = store.count_view(todo_store.DEFAULT_VIEW)
+rows = store.list_tasks(63)
+store.count_tasks()
+store.upcoming_deadlines((int(time.time()), -1), 500)
+loaded = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "total_ms": (loaded - started) * 1000,
+    "total": total,
+    "rows": len(rows),
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+@pytest.fixture(scope="module")
+def large_db(tmp_path_factory):
+    """Database ROWS tugas (sepertiga selesai, sebagian bercatatan) yang dipakai semua uji di modul ini"""
+    db_path = str(tmp_path_factory.mktemp("startup") / "todo_list.db")
+    store = TodoStore(db_path, STORAGE_PROFILES["cepat"])
+    tasks = [
+        (f"Tugas {i}", "Sedang", "Selesai" if i % 3 == 0 else "Belum Selesai", "2026-01-01 09:00", None,
+         f"2026-{i % 12 + 1:02d}-{i % 28 + 1:02d}", "12:00", None)
+        for i in range(ROWS)
+    ]
+    notes = [(index, f"catatan {index}") for index in range(0, ROWS, 10)]
+    store.insert_batch(tasks, notes)
+    store.cursor.execute("ANALYZE")
+    store.close()
+    return db_path
+
+
+def startup(db_path):
+    """Satu startup di proses baru; kembalikan laporan JSON proses anak"""
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, ROOT, db_path],
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return json.loads(output)
+
+
+def test_first_page_within_target(large_db):
+    # Putaran pertama hanya memanaskan cache file dan .pyc
+    startup(large_db)
+    reports = [startup(large_db) for _ in range(RUNS)]
+    assert reports[0]["total"] == ROWS
+    assert reports[0]["rows"] == 63
+    median_ms = statistics.median(report["total_ms"] for report in reports)
+    assert median_ms <= STARTUP_TARGET_MS, f"startup {median_ms:.1f} ms > {STARTUP_TARGET_MS} ms"
+
+
+def test_rare_modules_not_imported(large_db):
+    loaded = set(startup(large_db)["modules"])
+    assert not loaded & set(DEFERRED_MODULES)
@@ -0,0 +1,239 @@
+"""Instrumentasi opsional: durasi per operasi, jumlah statement SQL, dan jumlah baris
+
+Aktif hanya jika variabel lingkungan TODO_TRACE diisi saat program dimulai:
+    TODO_TRACE=1 python main.py                      # menu Debug > Profiling (F12)
+    TODO_TRACE=1 TODO_TRACE_FILE=trace.json python todo_store.py import tugas.csv
+
+Saat tidak aktif, traced() mengembalikan fungsi aslinya dan span() selalu
+mengembalikan objek kosong yang sama, jadi hot path tidak ikut melambat.
+File trace berformat Chrome Trace Event (buka di chrome://tracing atau Perfetto).
+"""
+import atexit
+import collections
+import functools
+import json
+import os
+import threading
+import time
+
+ENABLED = os.environ.get("TODO_TRACE", "") not in ("", "0")
+# Jika diisi, trace ditulis otomatis ke file ini saat program selesai
+TRACE_FILE = os.environ.get("TODO_TRACE_FILE")
+# Jumlah span terakhir yang disimpan untuk file trace (ringkasan tetap lengkap)
+TRACE_MAX_EVENTS = 200000
+
+# query = baca SQLite, write = tulis SQLite, commit = COMMIT DatabaseWorker,
+# parse = validasi/parsing data masuk, widget = pembaruan Treeview
+CATEGORIES = ("query", "write", "commit", "parse", "widget")
+
+
+class Span:
+    """Satu operasi yang sedang diukur; statements dan rows diisi selama span terbuka"""
+    
+    __slots__ = ("profiler", "name", "category", "args", "started", "statements", "rows")
+    
+    def __init__(self, profiler, name, category, args):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.args = args
+        self.statements = 0
+        self.rows = None
+    
+    def __enter__(self):
+        self.profiler.stack().append(self)
+        self.started = time.perf_counter()
+        return self
+    
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.started
+        self.profiler.stack().pop()
+        self.profiler.add(self.name, self.category, self.started, elapsed,
+                          self.rows, self.statements, self.args)
+        return False
+
+
+class NullSpan:
+    """Pengganti Span saat instrumentasi mati; atribut yang diisi pemanggil diabaikan"""
+    
+    __slots__ = ("rows", "statements")
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+
+
+NULL_SPAN = NullSpan()
+
+
+class Profiler:
+    """Pengumpul span dan counter SQL; aman dipakai dari thread Tk dan DatabaseWorker"""
+    
+    def __init__(self, max_events=TRACE_MAX_EVENTS):
+        self.lock = threading.Lock()
+        self.local = threading.local()
+        self.origin = time.perf_counter()
+        self.max_events = max_events
+        self.reset()
+    
+    def reset(self):
+        """Kosongkan semua span dan counter"""
+        with self.lock:
+            self.events = collections.deque(maxlen=self.max_events)
+            # (kategori, nama) -> [jumlah, total detik, maks detik, baris, statement]
+            self.totals = {}
+            self.statements = collections.Counter()
+            self.threads = {}
+    
+    def stack(self):
+        """Span yang sedang terbuka di thread ini (paling dalam di akhir)"""
+        try:
+            return self.local.stack
+        except AttributeError:
+            self.local.stack = []
+            return self.local.stack
+    
+    def span(self, name, category, args=None):
+        """Span baru untuk dipakai dengan with"""
+        return Span(self, name, category, args)
+    
+    def add(self, name, category, started, elapsed, rows=None, statements=0, args=None):
+        """Catat satu span yang sudah selesai"""
+        thread = threading.current_thread()
+        with self.lock:
+            self.threads[thread.ident] = thread.name
+            self.events.append((name, category, started, elapsed, thread.ident, rows, statements, args))
+            total = self.totals.get((category, name))
+            if total is None:
+                total = self.totals[(category, name)] = [0, 0.0, 0.0, 0, 0]
+            total[0] += 1
+            total[1] += elapsed
+            total[2] = max(total[2], elapsed)
+            total[3] += rows or 0
+            total[4] += statements
+    
+    def on_statement(self, sql):
+        """Callback set_trace_callback: hitung statement per jenis dan per span terbuka"""
+        # Statement di dalam trigger dilaporkan SQLite sebagai komentar "-- ..."
+        kind = "TRIGGER" if sql.startswith("--") else sql.lstrip().split(None, 1)[0].upper()
+        for current in self.stack():
+            current.statements += 1
+        with self.lock:
+            self.statements[kind] += 1
+    
+    def attach(self, conn):
+        """Hitung setiap statement yang dijalankan koneksi ini"""
+        conn.set_trace_callback(self.on_statement)
+    
+    def summary(self):
+        """Ringkasan per operasi, diurutkan dari total waktu terbesar"""
+        with self.lock:
+            totals = [(key, list(value)) for key, value in self.totals.items()]
+        rows = []
+        for (category, name), (count, seconds, longest, row_count, statements) in totals:
+            rows.append({
+                "category": category,
+                "name": name,
+                "count": count,
+                "total_ms": seconds * 1000,
+                "avg_ms": seconds * 1000 / count,
+                "max_ms": longest * 1000,
+                "rows": row_count,
+                "statements": statements,
+            })
+        rows.sort(key=lambda row: row["total_ms"], reverse=True)
+        return rows
+    
+    def statement_counts(self):
+        """Jumlah statement SQL per jenis (SELECT, INSERT, ...)"""
+        with self.lock:
+            return dict(self.statements.most_common())
+    
+    def chrome_trace(self):
+        """Span sebagai dict Chrome Trace Event (event lengkap "X", waktu dalam mikrodetik)"""
+        pid = os.getpid()
+        with self.lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+            statements = dict(self.statements)
+        
+        trace = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        for name, category, started, elapsed, tid, rows, statement_count, args in events:
+            event_args = dict(args or {})
+            event_args["sql"] = statement_count
+            if rows is not None:
+                event_args["rows"] = rows
+            trace.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": round((started - self.origin) * 1e6, 1),
+                "dur": round(elapsed * 1e6, 1),
+                "pid": pid,
+                "tid": tid,
+                "args": event_args,
+            })
+        return {"traceEvents": trace, "displayTimeUnit": "ms", "otherData": {"sql_statements": statements}}
+    
+    def write_trace(self, path):
+        """Tulis trace ke file JSON; kembalikan jumlah span yang ditulis"""
+        trace = self.chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f)
+        return sum(1 for event in trace["traceEvents"] if event["ph"] == "X")
+
+
+PROFILER = Profiler() if ENABLED else None
+
+
+def span(name, category, **args):
+    """Context manager pengukur satu operasi; objek kosong jika instrumentasi mati"""
+    if PROFILER is None:
+        return NULL_SPAN
+    return PROFILER.span(name, category, args or None)
+
+
+def add_span(name, category, started, rows=None):
+    """Catat operasi yang diukur manual sejak started (time.perf_counter()) sampai sekarang"""
+    if PROFILER is not None:
+        PROFILER.add(name, category, started, time.perf_counter() - started, rows)
+
+
+def count_rows(result):
+    """Jumlah baris hasil method baca: list = banyak baris, None = tidak ada"""
+    if isinstance(result, list):
+        return len(result)
+    return 0 if result is None else 1
+
+
+def traced(category, name=None):
+    """Decorator span untuk satu fungsi; tanpa instrumentasi fungsi dikembalikan apa adanya"""
+    def decorate(func):
+        if PROFILER is None:
+            return func
+        label = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with PROFILER.span(label, category) as current:
+                result = func(*args, **kwargs)
+                if category == "query":
+                    current.rows = count_rows(result)
+            return result
+        return wrapper
+    return decorate
+
+
+def attach(conn):
+    """Pasang penghitung statement SQL pada koneksi jika instrumentasi aktif"""
+    if PROFILER is not None:
+        PROFILER.attach(conn)
+
+
+if PROFILER is not None and TRACE_FILE:
+    atexit.register(PROFILER.write_trace, TRACE_FILE)
@@ -0,0 +1,654 @@
+"""Server tugas lokal: satu proses memegang database, beberapa TodoApp menjadi klien
+
+    python todo_server.py --db todo_list.db --port 8765
+    python main.py --server "http://127.0.0.1:8765/?token=..."
+
+Hanya butuh library standar: asyncio untuk server, http.client untuk klien.
+Protokol HTTP/1.1 (keep-alive) dengan isi JSON:
+    POST /rpc                     {"method": "list_tasks", "args": [...], "kwargs": {...}}
+                                  -> {"result": ...} atau {"error": "...", "type": "ValueError"}
+    GET  /changes?since=V&epoch=E&wait=S
+                                  long-poll sampai S detik menunggu perubahan setelah versi V
+                                  -> {"epoch": ..., "version": ..., "changes": [[versi, klien, [id, ...]], ...]}
+
+Hanya method TodoStore di READ_METHODS/WRITE_METHODS yang bisa dipanggil. Baca
+dijalankan di pool koneksi (satu thread per koneksi, WAL mengizinkan baca
+paralel); tulis berurutan di satu koneksi, dan tulisan yang menunggu digabung
+ke satu transaksi (group commit, SAVEPOINT per tulisan seperti DatabaseWorker). ID
+tugas yang berubah diambil dari tabel changes dan diumumkan lewat /changes, jadi
+klien lain cukup memuat ulang baris tersebut.
+
+Tulisan langsung ke file database (CLI, skrip, TodoApp tanpa --server) juga
+tercatat di tabel changes; server memeriksanya lewat PRAGMA data_version dan
+mengumumkannya tanpa klien (null); begitu juga tugas selesai yang dipindah ke
+arsip oleh pemeliharaan berkala server.
+
+Server tidak pernah membuka path dari klien: file import/export dibaca dan
+ditulis oleh klien, isinya dikirim per potongan (import_chunk) dan diambil per
+halaman (export_page), jadi ukuran file tidak dibatasi MAX_BODY. Setiap
+request wajib membawa header X-Todo-Token berisi token server (disimpan di
+<db>.token yang hanya bisa dibaca pemiliknya dan dicetak saat server
+dijalankan sebagai ?token= di URL), request RPC wajib Content-Type
+application/json, dan header Host/Origin harus alamat server sendiri, jadi
+halaman web (POST lintas situs, DNS rebinding) tidak bisa memanggil server.
+"""
+import asyncio
+import collections
+import concurrent.futures
+import hmac
+import http.client
+import json
+import os
+import secrets
+import sys
+import time
+import urllib.parse
+import uuid
+
+from todo_store import (
+    DB_PATH, EXPORT_PAGE, IMPORT_MAX_ERRORS, STORAGE_PROFILE, STORAGE_PROFILES, TaskView, TodoStore, file_format,
+    maintain_database, read_records, record_writer,
+)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Jumlah koneksi baca di pool server
+READ_POOL_SIZE = 4
+# Perubahan terakhir yang disimpan untuk /changes; klien yang tertinggal lebih jauh memuat ulang
+FEED_HISTORY = 1000
+# Perubahan yang menyentuh lebih banyak tugas dari ini diumumkan sebagai "muat ulang"
+FEED_MAX_IDS = 5000
+# Lama satu long-poll /changes (detik)
+FEED_WAIT_S = 25
+# Interval cek tulisan proses lain ke file database (detik)
+EXTERNAL_POLL_S = 0.5
+# Pemeliharaan file database (arsip, pemadatan, ANALYZE): jeda pertama dan interval (detik)
+MAINTENANCE_DELAY_S = 30
+MAINTENANCE_INTERVAL_S = 6 * 60 * 60
+# Timeout socket klien (detik); harus lebih lama dari FEED_WAIT_S
+RPC_TIMEOUT_S = 60
+# Batas isi request (byte)
+MAX_BODY = 16 * 1024 * 1024
+# Import lewat server: satu RPC import_chunk per sekian baris atau byte JSON,
+# mana yang tercapai lebih dulu (jauh di bawah MAX_BODY)
+IMPORT_CHUNK_ROWS = 5000
+IMPORT_CHUNK_BYTES = 4 * 1024 * 1024
+# Jumlah TaskView yang disimpan server (view.source dihitung sekali per view)
+VIEW_CACHE_SIZE = 64
+
+READ_METHODS = frozenset({
+    "get_task", "get_tasks", "get_deadline", "get_notes", "list_tasks", "tasks_after", "tasks_before",
+    "count_total", "count_view", "count_tasks", "upcoming_deadlines", "agenda", "calendar_days", "search",
+    "search_archive", "journal_labels", "export_page",
+})
+WRITE_METHODS = frozenset({
+    "add_task", "complete_task", "update_task", "set_notes", "delete_task", "complete_tasks",
+    "set_priority", "reschedule_tasks", "update_tasks", "delete_tasks", "clear_all", "undo", "redo", "import_chunk",
+})
+# Nama host yang selalu dianggap alamat server sendiri (selain --host)
+LOOPBACK_HOSTS = frozenset({"127.0.0.1", "localhost", "::1"})
+# Error server yang dibuat ulang di klien dengan tipe yang sama
+REMOTE_ERRORS = {
+    "ValueError": ValueError,
+    "KeyError": KeyError,
+    "FileNotFoundError": FileNotFoundError,
+    "PermissionError": PermissionError,
+}
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden", 404: "Not Found",
+    413: "Payload Too Large", 415: "Unsupported Media Type",
+}
+
+
+class RemoteError(Exception):
+    """Error dari server yang tipenya tidak ada di REMOTE_ERRORS"""
+
+
+def server_token(db_path):
+    """Token klien untuk db_path; dibuat sekali agar klien tetap bisa masuk setelah server dijalankan ulang"""
+    path = db_path + ".token"
+    try:
+        with open(path, encoding="utf-8") as f:
+            token = f.read().strip()
+        if token:
+            return token
+    except FileNotFoundError:
+        pass
+    token = secrets.token_urlsafe(24)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        f.write(token + "\n")
+    return token
+
+
+def call_read(store, name, args, kwargs):
+    """Jalankan method baca TodoStore"""
+    return getattr(store, name)(*args, **kwargs)
+
+
+def call_write(store, name, args, kwargs):
+    """Jalankan method tulis dalam satu transaksi; kembalikan (hasil, ID tugas yang berubah)"""
+    # None = terlalu banyak tugas berubah, klien sebaiknya memuat ulang daftar
+    with store.transaction():
+        version = store.change_version()
+        result = getattr(store, name)(*args, **kwargs)
+        _, task_ids = store.changes_since(version, FEED_MAX_IDS)
+    return result, task_ids
+
+
+def call_batch(store, jobs, seen):
+    """Group commit semua tulisan yang menunggu; kembalikan (hasil per pekerjaan, ID proses lain, versi)"""
+    # call_write menjadi SAVEPOINT di dalam BEGIN ini, jadi pekerjaan yang gagal
+    # hanya membatalkan dirinya sendiri (sama seperti DatabaseWorker di main.py).
+    # IMMEDIATE memegang kunci tulis sejak awal: perubahan proses lain setelah
+    # versi seen dibaca lebih dulu dan tidak ada yang bisa menyela sampai COMMIT.
+    cursor = store.cursor
+    results = []
+    cursor.execute("BEGIN IMMEDIATE")
+    _, external = store.changes_since(seen, FEED_MAX_IDS)
+    for name, args, kwargs in jobs:
+        try:
+            results.append((call_write(store, name, args, kwargs), None))
+        except Exception as exc:
+            if not store.conn.in_transaction:
+                # SQLite membatalkan seluruh transaksi, jadi isi batch ikut gagal
+                results = [(None, exc)] * len(results)
+                cursor.execute("BEGIN IMMEDIATE")
+                _, external = store.changes_since(seen, FEED_MAX_IDS)
+            results.append((None, exc))
+    version = store.change_version()
+    try:
+        cursor.execute("COMMIT")
+    except Exception:
+        if store.conn.in_transaction:
+            cursor.execute("ROLLBACK")
+        raise
+    return results, external, version
+
+
+def call_startup_vacuum(store):
+    """VACUUM penuh jika file lama tanpa auto_vacuum membutuhkannya; kembalikan halaman yang dilepas"""
+    return store.compact() if store.needs_vacuum() else 0
+
+
+def call_external(store, seen, data_version):
+    """Tulisan proses lain sejak versi seen: (data_version, versi, ID); ID [] jika tidak ada"""
+    # data_version koneksi tulis server tidak berubah oleh commit-nya sendiri
+    current = store.data_version()
+    if current == data_version:
+        return current, seen, []
+    return (current, *store.changes_since(seen, FEED_MAX_IDS))
+
+
+# ----------------------------------------------------------------------
+# Server
+# ----------------------------------------------------------------------
+
+class ConnectionPool:
+    """Beberapa TodoStore, masing-masing terikat ke satu thread miliknya"""
+    
+    # Koneksi sqlite3 tidak boleh dipakai lintas thread, jadi setiap koneksi
+    # punya executor satu thread. Antrean asyncio membagikan pasangan yang menganggur.
+    
+    def __init__(self, db_path, size, profile):
+        self.idle = asyncio.Queue()
+        self.members = []
+        for index in range(size):
+            executor = concurrent.futures.ThreadPoolExecutor(1, thread_name_prefix=f"todo-db-{index}")
+            # Dibuat berurutan: migrasi skema tidak pernah berjalan bersamaan
+            store = executor.submit(TodoStore, db_path, profile).result()
+            self.members.append((executor, store))
+            self.idle.put_nowait((executor, store))
+    
+    async def run(self, func, *args):
+        """func(store, *args) di koneksi yang sedang menganggur"""
+        executor, store = await self.idle.get()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, store, *args)
+        finally:
+            self.idle.put_nowait((executor, store))
+    
+    def close(self):
+        """Tutup semua koneksi beserta thread-nya"""
+        for executor, store in self.members:
+            executor.submit(store.close).result()
+            executor.shutdown()
+
+
+class TaskServer:
+    """Server HTTP asyncio yang memegang satu database untuk banyak klien"""
+    
+    def __init__(self, db_path=DB_PATH, readers=READ_POOL_SIZE, profile=None, token=None):
+        self.db_path = db_path
+        self.reader_count = readers
+        self.profile = profile or STORAGE_PROFILES[STORAGE_PROFILE]
+        # Rahasia bersama klien; tanpa --token dibaca dari (atau dibuat di) <db>.token
+        self.token = token or server_token(db_path)
+        # host:port yang boleh muncul di header Host; diisi setelah socket siap
+        # (None = listen di semua alamat, Host tidak bisa dicocokkan)
+        self.hosts = set()
+        # Berganti setiap server dijalankan; klien yang melihat epoch baru memuat ulang
+        self.epoch = uuid.uuid4().hex
+        self.version = 0
+        self.changes = collections.deque(maxlen=FEED_HISTORY)
+        self.changed = None
+        self.views = {}
+        # Tulisan yang menunggu giliran: (method, args, kwargs, klien, future)
+        self.write_queue = []
+        self.flush_task = None
+        # Versi tabel changes yang sudah diumumkan; dibaca dan diubah hanya di
+        # bawah write_lock agar batch tulis dan cek proses lain tidak bersilangan
+        self.write_lock = None
+        self.seen = 0
+        self.data_version = None
+    
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT, on_ready=None):
+        """Jalankan server sampai dibatalkan; on_ready(host, port) setelah socket siap"""
+        # Koneksi tulis dibuat lebih dulu sehingga migrasi hanya dijalankan olehnya
+        self.writer = ConnectionPool(self.db_path, 1, self.profile)
+        # VACUUM penuh satu kali untuk file lama, sebelum ada klien; maintain() hanya incremental
+        await self.writer.run(call_startup_vacuum)
+        self.readers = ConnectionPool(self.db_path, self.reader_count, self.profile)
+        self.changed = asyncio.Event()
+        self.write_lock = asyncio.Lock()
+        self.seen = await self.writer.run(TodoStore.change_version)
+        self.data_version = await self.writer.run(TodoStore.data_version)
+        watch = asyncio.create_task(self.watch_external())
+        maintenance = asyncio.create_task(self.maintain())
+        server = await asyncio.start_server(self.handle, host, port)
+        try:
+            bound_host, bound_port = server.sockets[0].getsockname()[:2]
+            if host in ("", "0.0.0.0", "::"):
+                self.hosts = None
+            else:
+                for name in LOOPBACK_HOSTS | {host, bound_host}:
+                    self.hosts.add(f"[{name}]:{bound_port}" if ":" in name else f"{name}:{bound_port}")
+            if on_ready:
+                on_ready(bound_host, bound_port)
+            async with server:
+                await server.serve_forever()
+        finally:
+            watch.cancel()
+            maintenance.cancel()
+            self.readers.close()
+            self.writer.close()
+    
+    async def handle(self, reader, writer):
+        """Satu koneksi klien: request dilayani berurutan selama koneksi terbuka"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    status, payload = 413, {"error": "Request terlalu besar"}
+                else:
+                    body = await reader.readexactly(length)
+                    status, payload = await self.dispatch(method, target, headers, body)
+                
+                data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS[status]}\r\n"
+                    "Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode("latin-1") + data
+                )
+                await writer.drain()
+                if status == 413 or headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+    
+    def check_request(self, method, headers):
+        """Tolak request dari luar klien RemoteStore; kembalikan (status, isi) atau None jika boleh"""
+        # Host/Origin asing berarti halaman web (POST lintas situs atau DNS
+        # rebinding); RemoteStore tidak pernah mengirim Origin
+        host = headers.get("host", "")
+        origin = headers.get("origin")
+        if (self.hosts is not None and host not in self.hosts) or (
+            origin is not None and urllib.parse.urlsplit(origin).netloc != host
+        ):
+            return 403, {"error": "Host atau Origin tidak diizinkan"}
+        if not hmac.compare_digest(headers.get("x-todo-token", "").encode(), self.token.encode()):
+            return 401, {"error": "Token server salah atau tidak ada"}
+        # Form HTML hanya bisa mengirim text/plain dan sejenisnya tanpa preflight CORS
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        if method == "POST" and content_type != "application/json":
+            return 415, {"error": "Content-Type harus application/json"}
+        return None
+    
+    async def dispatch(self, method, target, headers, body):
+        """Arahkan request ke RPC atau change feed; kembalikan (status HTTP, isi JSON)"""
+        rejected = self.check_request(method, headers)
+        if rejected:
+            return rejected
+        url = urllib.parse.urlsplit(target)
+        if method == "POST" and url.path == "/rpc":
+            try:
+                request = json.loads(body)
+                name = request["method"]
+            except (ValueError, KeyError, TypeError):
+                return 400, {"error": "Request RPC tidak valid"}
+            return await self.call(name, request.get("args", []), request.get("kwargs", {}),
+                                   headers.get("x-todo-client"))
+        
+        if method == "GET" and url.path == "/changes":
+            query = urllib.parse.parse_qs(url.query)
+            try:
+                since = int(query["since"][0]) if "since" in query else None
+                epoch = query.get("epoch", [None])[0]
+                wait = min(float(query.get("wait", [FEED_WAIT_S])[0]), FEED_WAIT_S)
+            except ValueError:
+                return 400, {"error": "Parameter since/wait tidak valid"}
+            return 200, await self.wait_changes(since, wait, epoch)
+        
+        return 404, {"error": f"Tidak ada {method} {url.path}"}
+    
+    async def call(self, name, args, kwargs, client):
+        """Jalankan method yang diizinkan; tulis yang mengubah tugas diumumkan ke feed"""
+        if name not in READ_METHODS and name not in WRITE_METHODS:
+            return 403, {"error": f"Method tidak diizinkan: {name}"}
+        try:
+            args = [self.decode(value) for value in args]
+            kwargs = {key: self.decode(value) for key, value in kwargs.items()}
+            if name in READ_METHODS:
+                result = await self.readers.run(call_read, name, args, kwargs)
+            else:
+                result = await self.write(name, args, kwargs, client)
+        except Exception as exc:
+            return 400, {"error": str(exc), "type": type(exc).__name__}
+        return 200, {"result": result}
+    
+    async def write(self, name, args, kwargs, client):
+        """Antrekan satu tulisan; selesai setelah transaksinya di-commit"""
+        future = asyncio.get_running_loop().create_future()
+        self.write_queue.append((name, args, kwargs, client, future))
+        if self.flush_task is None:
+            self.flush_task = asyncio.create_task(self.flush_writes())
+        return await future
+    
+    async def flush_writes(self):
+        """Jalankan antrean tulis per batch; tulisan yang datang selama commit ikut batch berikutnya"""
+        try:
+            while self.write_queue:
+                limit = self.profile["commit_batch"]
+                batch, self.write_queue = self.write_queue[:limit], self.write_queue[limit:]
+                try:
+                    async with self.write_lock:
+                        results, external, self.seen = await self.writer.run(
+                            call_batch, [job[:3] for job in batch], self.seen
+                        )
+                    if external != []:
+                        self.publish(None, external)
+                except Exception as exc:
+                    results = [(None, exc)] * len(batch)
+                for (_, _, _, client, future), (outcome, exc) in zip(batch, results):
+                    if exc is None:
+                        result, task_ids = outcome
+                        # Diumumkan sesudah COMMIT, jadi pembaca pool sudah melihatnya
+                        if task_ids != []:
+                            self.publish(client, task_ids)
+                    if future.cancelled():
+                        continue
+                    if exc is None:
+                        future.set_result(result)
+                    else:
+                        future.set_exception(exc)
+        finally:
+            self.flush_task = None
+    
+    async def watch_external(self):
+        """Umumkan tulisan proses lain ke file database, dicek setiap EXTERNAL_POLL_S"""
+        while True:
+            await asyncio.sleep(EXTERNAL_POLL_S)
+            try:
+                async with self.write_lock:
+                    self.data_version, self.seen, task_ids = await self.writer.run(
+                        call_external, self.seen, self.data_version
+                    )
+            except Exception:
+                # Misalnya database sedang dikunci lama; dicoba lagi di putaran berikutnya
+                continue
+            if task_ids != []:
+                self.publish(None, task_ids)
+    
+    async def maintain(self):
+        """Jalankan maintain_database berkala di thread terpisah"""
+        # Koneksi sendiri, bukan koneksi tulis: batch tulis klien tetap jalan di
+        # antara batch arsip (VACUUM penuh hanya saat server dijalankan). Tugas
+        # yang diarsipkan diumumkan oleh watch_external.
+        await asyncio.sleep(MAINTENANCE_DELAY_S)
+        while True:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, maintain_database, self.db_path, self.profile)
+            except Exception as exc:
+                print(f"Pemeliharaan database gagal: {exc}", file=sys.stderr)
+            await asyncio.sleep(MAINTENANCE_INTERVAL_S)
+    
+    def decode(self, value):
+        """Argumen dari klien; {"__view__": opsi} menjadi TaskView yang dipakai ulang antar request"""
+        if not isinstance(value, dict) or "__view__" not in value:
+            return value
+        options = value["__view__"]
+        key = tuple(sorted(options.items()))
+        view = self.views.get(key)
+        if view is None:
+            if len(self.views) >= VIEW_CACHE_SIZE:
+                self.views.clear()
+            view = self.views[key] = TaskView(**options)
+        return view
+    
+    def publish(self, client, task_ids):
+        """Catat satu perubahan dan bangunkan semua long-poll yang menunggu"""
+        self.version += 1
+        self.changes.append((self.version, client, task_ids))
+        self.changed.set()
+        self.changed = asyncio.Event()
+    
+    async def wait_changes(self, since, wait, epoch=None):
+        """Perubahan setelah versi since; tunggu sampai wait detik jika belum ada"""
+        # Versi dari server sebelumnya (epoch lain) tidak bisa dibandingkan, jangan ditunggu
+        stale = epoch is not None and epoch != self.epoch
+        if since == self.version and not stale:
+            try:
+                await asyncio.wait_for(self.changed.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+        
+        feed = {"epoch": self.epoch, "version": self.version, "changes": []}
+        if since is None:
+            return feed
+        # Riwayat sudah terpotong (klien tertinggal jauh) atau versi dari server sebelumnya
+        oldest = self.changes[0][0] if self.changes else self.version + 1
+        if stale or since > self.version or since < oldest - 1:
+            feed["reload"] = True
+        else:
+            feed["changes"] = [change for change in self.changes if change[0] > since]
+        return feed
+
+
+# ----------------------------------------------------------------------
+# Klien
+# ----------------------------------------------------------------------
+
+def encode(value):
+    """Argumen RPC untuk JSON: TaskView dikirim sebagai opsi konstruktornya"""
+    if isinstance(value, TaskView):
+        return {"__view__": value.options()}
+    return value
+
+
+def revive(result):
+    """Baris hasil query kembali menjadi tuple seperti dari sqlite3 (JSON hanya kenal list)"""
+    if isinstance(result, list):
+        return [tuple(item) if isinstance(item, list) else item for item in result]
+    return result
+
+
+class RemoteStore:
+    """Pengganti TodoStore di sisi klien: setiap method yang diizinkan menjadi satu RPC"""
+    
+    # Satu koneksi HTTP keep-alive per objek; seperti TodoStore, satu objek hanya
+    # dipakai satu thread (Tk, DatabaseWorker, dan ChangeFeed masing-masing punya sendiri).
+    
+    def __init__(self, url, client_id=None, timeout=RPC_TIMEOUT_S):
+        parsed = urllib.parse.urlsplit(url)
+        self.conn = http.client.HTTPConnection(parsed.hostname, parsed.port or DEFAULT_PORT, timeout=timeout)
+        # Token dari URL yang dicetak server (?token=...)
+        self.token = urllib.parse.parse_qs(parsed.query).get("token", [""])[0]
+        # Perubahan dari klien ini sendiri dilewati saat membaca change feed
+        self.client_id = client_id or uuid.uuid4().hex
+    
+    def close(self):
+        """Tutup koneksi ke server"""
+        self.conn.close()
+    
+    def request(self, method, path, payload=None, retry=False):
+        """Kirim satu request; kembalikan isi JSON balasan"""
+        body = None if payload is None else json.dumps(payload).encode("utf-8")
+        headers = {"Content-Type": "application/json", "X-Todo-Client": self.client_id, "X-Todo-Token": self.token}
+        while True:
+            try:
+                self.conn.request(method, path, body, headers)
+                return json.loads(self.conn.getresponse().read())
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Koneksi keep-alive terputus; baca aman diulang, tulis tidak
+                # (server mungkin sudah menjalankannya)
+                self.conn.close()
+                if not retry:
+                    raise
+                retry = False
+    
+    def call(self, name, args=(), kwargs=None):
+        """Panggil method TodoStore di server"""
+        payload = {
+            "method": name,
+            "args": [encode(value) for value in args],
+            "kwargs": {key: encode(value) for key, value in (kwargs or {}).items()},
+        }
+        reply = self.request("POST", "/rpc", payload, retry=name in READ_METHODS)
+        if "error" in reply:
+            raise REMOTE_ERRORS.get(reply.get("type"), RemoteError)(reply["error"])
+        return revive(reply["result"])
+    
+    def __getattr__(self, name):
+        if name not in READ_METHODS and name not in WRITE_METHODS:
+            raise AttributeError(name)
+        
+        def method(*args, **kwargs):
+            return self.call(name, args, kwargs)
+        method.__name__ = name
+        return method
+    
+    def import_tasks(self, path, fmt=None):
+        """Import file lokal: dibaca bertahap dan dikirim per potongan lewat import_chunk"""
+        # Setiap potongan satu transaksi di server; semuanya tetap satu entri Undo
+        started = time.perf_counter()
+        stats = {"imported": 0, "skipped": 0, "errors": []}
+        entry_id = None
+        
+        def send(chunk):
+            nonlocal entry_id
+            result = self.call("import_chunk", (chunk, entry_id))
+            entry_id = result["entry_id"]
+            stats["imported"] += result["imported"]
+            stats["skipped"] += result["skipped"]
+            stats["errors"].extend(result["errors"][:IMPORT_MAX_ERRORS - len(stats["errors"])])
+        
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            chunk, size = [], 0
+            for line_no, record in read_records(f, file_format(path, fmt)):
+                chunk.append((line_no, record))
+                size += len(json.dumps(record))
+                if len(chunk) >= IMPORT_CHUNK_ROWS or size >= IMPORT_CHUNK_BYTES:
+                    send(chunk)
+                    chunk, size = [], 0
+            if chunk:
+                send(chunk)
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+    
+    def export_tasks(self, path, fmt=None):
+        """Export ke file lokal: halaman export_page ditulis begitu tiba"""
+        # Halaman dibaca di transaksi terpisah; tugas yang ditambah selama export
+        # ikut jika ID-nya belum terlewati
+        fmt = file_format(path, fmt)
+        started = time.perf_counter()
+        exported = last_id = 0
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            write = record_writer(f, fmt)
+            while True:
+                rows = self.call("export_page", (last_id, EXPORT_PAGE))
+                for row in rows:
+                    write(row[1:])
+                exported += len(rows)
+                if len(rows) < EXPORT_PAGE:
+                    break
+                last_id = rows[-1][0]
+        return {"exported": exported, "seconds": time.perf_counter() - started}
+    
+    def apply(self, func, args):
+        """Jalankan pekerjaan DatabaseWorker func(store, *args) lewat RPC"""
+        # Method TodoStore dikirim utuh (satu transaksi di server); import/export
+        # memakai versi RemoteStore di atas; fungsi lain dijalankan di sini dengan
+        # satu RPC (dan satu transaksi) per method, jadi tidak atomik
+        name = getattr(func, "__name__", "")
+        if getattr(TodoStore, name, None) is func:
+            if name in vars(RemoteStore):
+                return getattr(self, name)(*args)
+            if name in WRITE_METHODS:
+                return self.call(name, args)
+        return func(self, *args)
+    
+    def changes(self, since=None, wait=FEED_WAIT_S, epoch=None):
+        """Long-poll change feed; since None = hanya ambil versi dan epoch sekarang"""
+        query = {"wait": wait} if since is None else {"since": since, "wait": wait}
+        if epoch is not None:
+            query["epoch"] = epoch
+        return self.request("GET", "/changes?" + urllib.parse.urlencode(query), retry=True)
+
+
+# ----------------------------------------------------------------------
+# Perintah baris
+# ----------------------------------------------------------------------
+
+def run_server(argv=None):
+    """Jalankan server sampai dihentikan (Ctrl+C)"""
+    import argparse
+    parser = argparse.ArgumentParser(description="Server To-Do List untuk banyak klien TodoApp")
+    parser.add_argument("--db", default=DB_PATH, help="file database (default: %(default)s)")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="alamat listen (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port, 0 = bebas (default: %(default)s)")
+    parser.add_argument("--readers", type=int, default=READ_POOL_SIZE,
+                        help="jumlah koneksi baca (default: %(default)s)")
+    parser.add_argument("--profile", choices=sorted(STORAGE_PROFILES), help="profil penyimpanan SQLite")
+    parser.add_argument("--token", help="token klien (default: isi file <db>.token, dibuat acak jika belum ada)")
+    args = parser.parse_args(argv)
+    
+    server = TaskServer(args.db, args.readers, STORAGE_PROFILES[args.profile] if args.profile else None, args.token)
+    
+    def ready(host, port):
+        # URL lengkap beserta token, siap dipakai untuk main.py --server
+        query = urllib.parse.urlencode({"token": server.token})
+        print(f"Server berjalan di http://{host}:{port}/?{query}", flush=True)
+    
+    try:
+        asyncio.run(server.serve(args.host, args.port, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_server())
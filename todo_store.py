@@ -0,0 +1,2315 @@
+"""Inti To-Do List tanpa GUI: skema dan migrasi SQLite, TodoStore, serta CLI
+
+Dipakai oleh GUI (main.py) dan bisa dijalankan langsung untuk skrip/otomasi:
+    python todo_store.py add "Laporan bulanan" --deadline 2026-01-31 --time 17:00
+    python todo_store.py list --limit 20
+    python todo_store.py add "Standup" --deadline 2026-01-05 --time 09:00 --repeat weekdays
+    python todo_store.py agenda --from 2026-01-01 --to 2026-01-31
+    python todo_store.py calendar --month 2026-01
+    python todo_store.py stats
+"""
+import contextlib
+import functools
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from todo_profiler import add_span, attach, traced
+
+DB_PATH = 'todo_list.db'
+
+# Klasifikasi (selesai/terlambat/pending/ada catatan) dan format tampilan dihitung
+# langsung di SQLite, jadi Python tidak perlu strptime/strftime per baris.
+# 'now' bernilai sama untuk seluruh eksekusi satu statement.
+NOW_TS_SQL = "CAST(strftime('%s', 'now') AS INTEGER)"
+VALID_DEADLINE_SQL = (
+    "(deadline_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]' "
+    "AND deadline_time GLOB '[0-9][0-9]:[0-9][0-9]')"
+)
+# Hanya status 'Belum Selesai' agar bisa memakai index (status, deadline_ts)
+OVERDUE_SQL = f"(status = 'Belum Selesai' AND deadline_ts <= {NOW_TS_SQL})"
+STATE_SQL = f"CASE WHEN status = 'Selesai' THEN 'completed' WHEN {OVERDUE_SQL} THEN 'overdue' ELSE 'pending' END"
+# Tugas berulang ditandai ↻; deadline-nya selalu kejadian berikutnya
+DEADLINE_DISPLAY_SQL = (
+    "ifnull(strftime('%d/%m/%Y %H:%M', deadline_ts, 'unixepoch', 'localtime'), 'Tidak ada') "
+    "|| CASE WHEN recurrence IS NULL THEN '' ELSE ' ↻' END"
+)
+CREATED_DISPLAY_SQL = (
+    "CASE WHEN created_date GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]' "
+    "THEN substr(created_date, 9, 2) || '/' || substr(created_date, 6, 2) || '/' || substr(created_date, 1, 4) "
+    "|| substr(created_date, 11) ELSE created_date END"
+)
+HAS_NOTES_SQL = "has_notes"
+
+# Kolom yang dibaca untuk setiap baris Treeview
+TASK_COLUMNS = (
+    "id, task, priority, status, deadline_ts, "
+    f"{DEADLINE_DISPLAY_SQL}, {CREATED_DISPLAY_SQL}, {STATE_SQL}, {HAS_NOTES_SQL}"
+)
+# Urutan daftar: deadline (epoch, NULL = tanpa deadline paling awal) lalu ID
+TASK_ORDER = "deadline_ts, id"
+# Kolom urut yang bisa dipilih (nama -> ekspresi SQL ber-index). Teks prioritas
+# sudah berurutan sesuai tingkatnya (Rendah < Sedang < Tinggi), jadi index
+# priority langsung dipakai tanpa kolom peringkat terpisah.
+SORT_COLUMNS = {
+    "deadline": "deadline_ts",
+    "id": "id",
+    "task": "task COLLATE NOCASE",
+    "priority": "priority",
+    "status": "status",
+    "created": "created_date",
+}
+# Index yang menyimpan baris dalam urutan tiap kolom urut (None = rowid)
+SORT_INDEXES = {
+    "deadline": "idx_tasks_deadline_ts",
+    "id": None,
+    "task": "idx_tasks_task_nocase",
+    "priority": "idx_tasks_priority",
+    "status": "idx_tasks_status",
+    "created": "idx_tasks_created",
+}
+# Filter yang meloloskan sebanyak ini baris dibaca lewat index kolom urut
+# (berhenti setelah satu halaman); yang lebih selektif memakai index filter lalu diurutkan
+SORT_INDEX_MIN_ROWS = 10000
+
+# Jumlah maksimum hasil pencarian yang ditampilkan
+SEARCH_LIMIT = 200
+# bm25 hanya dihitung untuk sejumlah kecocokan terbaru agar awalan umum tetap cepat
+SEARCH_CANDIDATES = 1000
+
+PRIORITIES = ("Rendah", "Sedang", "Tinggi")
+STATUSES = ("Belum Selesai", "Selesai")
+# Kolom file import/export (CSV header dan key JSON Lines)
+EXPORT_FIELDS = (
+    "task", "priority", "status", "created_date", "completed_date",
+    "deadline_date", "deadline_time", "recurrence", "notes",
+)
+# Kolom SELECT untuk EXPORT_FIELDS (dari tasks LEFT JOIN task_notes)
+EXPORT_COLUMNS = (
+    "task, priority, status, created_date, completed_date, deadline_date, deadline_time, "
+    "recurrence, ifnull(body, '')"
+)
+# Jumlah baris per halaman export_page (klien todo_server)
+EXPORT_PAGE = 5000
+# Jumlah baris per executemany saat import
+IMPORT_BATCH = 50000
+# Trigger per baris yang diganti satu query per batch saat import massal
+BULK_DEFERRED_TRIGGERS = (
+    "trg_tasks_fts_insert", "trg_task_stats_insert", "trg_task_notes_fts_insert",
+    "trg_changes_insert", "trg_changes_update",
+)
+# Trigger per baris yang diganti satu query saat menghapus banyak tugas sekaligus
+BULK_DELETE_TRIGGERS = (
+    "trg_tasks_fts_delete", "trg_task_stats_delete", "trg_tasks_notes_delete",
+    "trg_task_notes_delete", "trg_task_notes_fts_delete", "trg_changes_delete",
+)
+# Trigger tabel changes; operasi journal sebesar JOURNAL_BULK_ROWS menggantinya
+# dengan satu penanda muat ulang (pembaca memuat ulang daftar untuk sebanyak itu)
+CHANGES_TRIGGERS = ("trg_changes_insert", "trg_changes_update", "trg_changes_delete")
+# Jumlah pesan baris invalid yang disimpan di laporan import
+IMPORT_MAX_ERRORS = 20
+
+# Batas journal undo: entri terlama dibuang jika jumlah entri atau jumlah baris
+# tugas yang disimpan melewati batas (entri terbaru selalu disimpan)
+JOURNAL_MAX_ENTRIES = 100
+JOURNAL_MAX_ROWS = 1000000
+# Undo/redo yang menyentuh sebanyak ini tugas memakai jalur massal (trigger ditunda)
+JOURNAL_BULK_ROWS = 5000
+# Kolom tugas yang disimpan journal; id dan has_notes dipulihkan terpisah
+JOURNAL_FIELDS = (
+    "task, priority, status, created_date, completed_date, deadline_date, deadline_time, deadline_ts, recurrence"
+)
+
+# Aturan tugas berulang: subset RRULE (RFC 5545) dengan FREQ, INTERVAL, BYDAY
+# (mingguan), BYMONTHDAY (bulanan), dan UNTIL=YYYYMMDD
+RECURRENCE_FREQS = ("DAILY", "WEEKLY", "MONTHLY")
+WEEKDAYS = ("MO", "TU", "WE", "TH", "FR", "SA", "SU")
+# Singkatan aturan untuk CLI (--repeat) dan pilihan form GUI
+RECURRENCE_PRESETS = {
+    "daily": "FREQ=DAILY",
+    "weekdays": "FREQ=WEEKLY;BYDAY=MO,TU,WE,TH,FR",
+    "weekly": "FREQ=WEEKLY",
+    "monthly": "FREQ=MONTHLY",
+}
+# Jumlah maksimum kejadian yang dikembalikan agenda
+AGENDA_LIMIT = 1000
+# Judul tugas per hari yang dibawa calendar_days (sisanya hanya dihitung)
+CALENDAR_TITLES = 3
+MONTH_NAMES = (
+    "Januari", "Februari", "Maret", "April", "Mei", "Juni",
+    "Juli", "Agustus", "September", "Oktober", "November", "Desember",
+)
+# Kalender dimulai hari Senin
+DAY_NAMES = ("Sen", "Sel", "Rab", "Kam", "Jum", "Sab", "Min")
+
+# Arsip: tugas selesai lebih lama dari ARCHIVE_AFTER_DAYS dipindah ke file
+# database terpisah (<nama>_archive.db) per ARCHIVE_BATCH tugas
+ARCHIVE_AFTER_DAYS = 30
+ARCHIVE_BATCH = 5000
+# Batch arsip pemeliharaan latar: transaksi pendek agar tulisan pengguna tidak lama menunggu
+ARCHIVE_BACKGROUND_BATCH = 500
+# Kolom hasil pencarian arsip: id, tugas, prioritas, deadline, selesai, diarsipkan
+ARCHIVE_COLUMNS = (
+    "id, task, priority, "
+    "ifnull(strftime('%d/%m/%Y %H:%M', deadline_ts, 'unixepoch', 'localtime'), 'Tidak ada'), "
+    "ifnull(completed_date, ''), archived_date"
+)
+# Halaman kosong yang dilepas per langkah incremental_vacuum (halaman 4 KiB)
+COMPACT_STEP_PAGES = 1000
+# Database tanpa auto_vacuum di-VACUUM penuh jika halaman kosong melewati rasio ini
+VACUUM_FREE_RATIO = 0.25
+# Baris sampel per index untuk ANALYZE setelah pemeliharaan (0 = semua baris)
+ANALYZE_LIMIT = 1000
+
+# Jumlah versi terbaru yang disimpan tabel changes; pembaca yang tertinggal lebih
+# jauh memuat ulang daftar. Dipangkas sekali setiap CHANGES_PRUNE_EVERY versi.
+CHANGES_KEEP = 20000
+CHANGES_PRUNE_EVERY = 1000
+
+# Profil penyimpanan SQLite. commit_window_ms dan commit_batch mengatur group
+# commit di DatabaseWorker: tulisan yang datang beruntun digabung ke satu
+# transaksi. checkpoint_every = jumlah commit sebelum checkpoint WAL saat idle.
+STORAGE_PROFILES = {
+    # Setiap tulisan di-commit dan di-fsync sendiri
+    "aman": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "mmap_size": 0,
+        "cache_size": -8000,
+        "wal_autocheckpoint": 1000,
+        "commit_window_ms": 0,
+        "commit_batch": 1,
+        "checkpoint_every": 50,
+    },
+    "seimbang": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 64 * 1024 * 1024,
+        "cache_size": -32000,
+        "wal_autocheckpoint": 1000,
+        "commit_window_ms": 5,
+        "commit_batch": 500,
+        "checkpoint_every": 100,
+    },
+    # Untuk import/operasi massal; jendela group commit lebih lebar
+    "cepat": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -128000,
+        "wal_autocheckpoint": 4000,
+        "commit_window_ms": 25,
+        "commit_batch": 5000,
+        "checkpoint_every": 200,
+    },
+}
+STORAGE_PROFILE = os.environ.get("TODO_STORAGE_PROFILE", "seimbang")
+# Lama menunggu kunci tulis koneksi lain (detik); harus melebihi satu langkah
+# pemeliharaan (batch arsip, pemadatan) yang memegang kunci
+BUSY_TIMEOUT_S = 30
+
+
+def migrate_v1_base_schema(cursor):
+    """Versi 1: tabel tasks dan urutan ID yang stabil"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            task TEXT NOT NULL,
+            priority TEXT DEFAULT 'Sedang',
+            status TEXT DEFAULT 'Belum Selesai',
+            created_date TEXT,
+            completed_date TEXT,
+            deadline_date TEXT,
+            deadline_time TEXT,
+            notes TEXT DEFAULT ''
+        )
+    ''')
+    
+    # Versi lama menghapus baris sqlite_sequence setiap kali tugas dihapus
+    # (reorder_ids). ID sekarang stabil, jadi urutan AUTOINCREMENT harus
+    # selalu berada di atas ID terbesar yang pernah ada.
+    cursor.execute("SELECT MAX(id) FROM tasks")
+    max_id = cursor.fetchone()[0]
+    if max_id is None:
+        return
+    
+    cursor.execute("SELECT seq FROM sqlite_sequence WHERE name = 'tasks'")
+    row = cursor.fetchone()
+    if row is None:
+        cursor.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('tasks', ?)", (max_id,))
+    elif row[0] < max_id:
+        cursor.execute("UPDATE sqlite_sequence SET seq = ? WHERE name = 'tasks'", (max_id,))
+
+
+def migrate_v2_indexes(cursor):
+    """Versi 2: index untuk urutan deadline, filter status, dan prioritas"""
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_deadline ON tasks (deadline_date, deadline_time)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline ON tasks (status, deadline_date, deadline_time)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks (priority)")
+    cursor.execute("ANALYZE")
+
+
+def migrate_v3_deadline_ts(cursor):
+    """Versi 3: deadline disimpan juga sebagai epoch detik (deadline_ts) yang ter-index"""
+    cursor.execute("ALTER TABLE tasks ADD COLUMN deadline_ts INTEGER")
+    
+    # Modifier 'utc' menganggap teks deadline sebagai waktu lokal, sama
+    # seperti deadline_timestamp() di Python
+    cursor.execute(
+        "UPDATE tasks SET deadline_ts = "
+        "CAST(strftime('%s', deadline_date || ' ' || deadline_time, 'utc') AS INTEGER) "
+        f"WHERE {VALID_DEADLINE_SQL}"
+    )
+    
+    # Urutan dan filter deadline kini memakai deadline_ts
+    cursor.execute("DROP INDEX IF EXISTS idx_tasks_deadline")
+    cursor.execute("DROP INDEX IF EXISTS idx_tasks_status_deadline")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_deadline_ts ON tasks (deadline_ts)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status_deadline_ts ON tasks (status, deadline_ts)")
+    cursor.execute("ANALYZE")
+
+
+def migrate_v4_task_stats(cursor):
+    """Versi 4: counter total/selesai untuk footer, dipelihara oleh trigger"""
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS task_stats (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            total INTEGER NOT NULL,
+            completed INTEGER NOT NULL
+        )
+    ''')
+    cursor.execute(
+        "INSERT OR REPLACE INTO task_stats (id, total, completed) "
+        "SELECT 1, COUNT(*), COUNT(CASE WHEN status = 'Selesai' THEN 1 END) FROM tasks"
+    )
+    
+    # "IS" tidak pernah menghasilkan NULL, jadi counter tetap aman untuk status NULL
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_stats_insert AFTER INSERT ON tasks BEGIN
+            UPDATE task_stats
+            SET total = total + 1, completed = completed + (NEW.status IS 'Selesai')
+            WHERE id = 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_stats_delete AFTER DELETE ON tasks BEGIN
+            UPDATE task_stats
+            SET total = total - 1, completed = completed - (OLD.status IS 'Selesai')
+            WHERE id = 1;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_stats_status AFTER UPDATE OF status ON tasks BEGIN
+            UPDATE task_stats
+            SET completed = completed + (NEW.status IS 'Selesai') - (OLD.status IS 'Selesai')
+            WHERE id = 1;
+        END
+    ''')
+
+
+def migrate_v5_search_index(cursor):
+    """Versi 5: index full-text FTS5 atas judul dan catatan tugas"""
+    # rowid tasks_fts = id tugas; prefix='2 3' mempercepat pencarian awalan kata
+    try:
+        cursor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5("
+            "task, notes, tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        )
+    except sqlite3.OperationalError:
+        # SQLite tanpa FTS5: pencarian memakai LIKE (lihat search_tasks)
+        return
+    
+    cursor.execute("DELETE FROM tasks_fts")
+    cursor.execute("INSERT INTO tasks_fts (rowid, task, notes) SELECT id, task, ifnull(notes, '') FROM tasks")
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, task, notes) VALUES (NEW.id, NEW.task, ifnull(NEW.notes, ''));
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            DELETE FROM tasks_fts WHERE rowid = OLD.id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_update AFTER UPDATE OF task, notes ON tasks BEGIN
+            UPDATE tasks_fts SET task = NEW.task, notes = ifnull(NEW.notes, '') WHERE rowid = NEW.id;
+        END
+    ''')
+
+
+def migrate_v6_task_notes(cursor):
+    """Versi 6: isi catatan dipindah ke tabel task_notes, tasks hanya menyimpan flag has_notes"""
+    # Daftar tugas cukup membaca has_notes; isi catatan hanya dibaca saat dibuka
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS task_notes (
+            task_id INTEGER PRIMARY KEY,
+            body TEXT NOT NULL
+        )
+    ''')
+    cursor.execute("ALTER TABLE tasks ADD COLUMN has_notes INTEGER NOT NULL DEFAULT 0")
+    cursor.execute(
+        "INSERT OR REPLACE INTO task_notes (task_id, body) SELECT id, notes FROM tasks "
+        "WHERE trim(ifnull(notes, ''), ' ' || char(9, 10, 13)) != ''"
+    )
+    cursor.execute("UPDATE tasks SET has_notes = 1 WHERE id IN (SELECT task_id FROM task_notes)")
+    
+    # Trigger FTS versi 5 membaca tasks.notes; ganti dengan trigger dari task_notes
+    cursor.execute("DROP TRIGGER IF EXISTS trg_tasks_fts_insert")
+    cursor.execute("DROP TRIGGER IF EXISTS trg_tasks_fts_update")
+    try:
+        cursor.execute("ALTER TABLE tasks DROP COLUMN notes")
+    except sqlite3.OperationalError:
+        # SQLite < 3.35 belum mendukung DROP COLUMN; kosongkan saja isinya
+        cursor.execute("UPDATE tasks SET notes = NULL")
+    
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_notes_delete AFTER DELETE ON tasks BEGIN
+            DELETE FROM task_notes WHERE task_id = OLD.id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_notes_insert AFTER INSERT ON task_notes BEGIN
+            UPDATE tasks SET has_notes = 1 WHERE id = NEW.task_id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_notes_delete AFTER DELETE ON task_notes BEGIN
+            UPDATE tasks SET has_notes = 0 WHERE id = OLD.task_id;
+        END
+    ''')
+    
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'")
+    if cursor.fetchone() is None:
+        return
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts (rowid, task, notes) VALUES (NEW.id, NEW.task, '');
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_tasks_fts_update AFTER UPDATE OF task ON tasks BEGIN
+            UPDATE tasks_fts SET task = NEW.task WHERE rowid = NEW.id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_notes_fts_insert AFTER INSERT ON task_notes BEGIN
+            UPDATE tasks_fts SET notes = NEW.body WHERE rowid = NEW.task_id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_notes_fts_update AFTER UPDATE OF body ON task_notes BEGIN
+            UPDATE tasks_fts SET notes = NEW.body WHERE rowid = NEW.task_id;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_notes_fts_delete AFTER DELETE ON task_notes BEGIN
+            UPDATE tasks_fts SET notes = '' WHERE rowid = OLD.task_id;
+        END
+    ''')
+
+
+def migrate_v7_sort_indexes(cursor):
+    """Versi 7: index untuk urutan per kolom (status, tanggal dibuat, judul)"""
+    # Urutan (kolom, id) cukup dari index satu kolom karena rowid ikut tersimpan
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks (status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created ON tasks (created_date)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_task_nocase ON tasks (task COLLATE NOCASE)")
+    cursor.execute("ANALYZE")
+
+
+def migrate_v8_journal(cursor):
+    """Versi 8: journal operasi untuk undo/redo"""
+    # Satu entri per operasi pengguna; entri hanya ditambah di akhir, undo cukup
+    # menandai undone. row_count = jumlah tugas yang disentuh operasi.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS journal (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            label TEXT NOT NULL,
+            created_date TEXT NOT NULL,
+            row_count INTEGER NOT NULL DEFAULT 0,
+            undone INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    # Salinan baris tugas per entri: side 0 = sebelum operasi (task NULL berarti
+    # tugas belum ada), side 1 = sesudah operasi, disalin saat undo untuk redo
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS journal_rows (
+            entry_id INTEGER NOT NULL,
+            side INTEGER NOT NULL,
+            task_id INTEGER NOT NULL,
+            task TEXT,
+            priority TEXT,
+            status TEXT,
+            created_date TEXT,
+            completed_date TEXT,
+            deadline_date TEXT,
+            deadline_time TEXT,
+            deadline_ts INTEGER,
+            notes TEXT,
+            PRIMARY KEY (entry_id, side, task_id)
+        ) WITHOUT ROWID
+    ''')
+
+
+def migrate_v9_changes(cursor):
+    """Versi 9: tabel changes untuk mendeteksi tulisan dari proses lain"""
+    # version AUTOINCREMENT = penghitung perubahan yang hanya naik, juga setelah
+    # dipangkas. task_id NULL = perubahan massal tanpa daftar ID (muat ulang).
+    # Trigger menangkap semua penulis, termasuk skrip yang memakai sqlite3 langsung.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS changes (
+            version INTEGER PRIMARY KEY AUTOINCREMENT,
+            task_id INTEGER
+        )
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_changes_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO changes (task_id) VALUES (NEW.id);
+        END
+    ''')
+    # Termasuk has_notes yang diubah trigger task_notes; isi catatan sendiri
+    # tidak tampil di daftar, jadi task_notes tidak perlu dicatat
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_changes_update AFTER UPDATE ON tasks BEGIN
+            INSERT INTO changes (task_id) VALUES (NEW.id);
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_changes_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO changes (task_id) VALUES (OLD.id);
+        END
+    ''')
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_changes_prune AFTER INSERT ON changes
+        WHEN NEW.version % {CHANGES_PRUNE_EVERY} = 0 BEGIN
+            DELETE FROM changes WHERE version <= NEW.version - {CHANGES_KEEP};
+        END
+    ''')
+
+
+def migrate_v10_recurrence(cursor):
+    """Versi 10: aturan berulang per tugas (kolom recurrence, ikut dicatat journal)"""
+    # Deadline tugas berulang = kejadian berikutnya yang belum selesai, jadi index
+    # deadline dan deteksi terlambat tidak berubah. Kejadian sesudahnya tidak
+    # disimpan; index parsial ini menemukan tugas yang perlu dihitung kejadiannya.
+    cursor.execute("ALTER TABLE tasks ADD COLUMN recurrence TEXT")
+    cursor.execute("ALTER TABLE journal_rows ADD COLUMN recurrence TEXT")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_tasks_recurring ON tasks (deadline_ts) WHERE recurrence IS NOT NULL")
+
+
+def migrate_v11_archive(cursor):
+    """Versi 11: index parsial tugas selesai untuk memilih yang diarsipkan"""
+    # Tugas selesai tanpa completed_date (misalnya hasil import) memakai tanggal dibuat
+    cursor.execute(
+        "CREATE INDEX IF NOT EXISTS idx_tasks_archivable ON tasks (ifnull(completed_date, created_date)) "
+        "WHERE status = 'Selesai'"
+    )
+
+
+def migrate_v12_task_days(cursor):
+    """Versi 12: jumlah tugas per hari deadline untuk kalender, dipelihara oleh trigger"""
+    # Satu baris per tanggal (deadline_date, waktu lokal) sehingga satu bulan
+    # kalender cukup membaca ~31 baris, berapa pun jumlah tugasnya. Tugas tanpa
+    # deadline valid (deadline_ts NULL) tidak dihitung; perbandingan day = NULL
+    # tidak pernah cocok, jadi deadline_date NULL juga aman. Hari yang menjadi 0
+    # dibiarkan dan dibersihkan oleh maintain().
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS task_days (
+            day TEXT PRIMARY KEY,
+            total INTEGER NOT NULL,
+            completed INTEGER NOT NULL
+        ) WITHOUT ROWID
+    ''')
+    cursor.execute("DELETE FROM task_days")
+    cursor.execute(
+        "INSERT INTO task_days (day, total, completed) "
+        "SELECT deadline_date, COUNT(*), COUNT(CASE WHEN status = 'Selesai' THEN 1 END) "
+        "FROM tasks WHERE deadline_ts IS NOT NULL AND deadline_date IS NOT NULL GROUP BY deadline_date"
+    )
+    
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_days_insert AFTER INSERT ON tasks
+        WHEN NEW.deadline_ts IS NOT NULL AND NEW.deadline_date IS NOT NULL BEGIN
+            INSERT INTO task_days (day, total, completed) VALUES (NEW.deadline_date, 1, NEW.status IS 'Selesai')
+            ON CONFLICT (day) DO UPDATE SET total = total + 1, completed = completed + excluded.completed;
+        END
+    ''')
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_days_delete AFTER DELETE ON tasks
+        WHEN OLD.deadline_ts IS NOT NULL BEGIN
+            UPDATE task_days
+            SET total = total - 1, completed = completed - (OLD.status IS 'Selesai')
+            WHERE day = OLD.deadline_date;
+        END
+    ''')
+    # Pindah hari, selesai/batal selesai, atau deadline menjadi (tidak) valid:
+    # kurangi hari lama lalu tambah hari baru
+    cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS trg_task_days_update AFTER UPDATE OF deadline_date, deadline_ts, status ON tasks
+        WHEN OLD.deadline_date IS NOT NEW.deadline_date OR OLD.status IS NOT NEW.status
+            OR (OLD.deadline_ts IS NULL) != (NEW.deadline_ts IS NULL) BEGIN
+            UPDATE task_days
+            SET total = total - 1, completed = completed - (OLD.status IS 'Selesai')
+            WHERE day = OLD.deadline_date AND OLD.deadline_ts IS NOT NULL;
+            INSERT INTO task_days (day, total, completed)
+            SELECT NEW.deadline_date, 1, NEW.status IS 'Selesai'
+            WHERE NEW.deadline_ts IS NOT NULL AND NEW.deadline_date IS NOT NULL
+            ON CONFLICT (day) DO UPDATE SET total = total + 1, completed = completed + excluded.completed;
+        END
+    ''')
+
+
+def migrate_archive(conn):
+    """Buat skema database arsip (skema 'archive' yang sudah di-ATTACH) jika belum ada"""
+    # Arsip tidak dibaca daftar tugas, jadi cukup satu tabel berisi catatan dan
+    # index FTS5 external content (teks tidak disimpan dua kali)
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA archive.user_version")
+    if cursor.fetchone()[0] >= 1:
+        return
+    cursor.execute("BEGIN")
+    try:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS archive.archived_tasks (
+                id INTEGER PRIMARY KEY,
+                task TEXT NOT NULL,
+                priority TEXT,
+                status TEXT,
+                created_date TEXT,
+                completed_date TEXT,
+                deadline_date TEXT,
+                deadline_time TEXT,
+                deadline_ts INTEGER,
+                recurrence TEXT,
+                notes TEXT,
+                archived_date TEXT NOT NULL
+            )
+        ''')
+        try:
+            cursor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS archive.archived_fts USING fts5("
+                "task, notes, content = 'archived_tasks', content_rowid = 'id', "
+                "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+            )
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS archive.trg_archived_fts_insert AFTER INSERT ON archived_tasks BEGIN
+                    INSERT INTO archived_fts (rowid, task, notes) VALUES (NEW.id, NEW.task, ifnull(NEW.notes, ''));
+                END
+            ''')
+            cursor.execute('''
+                CREATE TRIGGER IF NOT EXISTS archive.trg_archived_fts_delete AFTER DELETE ON archived_tasks BEGIN
+                    INSERT INTO archived_fts (archived_fts, rowid, task, notes)
+                    VALUES ('delete', OLD.id, OLD.task, ifnull(OLD.notes, ''));
+                END
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite tanpa FTS5: search_archive memakai LIKE
+            pass
+        cursor.execute("PRAGMA archive.user_version = 1")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+
+# Urutan migrasi skema; versi database disimpan di PRAGMA user_version
+MIGRATIONS = [
+    migrate_v1_base_schema,
+    migrate_v2_indexes,
+    migrate_v3_deadline_ts,
+    migrate_v4_task_stats,
+    migrate_v5_search_index,
+    migrate_v6_task_notes,
+    migrate_v7_sort_indexes,
+    migrate_v8_journal,
+    migrate_v9_changes,
+    migrate_v10_recurrence,
+    migrate_v11_archive,
+    migrate_v12_task_days,
+]
+
+
+def migrate_database(conn, target_version=None):
+    """Upgrade skema database ke versi terbaru (atau target_version)"""
+    if target_version is None:
+        target_version = len(MIGRATIONS)
+    
+    cursor = conn.cursor()
+    cursor.execute("PRAGMA user_version")
+    version = cursor.fetchone()[0]
+    
+    # Setiap migrasi berjalan dalam satu transaksi bersama kenaikan versinya
+    while version < target_version:
+        cursor.execute("BEGIN")
+        try:
+            MIGRATIONS[version](cursor)
+            version += 1
+            cursor.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return version
+
+
+def apply_storage_profile(conn, profile):
+    """Terapkan PRAGMA dari profil penyimpanan ke satu koneksi"""
+    for pragma in ("journal_mode", "synchronous", "mmap_size", "cache_size", "wal_autocheckpoint"):
+        conn.execute(f"PRAGMA {pragma} = {profile[pragma]}")
+
+
+def archive_path(db_path):
+    """File database arsip untuk db_path (todo_list.db -> todo_list_archive.db)"""
+    root, ext = os.path.splitext(db_path)
+    return f"{root}_archive{ext}"
+
+
+def deadline_timestamp(deadline_date, deadline_time):
+    """Epoch detik (waktu lokal) dari deadline teks, atau None jika tidak valid"""
+    try:
+        return int(datetime.strptime(f"{deadline_date} {deadline_time}", "%Y-%m-%d %H:%M").timestamp())
+    except (TypeError, ValueError):
+        return None
+
+
+def fts_query(text):
+    """Ubah teks pencarian menjadi query FTS5: setiap kata dicocokkan sebagai awalan"""
+    terms = [term.replace('"', '""') for term in text.split()]
+    # Indeks awalan dimulai dari 2 karakter; kata 1 karakter dicocokkan utuh
+    return " ".join(f'"{term}"*' if len(term) > 1 else f'"{term}"' for term in terms)
+
+
+def like_pattern(text):
+    """Pola LIKE 'mengandung teks'; % dan _ di teks dicocokkan apa adanya (ESCAPE '\\')"""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def keyset_segments(column, key, op):
+    """Kondisi WHERE keyset pagination pada (column, id), dipecah per segmen berurutan"""
+    # Setiap segmen satu rentang index: sisa baris bernilai sama (column = ? AND
+    # id > ?), lalu nilai berikutnya (column > ?). Perbandingan row value atau OR
+    # membuat SQLite memindai seluruh kelompok nilai yang sama (misalnya prioritas).
+    # NULL berada paling awal pada urutan naik dan dibaca sebagai segmen sendiri.
+    # Segmen berikutnya hanya di-query jika segmen sebelumnya kurang dari limit.
+    value, task_id = key
+    null_column = column.split()[0]  # tanpa COLLATE
+    direction = op[0]
+    if value is None:
+        segments = [(f"{null_column} IS NULL AND id {op} ?", (task_id,))]
+        if direction == ">":
+            segments.append((f"{null_column} IS NOT NULL", ()))
+        return segments
+    
+    segments = [(f"{column} = ? AND id {op} ?", (value, task_id)), (f"{column} {direction} ?", (value,))]
+    if direction == "<":
+        segments.append((f"{null_column} IS NULL", ()))
+    return segments
+
+
+# ----------------------------------------------------------------------
+# Validasi dan import/export massal (CSV dan JSON Lines)
+# ----------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=4096)
+def parse_deadline(deadline_date, deadline_time):
+    """Validasi deadline dengan aturan form tugas; kembalikan (YYYY-MM-DD, HH:MM)"""
+    # ValueError untuk format salah, tanggal tidak ada (31/02), atau jam di luar batas
+    year, month, day = (int(part) for part in deadline_date.split("-"))
+    hour, minute = (int(part) for part in deadline_time.split(":"))
+    datetime(year, month, day, hour, minute)
+    return f"{year:04d}-{month:02d}-{day:02d}", f"{hour:02d}:{minute:02d}"
+
+
+def parse_date(text):
+    """Tanggal filter dari 'YYYY-MM-DD' atau 'DD/MM/YYYY'; None jika kosong"""
+    text = (text or "").strip()
+    if not text:
+        return None
+    if "/" in text:
+        day, month, year = text.split("/")
+        text = f"{year}-{month}-{day}"
+    return parse_deadline(text, "00:00")[0]
+
+
+@functools.lru_cache(maxsize=256)
+def parse_rule(rule):
+    """Aturan berulang -> (freq, interval, byday, bymonthday, until); ValueError jika tidak valid"""
+    parts = {}
+    for part in rule.upper().split(";"):
+        key, sep, value = part.strip().partition("=")
+        if not sep or key in parts:
+            raise ValueError(f"Aturan berulang tidak valid: {rule}")
+        parts[key] = value.strip()
+    unknown = set(parts) - {"FREQ", "INTERVAL", "BYDAY", "BYMONTHDAY", "UNTIL"}
+    if unknown:
+        raise ValueError(f"Bagian aturan berulang tidak didukung: {', '.join(sorted(unknown))}")
+    
+    freq = parts.get("FREQ")
+    if freq not in RECURRENCE_FREQS:
+        raise ValueError(f"FREQ harus salah satu dari {', '.join(RECURRENCE_FREQS)}")
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        byday = None
+        if "BYDAY" in parts and freq == "WEEKLY":
+            byday = tuple(sorted({WEEKDAYS.index(day.strip()) for day in parts["BYDAY"].split(",")}))
+        bymonthday = int(parts["BYMONTHDAY"]) if "BYMONTHDAY" in parts and freq == "MONTHLY" else None
+        until = None
+        if "UNTIL" in parts:
+            until = datetime.strptime(parts["UNTIL"].replace("-", "")[:8], "%Y%m%d").date()
+    except ValueError:
+        raise ValueError(f"Aturan berulang tidak valid: {rule}") from None
+    if not 1 <= interval <= 999 or (bymonthday is not None and not 1 <= bymonthday <= 31):
+        raise ValueError(f"Aturan berulang tidak valid: {rule}")
+    if ("BYDAY" in parts and byday is None) or ("BYMONTHDAY" in parts and bymonthday is None):
+        raise ValueError("BYDAY hanya untuk FREQ=WEEKLY, BYMONTHDAY hanya untuk FREQ=MONTHLY")
+    return freq, interval, byday, bymonthday, until
+
+
+def normalize_rule(rule, deadline_date):
+    """Bentuk baku aturan berulang (singkatan RECURRENCE_PRESETS diterima); None jika kosong"""
+    rule = (rule or "").strip()
+    if not rule:
+        return None
+    if not deadline_date:
+        raise ValueError("Tugas berulang harus punya deadline")
+    freq, interval, byday, bymonthday, until = parse_rule(RECURRENCE_PRESETS.get(rule.lower(), rule))
+    # Tanggal bulanan dikunci dari deadline pertama: setelah 28 Februari, tugas
+    # tanggal 31 kembali ke 31 Maret, tidak ikut bergeser ke tanggal 28. Deadline
+    # yang dipindah pengguna menggeser tanggal ini lewat move_rule.
+    if freq == "MONTHLY" and bymonthday is None:
+        bymonthday = int(deadline_date[8:10])
+    parts = [f"FREQ={freq}"]
+    if interval != 1:
+        parts.append(f"INTERVAL={interval}")
+    if byday:
+        parts.append("BYDAY=" + ",".join(WEEKDAYS[day] for day in byday))
+    if bymonthday:
+        parts.append(f"BYMONTHDAY={bymonthday}")
+    if until:
+        parts.append(f"UNTIL={until:%Y%m%d}")
+    return ";".join(parts)
+
+
+def move_rule(rule, old_date, new_date):
+    """Aturan berulang tugas yang deadline-nya dipindah dari old_date ke new_date"""
+    # BYMONTHDAY yang jatuh tepat di deadline lama (termasuk 31 yang dipotong ke
+    # akhir Februari) berasal dari deadline itu, jadi ikut tanggal deadline baru.
+    # Tanggal yang sengaja berbeda dari deadline-nya tetap dipertahankan.
+    if not rule or not old_date or not new_date or old_date == new_date:
+        return rule
+    try:
+        bymonthday = parse_rule(rule)[3]
+        old = date.fromisoformat(old_date)
+    except ValueError:
+        return rule
+    if bymonthday is None or month_day(old.year * 12 + old.month - 1, bymonthday).date() != old:
+        return rule
+    parts = [part for part in rule.split(";") if not part.upper().startswith("BYMONTHDAY=")]
+    return normalize_rule(";".join(parts), new_date)
+
+
+def occurrences(rule, first, start=None, end=None):
+    """Kejadian aturan (datetime lokal) mulai dari first, hanya yang di rentang [start, end]"""
+    # Generator: kejadian dihitung satu per satu saat diminta. Awal rentang dicapai
+    # dengan lompatan aritmetika, jadi tugas harian bertahun-tahun tidak diulang per hari.
+    freq, interval, byday, bymonthday, until = parse_rule(rule)
+    start = max(start or first, first)
+    
+    if freq == "DAILY":
+        step = timedelta(days=interval)
+        candidate = first + (start - first) // step * step
+        candidates = (candidate + step * index for index in range(2 ** 31))
+    elif freq == "WEEKLY":
+        days = byday or (first.weekday(),)
+        monday = first - timedelta(days=first.weekday())
+        step = 7 * interval
+        week = monday + timedelta(days=(start - monday).days // step * step)
+        candidates = (
+            week + timedelta(days=step * index + day)
+            for index in range(2 ** 31) for day in days
+        )
+    else:
+        day = bymonthday or first.day
+        month = first.year * 12 + first.month - 1
+        month += ((start.year * 12 + start.month - 1) - month) // interval * interval
+        candidates = (
+            month_day(month + interval * index, day).replace(hour=first.hour, minute=first.minute)
+            for index in range(2 ** 31)
+        )
+    
+    for candidate in candidates:
+        if candidate < start:
+            continue
+        if (end is not None and candidate > end) or (until is not None and candidate.date() > until):
+            return
+        yield candidate
+
+
+def month_day(month, day):
+    """Tanggal day pada bulan ke-month (tahun * 12 + bulan - 1); dipotong ke akhir bulan"""
+    year, month = divmod(month, 12)
+    following = date(year + (month + 1) // 12, (month + 1) % 12 + 1, 1)
+    return datetime(year, month + 1, min(day, (following - timedelta(days=1)).day))
+
+
+def next_occurrence(rule, current, after):
+    """Kejadian pertama setelah after (deadline beresolusi menit); None jika aturan sudah habis"""
+    after = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    return next(occurrences(rule, current, after), None)
+
+
+def describe_rule(rule):
+    """Ringkasan aturan berulang untuk ditampilkan, misalnya 'Setiap 2 minggu (Sen, Rab)'"""
+    freq, interval, byday, bymonthday, until = parse_rule(rule)
+    unit = {"DAILY": "hari", "WEEKLY": "minggu", "MONTHLY": "bulan"}[freq]
+    if interval == 1:
+        text = {"DAILY": "Harian", "WEEKLY": "Mingguan", "MONTHLY": "Bulanan"}[freq]
+    else:
+        text = f"Setiap {interval} {unit}"
+    if byday:
+        text += " (" + ", ".join(DAY_NAMES[day] for day in byday) + ")"
+    if bymonthday:
+        text += f" (tgl {bymonthday})"
+    if until:
+        text += f" sampai {until:%d/%m/%Y}"
+    return text
+
+
+def file_format(path, fmt=None):
+    """Tentukan format file dari argumen atau ekstensinya"""
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt in ("jsonl", "ndjson"):
+        return "jsonl"
+    if fmt == "csv":
+        return "csv"
+    raise ValueError(f"Format file tidak didukung: {path}")
+
+
+def read_records(f, fmt):
+    """Baca file teks yang sudah dibuka baris demi baris; hasilkan (nomor baris, dict)"""
+    if fmt == "csv":
+        import csv
+        # Baris 1 adalah header
+        for line_no, record in enumerate(csv.DictReader(f), start=2):
+            yield line_no, record
+    else:
+        for line_no, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except ValueError:
+                yield line_no, None
+
+
+def record_writer(f, fmt):
+    """Fungsi penulis satu baris EXPORT_FIELDS ke file teks yang sudah dibuka; header CSV langsung ditulis"""
+    if fmt == "csv":
+        import csv
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_FIELDS)
+        return writer.writerow
+    
+    def write(row):
+        f.write(json.dumps(dict(zip(EXPORT_FIELDS, row)), ensure_ascii=False) + "\n")
+    return write
+
+
+def import_values(record, created_date):
+    """Ubah satu record import menjadi nilai kolom tasks + catatan"""
+    if not isinstance(record, dict):
+        raise ValueError("Baris bukan objek JSON yang valid")
+    
+    def field(name, default=""):
+        value = record.get(name)
+        if value is None:
+            return default
+        return str(value).strip() or default
+    
+    task = field("task")
+    if not task:
+        raise ValueError("Tugas tidak boleh kosong")
+    priority = field("priority", "Sedang")
+    if priority not in PRIORITIES:
+        raise ValueError(f"Prioritas tidak dikenal: {priority}")
+    status = field("status", "Belum Selesai")
+    if status not in STATUSES:
+        raise ValueError(f"Status tidak dikenal: {status}")
+    
+    deadline_date = deadline_time = None
+    if field("deadline_date"):
+        try:
+            deadline_date, deadline_time = parse_deadline(field("deadline_date"), field("deadline_time", "00:00"))
+        except ValueError:
+            raise ValueError("Tanggal tidak valid") from None
+    
+    completed_date = field("completed_date", None) if status == "Selesai" else None
+    recurrence = normalize_rule(field("recurrence"), deadline_date)
+    values = (task, priority, status, field("created_date", created_date), completed_date,
+              deadline_date, deadline_time, recurrence)
+    return values, field("notes")
+
+
+@contextlib.contextmanager
+def deferred_triggers(cursor, names):
+    """Matikan trigger sementara di dalam transaksi lalu buat ulang dari definisinya"""
+    # DDL ikut transaksi: koneksi lain tetap melihat trigger sampai commit, dan
+    # trigger sudah kembali sebelum commit. Nama trigger yang ada dikembalikan.
+    cursor.execute(
+        f"SELECT name, sql FROM sqlite_master WHERE type = 'trigger' "
+        f"AND name IN ({', '.join('?' for _ in names)})",
+        names
+    )
+    triggers = dict(cursor.fetchall())
+    for name in triggers:
+        cursor.execute(f"DROP TRIGGER {name}")
+    try:
+        yield triggers
+    finally:
+        # Jika SQLite sudah membatalkan transaksi, trigger ikut kembali lewat rollback
+        if cursor.connection.in_transaction:
+            for sql in triggers.values():
+                cursor.execute(sql)
+
+
+def mark_bulk_change(cursor, deferred):
+    """Ganti baris changes per tugas dengan satu penanda muat ulang jika triggernya ditunda"""
+    if any(name.startswith("trg_changes_") for name in deferred):
+        cursor.execute("INSERT INTO changes (task_id) VALUES (NULL)")
+
+
+def ids_condition(task_ids):
+    """Kondisi WHERE untuk daftar ID, dikirim sebagai satu array JSON"""
+    return "id IN (SELECT value FROM json_each(?))", (json.dumps(list(task_ids)),)
+
+
+def throughput(count, seconds):
+    """Teks ringkas jumlah baris dan kecepatan per detik"""
+    rate = count / seconds if seconds > 0 else 0
+    return f"{count} tugas dalam {seconds:.1f} s ({rate:,.0f} tugas/detik)"
+
+
+class TaskView:
+    """Urutan dan filter daftar tugas yang diterjemahkan ke query SQL ber-index"""
+    
+    def __init__(self, sort="deadline", descending=False, status=None, priority=None,
+                 overdue=False, date_from=None, date_to=None):
+        if sort not in SORT_COLUMNS:
+            raise ValueError(f"Kolom urut tidak dikenal: {sort}")
+        self.sort = sort
+        self.sort_column = SORT_COLUMNS[sort]
+        self.descending = descending
+        self.status = status
+        self.priority = priority
+        self.overdue = overdue
+        # Rentang deadline (YYYY-MM-DD), keduanya inklusif
+        self.date_from = date_from
+        self.date_to = date_to
+        # Klausa FROM hasil TodoStore.view_source, dihitung sekali per view
+        self.source = None
+    
+    def options(self):
+        """Argumen konstruktor view ini (untuk dikirim ke todo_server)"""
+        return {
+            "sort": self.sort,
+            "descending": self.descending,
+            "status": self.status,
+            "priority": self.priority,
+            "overdue": self.overdue,
+            "date_from": self.date_from,
+            "date_to": self.date_to,
+        }
+    
+    def filtered(self):
+        """True jika ada filter yang membatasi baris"""
+        return bool(self.status or self.priority or self.overdue or self.date_from or self.date_to)
+    
+    def is_default(self):
+        """True untuk urutan bawaan daftar (deadline naik) tanpa filter"""
+        return self.sort == "deadline" and not self.descending and not self.filtered()
+    
+    def sort_index(self):
+        """Index yang sekaligus memberi urutan view (None = urutan rowid)"""
+        # (status, deadline_ts) sudah terurut per deadline untuk satu status
+        if self.sort == "deadline" and (self.status or self.overdue):
+            return "idx_tasks_status_deadline_ts"
+        return SORT_INDEXES[self.sort]
+    
+    def where(self):
+        """Kondisi WHERE filter beserta parameternya"""
+        conditions, params = [], []
+        if self.status:
+            conditions.append("status = ?")
+            params.append(self.status)
+        if self.priority:
+            conditions.append("priority = ?")
+            params.append(self.priority)
+        if self.overdue:
+            conditions.append(OVERDUE_SQL)
+        # Deadline beresolusi menit, jadi 23:59 sudah mencakup seluruh hari terakhir.
+        # Tugas berulang disaring menurut kejadian berikutnya (deadline_ts); semua
+        # kejadiannya di satu rentang dihitung TodoStore.agenda.
+        if self.date_from:
+            conditions.append("deadline_ts >= ?")
+            params.append(deadline_timestamp(self.date_from, "00:00"))
+        if self.date_to:
+            conditions.append("deadline_ts <= ?")
+            params.append(deadline_timestamp(self.date_to, "23:59"))
+        return " AND ".join(conditions) or "1", params
+    
+    def order_by(self, reverse=False):
+        """ORDER BY kolom urut lalu id, searah agar keyset cukup satu perbandingan"""
+        direction = "DESC" if self.descending != reverse else "ASC"
+        return f"{self.sort_column} {direction}, id {direction}"
+    
+    def after(self, key, inclusive=False):
+        """Segmen keyset untuk baris setelah key dalam urutan view"""
+        op = "<" if self.descending else ">"
+        return keyset_segments(self.sort_column, key, op + "=" if inclusive else op)
+    
+    def before(self, key):
+        """Segmen keyset untuk baris sebelum key (dibaca dengan order_by(reverse=True))"""
+        return keyset_segments(self.sort_column, key, ">" if self.descending else "<")
+
+
+# Urutan bawaan: deadline terdekat lebih dulu, semua tugas
+DEFAULT_VIEW = TaskView()
+
+
+class TodoStore:
+    """Operasi tugas tanpa GUI: dipakai TodoApp, DatabaseWorker, CLI, dan skrip"""
+    
+    # Koneksi autocommit: setiap method satu statement langsung tersimpan, method
+    # multi-statement memakai transaction(). Di dalam transaksi DatabaseWorker,
+    # transaction() menjadi SAVEPOINT sehingga group commit tetap berlaku.
+    
+    def __init__(self, db_path=DB_PATH, profile=None):
+        self.conn = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT_S, isolation_level=None)
+        attach(self.conn)
+        # Hanya berlaku untuk file baru (sebelum tabel pertama dan mode WAL);
+        # database lama dikonversi oleh VACUUM pertama di compact()
+        self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self.archive_path = archive_path(db_path)
+        apply_storage_profile(self.conn, profile or STORAGE_PROFILES[STORAGE_PROFILE])
+        migrate_database(self.conn)
+        self.cursor = self.conn.cursor()
+    
+    def close(self):
+        """Tutup koneksi database"""
+        self.conn.close()
+    
+    @contextlib.contextmanager
+    def transaction(self):
+        """BEGIN/COMMIT, atau SAVEPOINT jika sudah berada di dalam transaksi"""
+        if self.conn.in_transaction:
+            self.cursor.execute("SAVEPOINT store")
+            try:
+                yield
+            except BaseException:
+                self.cursor.execute("ROLLBACK TO store")
+                self.cursor.execute("RELEASE store")
+                raise
+            self.cursor.execute("RELEASE store")
+            return
+        
+        # IMMEDIATE: semua transaksi di sini menulis. BEGIN biasa yang membaca dulu
+        # langsung gagal "database is locked" jika proses lain commit sebelum tulis
+        # pertamanya; kunci yang diambil di awal menunggu lewat busy timeout.
+        self.cursor.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            if self.conn.in_transaction:
+                self.cursor.execute("ROLLBACK")
+            raise
+        self.cursor.execute("COMMIT")
+    
+    # ------------------------------------------------------------------
+    # Baca
+    # ------------------------------------------------------------------
+    
+    @traced("query")
+    def get_task(self, task_id):
+        """Satu baris TASK_COLUMNS, atau None jika tugas tidak ada"""
+        self.cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE id = ?", (task_id,))
+        return self.cursor.fetchone()
+    
+    @traced("query")
+    def get_tasks(self, task_ids):
+        """Baris TASK_COLUMNS untuk banyak ID dalam satu query (urutan tidak dijamin)"""
+        # Daftar ID dikirim sebagai satu array JSON, jadi tidak terbatas jumlah parameter SQL
+        condition, params = ids_condition(task_ids)
+        self.cursor.execute(f"SELECT {TASK_COLUMNS} FROM tasks WHERE {condition}", params)
+        return self.cursor.fetchall()
+    
+    @traced("query")
+    def get_deadline(self, task_id):
+        """Deadline teks dan aturan berulang (deadline_date, deadline_time, recurrence) satu tugas"""
+        self.cursor.execute("SELECT deadline_date, deadline_time, recurrence FROM tasks WHERE id = ?", (task_id,))
+        return self.cursor.fetchone()
+    
+    @traced("query")
+    def get_notes(self, task_id):
+        """Isi catatan satu tugas (dibaca hanya saat dibutuhkan)"""
+        self.cursor.execute("SELECT body FROM task_notes WHERE task_id = ?", (task_id,))
+        row = self.cursor.fetchone()
+        return row[0] if row else ""
+    
+    def view_source(self, view):
+        """Klausa FROM untuk view; filter yang tidak selektif dipaksa memakai index urut"""
+        # Tanpa ini SQLite bisa memilih index filter lalu mengurutkan ratusan ribu
+        # baris di temp B-tree untuk setiap halaman
+        if view.source is None:
+            view.source = "tasks"
+            if view.filtered():
+                condition, params = view.where()
+                self.cursor.execute(
+                    f"SELECT COUNT(*) FROM (SELECT 1 FROM tasks WHERE {condition} LIMIT ?)",
+                    (*params, SORT_INDEX_MIN_ROWS)
+                )
+                if self.cursor.fetchone()[0] >= SORT_INDEX_MIN_ROWS:
+                    index = view.sort_index()
+                    view.source = f"tasks INDEXED BY {index}" if index else "tasks NOT INDEXED"
+        return view.source
+    
+    @traced("query")
+    def list_tasks(self, limit=-1, offset=0, view=DEFAULT_VIEW):
+        """Baris TASK_COLUMNS + nilai kolom urut dalam urutan view; limit -1 berarti semua"""
+        # Nilai kolom urut (indeks 9) dipakai sebagai kunci keyset (nilai, id)
+        condition, params = view.where()
+        self.cursor.execute(
+            f"SELECT {TASK_COLUMNS}, {view.sort_column} FROM {self.view_source(view)} "
+            f"WHERE {condition} ORDER BY {view.order_by()} LIMIT ? OFFSET ?",
+            (*params, limit, offset)
+        )
+        return self.cursor.fetchall()
+    
+    @traced("query")
+    def tasks_after(self, key, limit, inclusive=False, view=DEFAULT_VIEW):
+        """Baris setelah kunci urut (keyset pagination maju)"""
+        if key is None:
+            return self.list_tasks(limit, view=view)
+        return self.keyset_rows(view, view.after(key, inclusive), view.order_by(), limit)
+    
+    @traced("query")
+    def tasks_before(self, key, limit, view=DEFAULT_VIEW):
+        """Baris sebelum kunci urut (keyset pagination mundur), hasil tetap dalam urutan view"""
+        rows = self.keyset_rows(view, view.before(key), view.order_by(reverse=True), limit)
+        rows.reverse()
+        return rows
+    
+    def keyset_rows(self, view, segments, order, limit):
+        """Baca segmen keyset berurutan sampai limit terpenuhi"""
+        condition, params = view.where()
+        rows = []
+        for segment, segment_params in segments:
+            # Segmen ditulis lebih dulu: jika filter juga membatasi kolom yang sama
+            # (terlambat = deadline <= now), SQLite memakai batas dari term pertama
+            self.cursor.execute(
+                f"SELECT {TASK_COLUMNS}, {view.sort_column} FROM {self.view_source(view)} "
+                f"WHERE {segment} AND {condition} ORDER BY {order} LIMIT ?",
+                (*segment_params, *params, limit - len(rows))
+            )
+            rows.extend(self.cursor.fetchall())
+            if len(rows) >= limit:
+                break
+        return rows
+    
+    @traced("query")
+    def count_total(self):
+        """Jumlah tugas dari counter task_stats (tanpa COUNT(*) atas seluruh tabel)"""
+        self.cursor.execute("SELECT total FROM task_stats WHERE id = 1")
+        return self.cursor.fetchone()[0]
+    
+    @traced("query")
+    def count_view(self, view=DEFAULT_VIEW):
+        """Jumlah tugas yang lolos filter view (counter task_stats jika tanpa filter)"""
+        if not view.filtered():
+            return self.count_total()
+        condition, params = view.where()
+        self.cursor.execute(f"SELECT COUNT(*) FROM tasks WHERE {condition}", params)
+        return self.cursor.fetchone()[0]
+    
+    @traced("query")
+    def count_tasks(self):
+        """Hitung total, selesai, dan terlambat tanpa membaca daftar tugas"""
+        # total/selesai dibaca dari task_stats; terlambat bergantung waktu sehingga
+        # dihitung dari rentang index (status, deadline_ts)
+        self.cursor.execute(
+            f"SELECT total, completed, (SELECT COUNT(*) FROM tasks WHERE {OVERDUE_SQL}) "
+            "FROM task_stats WHERE id = 1"
+        )
+        return self.cursor.fetchone()
+    
+    @traced("query")
+    def upcoming_deadlines(self, after, limit):
+        """(deadline_ts, id) tugas belum selesai setelah kunci after, urut deadline terdekat"""
+        # Rentang index (status, deadline_ts); tugas tanpa deadline (NULL) tidak ikut
+        self.cursor.execute(
+            "SELECT deadline_ts, id FROM tasks WHERE status = 'Belum Selesai' "
+            "AND (deadline_ts, id) > (?, ?) ORDER BY deadline_ts, id LIMIT ?",
+            (*after, limit)
+        )
+        return self.cursor.fetchall()
+    
+    @traced("query")
+    def agenda(self, date_from, date_to, limit=AGENDA_LIMIT):
+        """(epoch, baris TASK_COLUMNS) setiap kejadian tugas di rentang tanggal, urut waktu"""
+        # Kejadian tugas berulang dihitung hanya untuk rentang ini dan tidak
+        # disimpan. Kejadian berikutnya sudah ada di deadline_ts, jadi tugas biasa
+        # dan kejadian saat ini dibaca dari index deadline; hanya tugas berulang
+        # yang deadline-nya sebelum akhir rentang yang diperluas (index parsial).
+        start_ts = deadline_timestamp(date_from, "00:00")
+        end_ts = deadline_timestamp(date_to, "23:59")
+        self.cursor.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks WHERE deadline_ts BETWEEN ? AND ? "
+            f"ORDER BY {TASK_ORDER} LIMIT ?",
+            (start_ts, end_ts, limit)
+        )
+        items = [(row[4], row) for row in self.cursor.fetchall()]
+        items.extend(self.recurring_between(start_ts, end_ts, limit))
+        items.sort(key=lambda item: (item[0], item[1][0]))
+        return items[:limit]
+    
+    def recurring_between(self, start_ts, end_ts, limit=AGENDA_LIMIT):
+        """(epoch, baris TASK_COLUMNS) kejadian tugas berulang di rentang, selain deadline-nya sendiri"""
+        self.cursor.execute(
+            f"SELECT {TASK_COLUMNS}, recurrence, deadline_date || ' ' || deadline_time "
+            "FROM tasks INDEXED BY idx_tasks_recurring "
+            "WHERE recurrence IS NOT NULL AND deadline_ts <= ? AND status != 'Selesai'",
+            (end_ts,)
+        )
+        start = datetime.fromtimestamp(start_ts)
+        end = datetime.fromtimestamp(end_ts)
+        items = []
+        for row in self.cursor.fetchall():
+            try:
+                first = datetime.strptime(row[10], "%Y-%m-%d %H:%M")
+                # Kejadian saat ini (= deadline) sudah terbaca lewat index deadline
+                later = occurrences(row[9], first, max(start, first + timedelta(minutes=1)), end)
+                items.extend((int(moment.timestamp()), row[:9]) for _, moment in zip(range(limit), later))
+            except ValueError:
+                continue
+        return items
+    
+    @traced("query")
+    def calendar_days(self, date_from, date_to, titles=CALENDAR_TITLES):
+        """{tanggal: [jumlah, selesai, terlambat, [(id, jam, tugas, state), ...]]} untuk hari berdeadline"""
+        # Satu query: jumlah per hari dari task_days (primary key), lalu per hari
+        # hanya `titles` tugas pertama yang dibaca lewat index deadline_ts. Biaya
+        # satu bulan tidak bergantung pada banyaknya tugas di bulan itu. Terlambat
+        # = belum selesai untuk hari yang sudah lewat; hari ini dihitung per jam.
+        today = date.today().isoformat()
+        self.cursor.execute(
+            "SELECT day, total, completed, "
+            "CASE WHEN day < ? THEN total - completed WHEN day > ? THEN 0 ELSE ("
+            f"    SELECT COUNT(*) FROM tasks WHERE deadline_ts BETWEEN ? AND ? AND deadline_date = day "
+            f"    AND {OVERDUE_SQL}"
+            ") END, ("
+            "    SELECT json_group_array(json_array(id, deadline_time, task, state)) FROM ("
+            f"        SELECT id, deadline_time, task, {STATE_SQL} AS state FROM tasks "
+            "        WHERE deadline_ts >= CAST(strftime('%s', day, 'utc') AS INTEGER) "
+            "        AND deadline_ts < CAST(strftime('%s', day, '+1 day', 'utc') AS INTEGER) "
+            "        AND deadline_date = day ORDER BY deadline_ts, id LIMIT ?"
+            "    )"
+            ") FROM task_days WHERE day BETWEEN ? AND ? AND total > 0",
+            (today, today, deadline_timestamp(today, "00:00"), deadline_timestamp(today, "23:59"),
+             titles, date_from, date_to)
+        )
+        days = {
+            day: [count, completed, overdue, [tuple(item) for item in json.loads(items)]]
+            for day, count, completed, overdue, items in self.cursor.fetchall()
+        }
+        
+        # Kejadian tugas berulang setelah deadline-nya (yang sudah terhitung di atas)
+        now = time.time()
+        touched = set()
+        start_ts = deadline_timestamp(date_from, "00:00")
+        end_ts = deadline_timestamp(date_to, "23:59")
+        for moment, row in self.recurring_between(start_ts, end_ts):
+            when = datetime.fromtimestamp(moment)
+            key = when.strftime("%Y-%m-%d")
+            day = days.setdefault(key, [0, 0, 0, []])
+            state = "overdue" if moment <= now else "pending"
+            day[0] += 1
+            day[2] += state == "overdue"
+            day[3].append((row[0], when.strftime("%H:%M"), row[1], state))
+            touched.add(key)
+        for key in touched:
+            days[key][3] = sorted(days[key][3], key=lambda item: (item[1], item[0]))[:titles]
+        return days
+    
+    @traced("query")
+    def search(self, text, limit=SEARCH_LIMIT, view=DEFAULT_VIEW):
+        """Cari tugas berdasarkan judul dan catatan, diurutkan dari yang paling relevan"""
+        # Filter view ikut berlaku; urutan hasil tetap berdasarkan relevansi.
+        # Teks tanpa kata (kosong/spasi) tidak cocok dengan apa pun.
+        if not text.split():
+            return []
+        condition, params = view.where()
+        self.cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'tasks_fts'")
+        if self.cursor.fetchone() is None:
+            # SQLite tanpa FTS5: cocokkan seluruh teks dengan LIKE
+            pattern = like_pattern(text)
+            self.cursor.execute(
+                f"SELECT {TASK_COLUMNS} FROM tasks WHERE (task LIKE ? ESCAPE '\\' "
+                "OR id IN (SELECT task_id FROM task_notes WHERE body LIKE ? ESCAPE '\\')) "
+                f"AND {condition} ORDER BY {TASK_ORDER} LIMIT ?",
+                (pattern, pattern, *params, limit)
+            )
+            return self.cursor.fetchall()
+        
+        # rank FTS5 = bm25, nilai lebih kecil berarti lebih relevan. Peringkat dihitung
+        # atas SEARCH_CANDIDATES kecocokan terbaru saja, bukan seluruh doclist.
+        # Filter dicek per kecocokan lewat primary key sebelum kandidat dibatasi,
+        # jadi kecocokan lama yang lolos filter tidak tergeser kecocokan baru.
+        match_filter = ""
+        if view.filtered():
+            match_filter = f"AND EXISTS (SELECT 1 FROM tasks WHERE id = tasks_fts.rowid AND {condition}) "
+        self.cursor.execute(
+            f"SELECT {TASK_COLUMNS} FROM tasks JOIN ("
+            "    SELECT match_id, match_rank FROM ("
+            "        SELECT rowid AS match_id, rank AS match_rank FROM tasks_fts "
+            f"        WHERE tasks_fts MATCH ? {match_filter}ORDER BY rowid DESC LIMIT ?"
+            "    ) ORDER BY match_rank LIMIT ?"
+            ") ON tasks.id = match_id ORDER BY match_rank",
+            (fts_query(text), *params, max(limit, SEARCH_CANDIDATES), limit)
+        )
+        return self.cursor.fetchall()
+    
+    # ------------------------------------------------------------------
+    # Tulis
+    # ------------------------------------------------------------------
+    
+    # Setiap operasi tulis dicatat di journal dalam transaksi yang sama (lihat
+    # journaled), sehingga bisa dibatalkan dengan undo() dan diulang dengan redo().
+    
+    @traced("write")
+    def add_task(self, task, priority="Sedang", deadline_date=None, deadline_time=None, created_date=None,
+                 recurrence=None):
+        """Simpan tugas baru dan kembalikan ID-nya; ValueError jika data tidak valid"""
+        task = task.strip()
+        if not task:
+            raise ValueError("Tugas tidak boleh kosong")
+        if priority not in PRIORITIES:
+            raise ValueError(f"Prioritas tidak dikenal: {priority}")
+        if deadline_date:
+            try:
+                deadline_date, deadline_time = parse_deadline(deadline_date, deadline_time or "00:00")
+            except ValueError:
+                raise ValueError("Tanggal tidak valid") from None
+        recurrence = normalize_rule(recurrence, deadline_date)
+        created_date = created_date or datetime.now().strftime("%Y-%m-%d %H:%M")
+        
+        with self.journaled("Tambah tugas") as entry_id:
+            self.cursor.execute(
+                "INSERT INTO tasks (task, priority, status, created_date, deadline_date, deadline_time, deadline_ts, recurrence) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (task, priority, "Belum Selesai", created_date, deadline_date, deadline_time,
+                 deadline_timestamp(deadline_date, deadline_time), recurrence)
+            )
+            task_id = self.cursor.lastrowid
+            self.journal_added(entry_id, "id = ?", (task_id,))
+        return task_id
+    
+    @traced("write")
+    def complete_task(self, task_id, completed_date=None):
+        """Tandai tugas selesai; kembalikan False jika ID tidak ada"""
+        # Tugas berulang tidak pernah berstatus Selesai: deadline-nya maju ke kejadian berikutnya
+        with self.journaled("Tandai selesai", "id = ?", (task_id,)):
+            if self.advance_recurring([task_id]):
+                return True
+            self.cursor.execute(
+                "UPDATE tasks SET status = ?, completed_date = ? WHERE id = ?",
+                ("Selesai", completed_date or datetime.now().strftime("%Y-%m-%d %H:%M"), task_id)
+            )
+            return self.cursor.rowcount > 0
+    
+    @traced("write")
+    def update_task(self, task_id, task, deadline_date, deadline_time, recurrence=None):
+        """Ubah judul dan deadline tugas; recurrence None = aturan berulang tetap, "" = dihapus"""
+        # Aturan validasi sama dengan add_task (dan form edit)
+        task = task.strip()
+        if not task:
+            raise ValueError("Tugas tidak boleh kosong")
+        if deadline_date:
+            try:
+                deadline_date, deadline_time = parse_deadline(deadline_date, deadline_time or "00:00")
+            except ValueError:
+                raise ValueError("Tanggal tidak valid") from None
+        with self.journaled("Edit tugas", "id = ?", (task_id,)):
+            if recurrence is None:
+                self.cursor.execute("SELECT recurrence, deadline_date FROM tasks WHERE id = ?", (task_id,))
+                row = self.cursor.fetchone()
+                recurrence = move_rule(*row, deadline_date) if row else None
+            # Aturan tanpa deadline tidak punya kejadian pertama, jadi ikut dihapus
+            recurrence = normalize_rule(recurrence, deadline_date) if deadline_date else None
+            self.cursor.execute(
+                "UPDATE tasks SET task = ?, deadline_date = ?, deadline_time = ?, deadline_ts = ?, recurrence = ? WHERE id = ?",
+                (task, deadline_date, deadline_time, deadline_timestamp(deadline_date, deadline_time),
+                 recurrence, task_id)
+            )
+    
+    @traced("write")
+    def set_notes(self, task_id, notes):
+        """Simpan catatan tugas; catatan kosong dihapus dari task_notes"""
+        # Trigger task_notes menjaga tasks.has_notes dan index FTS tetap sinkron
+        with self.journaled("Ubah catatan", "id = ?", (task_id,)):
+            if not notes.strip():
+                self.cursor.execute("DELETE FROM task_notes WHERE task_id = ?", (task_id,))
+                return
+            self.cursor.execute(
+                "INSERT INTO task_notes (task_id, body) VALUES (?, ?) "
+                "ON CONFLICT (task_id) DO UPDATE SET body = excluded.body",
+                (task_id, notes)
+            )
+    
+    @traced("write")
+    def delete_task(self, task_id):
+        """Hapus satu tugas berdasarkan ID; kembalikan False jika ID tidak ada"""
+        with self.journaled("Hapus tugas", "id = ?", (task_id,)):
+            self.cursor.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+            return self.cursor.rowcount > 0
+    
+    # Operasi banyak tugas: satu executemany dalam satu transaction(), yaitu satu
+    # COMMIT di CLI atau satu savepoint di batch DatabaseWorker. Semua mengembalikan
+    # jumlah tugas yang benar-benar berubah.
+    
+    @traced("write")
+    def complete_tasks(self, task_ids, completed_date=None):
+        """Tandai banyak tugas selesai sekaligus"""
+        completed_date = completed_date or datetime.now().strftime("%Y-%m-%d %H:%M")
+        with self.journaled(f"Tandai selesai {len(task_ids)} tugas", *ids_condition(task_ids)):
+            advanced = set(self.advance_recurring(task_ids))
+            self.cursor.executemany(
+                "UPDATE tasks SET status = 'Selesai', completed_date = ? WHERE id = ? AND status != 'Selesai'",
+                [(completed_date, task_id) for task_id in task_ids if task_id not in advanced]
+            )
+            return self.cursor.rowcount + len(advanced)
+    
+    def advance_recurring(self, task_ids):
+        """Majukan deadline tugas berulang ke kejadian setelah sekarang; kembalikan ID-nya"""
+        # Aturan yang habis (UNTIL terlewati) atau rusak membuat tugas selesai seperti biasa
+        condition, params = ids_condition(task_ids)
+        self.cursor.execute(
+            "SELECT id, recurrence, deadline_date, deadline_time FROM tasks "
+            f"WHERE {condition} AND recurrence IS NOT NULL AND status != 'Selesai'",
+            params
+        )
+        now = datetime.now()
+        updates = []
+        for task_id, rule, deadline_date, deadline_time in self.cursor.fetchall():
+            try:
+                current = datetime.strptime(f"{deadline_date} {deadline_time}", "%Y-%m-%d %H:%M")
+                following = next_occurrence(rule, current, max(current, now))
+            except (TypeError, ValueError):
+                continue
+            if following is not None:
+                deadline_date, deadline_time = following.strftime("%Y-%m-%d"), following.strftime("%H:%M")
+                updates.append((deadline_date, deadline_time, deadline_timestamp(deadline_date, deadline_time), task_id))
+        self.cursor.executemany(
+            "UPDATE tasks SET deadline_date = ?, deadline_time = ?, deadline_ts = ? WHERE id = ?",
+            updates
+        )
+        return [update[-1] for update in updates]
+    
+    @traced("write")
+    def set_priority(self, task_ids, priority):
+        """Ubah prioritas banyak tugas sekaligus"""
+        return self.update_tasks(task_ids, priority=priority)
+    
+    @traced("write")
+    def reschedule_tasks(self, task_ids, deadline_date, deadline_time):
+        """Pindahkan deadline banyak tugas ke tanggal dan jam yang sama"""
+        # Tanggal wajib diisi: None berarti "tetap" di update_tasks
+        return self.update_tasks(task_ids, deadline_date=deadline_date or "", deadline_time=deadline_time)
+    
+    @traced("write")
+    def update_tasks(self, task_ids, priority=None, deadline_date=None, deadline_time=None):
+        """Ubah prioritas dan/atau deadline banyak tugas dalam satu entri journal; None = tetap"""
+        # Semua argumen divalidasi sebelum journal disentuh; aturan deadline sama
+        # dengan add_task/update_task
+        if priority is not None and priority not in PRIORITIES:
+            raise ValueError(f"Prioritas tidak dikenal: {priority}")
+        if deadline_date is not None:
+            try:
+                deadline_date, deadline_time = parse_deadline(deadline_date, deadline_time or "00:00")
+            except ValueError:
+                raise ValueError("Tanggal tidak valid") from None
+        if deadline_date is None:
+            label = f"Ubah prioritas {len(task_ids)} tugas"
+        elif priority is None:
+            label = f"Ubah deadline {len(task_ids)} tugas"
+        else:
+            label = f"Edit {len(task_ids)} tugas"
+        
+        with self.journaled(label, *ids_condition(task_ids)):
+            changed = 0
+            if priority is not None:
+                self.cursor.executemany(
+                    "UPDATE tasks SET priority = ? WHERE id = ? AND priority != ?",
+                    [(priority, task_id, priority) for task_id in task_ids]
+                )
+                changed = self.cursor.rowcount
+            if deadline_date is not None:
+                # Semua tugas yang ada ikut berubah, jadi jumlah ini sudah mencakup prioritas
+                deadline_ts = deadline_timestamp(deadline_date, deadline_time)
+                condition, params = ids_condition(task_ids)
+                self.cursor.execute(
+                    f"SELECT id, recurrence, deadline_date FROM tasks WHERE {condition} AND recurrence IS NOT NULL",
+                    params
+                )
+                # Tanggal bulanan yang berasal dari deadline lama ikut pindah (move_rule)
+                rules = []
+                for task_id, rule, old_date in self.cursor.fetchall():
+                    moved = move_rule(rule, old_date, deadline_date)
+                    if moved != rule:
+                        rules.append((moved, task_id))
+                self.cursor.executemany(
+                    "UPDATE tasks SET deadline_date = ?, deadline_time = ?, deadline_ts = ? WHERE id = ?",
+                    [(deadline_date, deadline_time, deadline_ts, task_id) for task_id in task_ids]
+                )
+                changed = self.cursor.rowcount
+                self.cursor.executemany("UPDATE tasks SET recurrence = ? WHERE id = ?", rules)
+            return changed
+    
+    @traced("write")
+    def delete_tasks(self, task_ids):
+        """Hapus banyak tugas sekaligus"""
+        with self.journaled(f"Hapus {len(task_ids)} tugas", *ids_condition(task_ids)):
+            self.cursor.executemany("DELETE FROM tasks WHERE id = ?", [(task_id,) for task_id in task_ids])
+            return self.cursor.rowcount
+    
+    @traced("write")
+    def clear_all(self):
+        """Hapus semua tugas (bisa dibatalkan dengan undo)"""
+        with self.journaled("Hapus semua tugas", "1"):
+            self.delete_bulk("1")
+    
+    def delete_bulk(self, where, params=()):
+        """Hapus tugas yang cocok dengan where; pekerjaan trigger dikerjakan sekali per himpunan"""
+        # Trigger delete per baris membuat DELETE 100k tugas ~25 detik, hampir
+        # semuanya untuk index FTS; versi per himpunan ~2 detik, hapus semua ~0,2 detik
+        cursor = self.cursor
+        with self.transaction(), deferred_triggers(cursor, BULK_DELETE_TRIGGERS) as deferred:
+            cursor.execute(
+                f"SELECT COUNT(*), COUNT(CASE WHEN status = 'Selesai' THEN 1 END) FROM tasks WHERE {where}",
+                params
+            )
+            deleted, completed = cursor.fetchone()
+            everything = deleted == self.count_total()
+            if "trg_task_stats_delete" in deferred:
+                cursor.execute(
+                    "UPDATE task_stats SET total = total - ?, completed = completed - ? WHERE id = 1",
+                    (deleted, completed)
+                )
+            if "trg_tasks_fts_delete" in deferred:
+                if everything:
+                    # FTS5 biasa tidak punya 'delete-all'; membuat ulang tabelnya jauh lebih cepat
+                    cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'tasks_fts'")
+                    fts_sql = cursor.fetchone()[0]
+                    cursor.execute("DROP TABLE tasks_fts")
+                    cursor.execute(fts_sql)
+                else:
+                    cursor.execute(f"DELETE FROM tasks_fts WHERE rowid IN (SELECT id FROM tasks WHERE {where})", params)
+            cursor.execute(f"DELETE FROM task_notes WHERE task_id IN (SELECT id FROM tasks WHERE {where})", params)
+            cursor.execute(f"DELETE FROM tasks WHERE {where}", params)
+            deleted = cursor.rowcount
+            mark_bulk_change(cursor, deferred)
+            return deleted
+    
+    # ------------------------------------------------------------------
+    # Journal undo/redo
+    # ------------------------------------------------------------------
+    
+    # Undo tidak menyalin ulang database: hanya tugas yang disentuh entri yang
+    # dihapus lalu diisi kembali dari salinan barisnya di journal_rows.
+    
+    @contextlib.contextmanager
+    def journaled(self, label, where=None, params=()):
+        """Transaksi yang dicatat sebagai satu entri journal; where = tugas yang akan diubah"""
+        # Tulisan yang tidak mengubah baris apa pun (ID tidak ada, tabel sudah
+        # kosong) dibatalkan lewat savepoint: tidak ada entri kosong di Undo dan
+        # cabang redo yang dihapus start_entry kembali utuh
+        with self.transaction():
+            self.cursor.execute("SAVEPOINT entry")
+            entry_id = self.start_entry(label)
+            rows = self.journal_before(entry_id, where, params) if where else 0
+            if rows >= JOURNAL_BULK_ROWS:
+                triggers = deferred_triggers(self.cursor, CHANGES_TRIGGERS)
+            else:
+                triggers = contextlib.nullcontext(())
+            with triggers as deferred:
+                changes = self.conn.total_changes
+                yield entry_id
+                changed = self.conn.total_changes != changes
+                mark_bulk_change(self.cursor, deferred)
+            if not changed:
+                self.cursor.execute("ROLLBACK TO entry")
+                self.cursor.execute("RELEASE entry")
+                return
+            self.cursor.execute("RELEASE entry")
+            self.compact_journal()
+    
+    def start_entry(self, label):
+        """Tambah entri journal baru; entri yang sudah di-undo tidak bisa di-redo lagi"""
+        self.cursor.execute("SELECT 1 FROM journal WHERE undone = 1 LIMIT 1")
+        if self.cursor.fetchone() is not None:
+            self.cursor.execute("DELETE FROM journal_rows WHERE entry_id IN (SELECT id FROM journal WHERE undone = 1)")
+            self.cursor.execute("DELETE FROM journal WHERE undone = 1")
+        self.cursor.execute(
+            "INSERT INTO journal (label, created_date) VALUES (?, ?)",
+            (label, datetime.now().strftime("%Y-%m-%d %H:%M"))
+        )
+        return self.cursor.lastrowid
+    
+    def journal_before(self, entry_id, where, params=()):
+        """Salin tugas yang cocok dengan where (sebelum diubah) ke entri journal; kembalikan jumlahnya"""
+        return self.copy_rows(entry_id, 0, where, params)
+    
+    def journal_added(self, entry_id, where, params=()):
+        """Catat tugas baru yang cocok dengan where; undo cukup menghapusnya"""
+        self.cursor.execute(
+            f"INSERT INTO journal_rows (entry_id, side, task_id) SELECT ?, 0, id FROM tasks WHERE {where}",
+            (entry_id, *params)
+        )
+        self.cursor.execute("UPDATE journal SET row_count = row_count + ? WHERE id = ?", (self.cursor.rowcount, entry_id))
+    
+    def copy_rows(self, entry_id, side, where, params=()):
+        """INSERT ... SELECT baris tugas (beserta catatan) ke journal_rows"""
+        self.cursor.execute(
+            f"INSERT INTO journal_rows (entry_id, side, task_id, {JOURNAL_FIELDS}, notes) "
+            f"SELECT ?, ?, id, {JOURNAL_FIELDS}, body FROM tasks "
+            f"LEFT JOIN task_notes ON task_notes.task_id = tasks.id WHERE {where}",
+            (entry_id, side, *params)
+        )
+        copied = self.cursor.rowcount
+        if side == 0:
+            self.cursor.execute("UPDATE journal SET row_count = row_count + ? WHERE id = ?", (copied, entry_id))
+        return copied
+    
+    def compact_journal(self):
+        """Buang entri terlama sampai jumlah entri dan baris kembali di bawah batas"""
+        self.cursor.execute("SELECT id, row_count FROM journal ORDER BY id DESC")
+        entries = self.cursor.fetchall()
+        kept_rows = 0
+        for index, (entry_id, row_count) in enumerate(entries):
+            kept_rows += row_count
+            if index and (index >= JOURNAL_MAX_ENTRIES or kept_rows > JOURNAL_MAX_ROWS):
+                self.cursor.execute("DELETE FROM journal_rows WHERE entry_id <= ?", (entry_id,))
+                self.cursor.execute("DELETE FROM journal WHERE id <= ?", (entry_id,))
+                return
+    
+    def restore_rows(self, entry_id, side):
+        """Kembalikan semua tugas yang disentuh entri ke salinan side; kembalikan ID-nya"""
+        cursor = self.cursor
+        cursor.execute("SELECT task_id FROM journal_rows WHERE entry_id = ? AND side = 0", (entry_id,))
+        task_ids = [row[0] for row in cursor.fetchall()]
+        bulk = len(task_ids) >= JOURNAL_BULK_ROWS
+        
+        touched = "id IN (SELECT task_id FROM journal_rows WHERE entry_id = ? AND side = 0)"
+        if bulk:
+            self.delete_bulk(touched, (entry_id,))
+        else:
+            cursor.execute(f"DELETE FROM tasks WHERE {touched}", (entry_id,))
+        
+        source = "FROM journal_rows WHERE entry_id = ? AND side = ? AND task IS NOT NULL"
+        with deferred_triggers(cursor, BULK_DEFERRED_TRIGGERS if bulk else ()) as deferred:
+            # ID lama dipakai lagi; AUTOINCREMENT tidak pernah membagikannya ke tugas lain
+            cursor.execute(
+                f"INSERT INTO tasks (id, {JOURNAL_FIELDS}) SELECT task_id, {JOURNAL_FIELDS} {source}",
+                (entry_id, side)
+            )
+            cursor.execute(
+                f"INSERT INTO task_notes (task_id, body) SELECT task_id, notes {source} AND notes IS NOT NULL",
+                (entry_id, side)
+            )
+            if "trg_task_stats_insert" in deferred:
+                cursor.execute(
+                    f"SELECT COUNT(*), COUNT(CASE WHEN status = 'Selesai' THEN 1 END) {source}",
+                    (entry_id, side)
+                )
+                cursor.execute(
+                    "UPDATE task_stats SET total = total + ?, completed = completed + ? WHERE id = 1",
+                    cursor.fetchone()
+                )
+            if "trg_tasks_fts_insert" in deferred:
+                cursor.execute(
+                    f"INSERT INTO tasks_fts (rowid, task, notes) SELECT task_id, task, ifnull(notes, '') {source}",
+                    (entry_id, side)
+                )
+            mark_bulk_change(cursor, deferred)
+        return task_ids
+    
+    @traced("write")
+    def undo(self):
+        """Batalkan operasi terakhir; kembalikan (label, ID tugas) atau None jika kosong"""
+        with self.transaction():
+            self.cursor.execute("SELECT id, label FROM journal WHERE undone = 0 ORDER BY id DESC LIMIT 1")
+            entry = self.cursor.fetchone()
+            if entry is None:
+                return None
+            entry_id, label = entry
+            
+            # Kondisi sesudah operasi baru disalin sekarang, hanya untuk redo
+            self.copy_rows(
+                entry_id, 1, "id IN (SELECT task_id FROM journal_rows WHERE entry_id = ? AND side = 0)", (entry_id,)
+            )
+            task_ids = self.restore_rows(entry_id, 0)
+            self.cursor.execute("UPDATE journal SET undone = 1 WHERE id = ?", (entry_id,))
+            return label, task_ids
+    
+    @traced("write")
+    def redo(self):
+        """Ulangi operasi yang terakhir di-undo; kembalikan (label, ID tugas) atau None"""
+        with self.transaction():
+            self.cursor.execute("SELECT id, label FROM journal WHERE undone = 1 ORDER BY id LIMIT 1")
+            entry = self.cursor.fetchone()
+            if entry is None:
+                return None
+            entry_id, label = entry
+            
+            task_ids = self.restore_rows(entry_id, 1)
+            self.cursor.execute("DELETE FROM journal_rows WHERE entry_id = ? AND side = 1", (entry_id,))
+            self.cursor.execute("UPDATE journal SET undone = 0 WHERE id = ?", (entry_id,))
+            return label, task_ids
+    
+    @traced("query")
+    def journal_labels(self):
+        """(label undo berikutnya, label redo berikutnya); None jika tidak ada"""
+        self.cursor.execute(
+            "SELECT (SELECT label FROM journal WHERE undone = 0 ORDER BY id DESC LIMIT 1), "
+            "(SELECT label FROM journal WHERE undone = 1 ORDER BY id LIMIT 1)"
+        )
+        return self.cursor.fetchone()
+    
+    # ------------------------------------------------------------------
+    # Deteksi perubahan
+    # ------------------------------------------------------------------
+    
+    # Pembaca menyimpan versi terakhir yang sudah diterapkan dan hanya meminta
+    # baris changes sesudahnya; data_version memberi tahu kapan perlu bertanya.
+    
+    def data_version(self):
+        """PRAGMA data_version: berubah jika koneksi lain meng-commit sejak dibaca terakhir"""
+        self.cursor.execute("PRAGMA data_version")
+        return self.cursor.fetchone()[0]
+    
+    def change_version(self):
+        """Versi perubahan terbaru (0 jika belum ada)"""
+        self.cursor.execute("SELECT ifnull(max(version), 0) FROM changes")
+        return self.cursor.fetchone()[0]
+    
+    @traced("query")
+    def changes_since(self, version, limit, skip=()):
+        """(versi terbaru, ID tugas yang berubah setelah version); ID None jika harus muat ulang"""
+        # skip = rentang versi (awal, akhir] milik penulis sendiri yang sudah diterapkan.
+        # Muat ulang jika lebih dari limit tugas, ada perubahan massal, riwayat sudah
+        # dipangkas, atau versi mundur (file database diganti).
+        cursor = self.cursor
+        cursor.execute(
+            "SELECT ifnull(max(version), 0), (SELECT min(version) FROM changes WHERE version > ?) FROM changes",
+            (version,)
+        )
+        latest, oldest = cursor.fetchone()
+        if latest == version:
+            return latest, []
+        if latest < version or oldest > version + 1:
+            return latest, None
+        
+        condition = "version > ?"
+        params = [version]
+        for start, end in skip:
+            condition += " AND NOT (version > ? AND version <= ?)"
+            params += [start, end]
+        cursor.execute(f"SELECT DISTINCT task_id FROM changes WHERE {condition} LIMIT ?", (*params, limit + 1))
+        task_ids = [row[0] for row in cursor.fetchall()]
+        if len(task_ids) > limit or None in task_ids:
+            return latest, None
+        return latest, task_ids
+    
+    # ------------------------------------------------------------------
+    # Arsip dan pemeliharaan file
+    # ------------------------------------------------------------------
+    
+    # Tugas lama yang sudah selesai dipindah ke file arsip yang di-ATTACH hanya
+    # saat dibutuhkan, jadi tabel tasks (daftar, index, statistik) tetap sebesar
+    # tugas yang aktif. Semua method di sini berjalan di luar transaksi: ATTACH,
+    # VACUUM, dan commit per batch tidak bisa dijalankan di dalam transaksi lain.
+    
+    def attach_archive(self, create=True):
+        """ATTACH file arsip sebagai skema 'archive'; False jika belum ada dan create=False"""
+        self.cursor.execute("SELECT 1 FROM pragma_database_list WHERE name = 'archive'")
+        if self.cursor.fetchone() is not None:
+            return True
+        if not create and not os.path.exists(self.archive_path):
+            return False
+        self.cursor.execute("ATTACH DATABASE ? AS archive", (self.archive_path,))
+        self.cursor.execute("PRAGMA archive.auto_vacuum = INCREMENTAL")
+        self.cursor.execute("PRAGMA archive.journal_mode = WAL").fetchall()
+        migrate_archive(self.conn)
+        return True
+    
+    @traced("write")
+    def archive_completed(self, days=ARCHIVE_AFTER_DAYS, batch_size=ARCHIVE_BATCH):
+        """Pindahkan tugas selesai yang lebih lama dari days hari ke arsip; kembalikan jumlahnya"""
+        # Di mode WAL satu transaksi yang menulis dua file tidak atomik, jadi setiap
+        # batch dua commit: salin ke arsip dulu, baru hapus dari tasks. Jika terhenti
+        # di antaranya, tugas ada di kedua file dan dipindah ulang pada pemanggilan
+        # berikutnya (salinan lama di arsip diganti). Tugas yang masih dirujuk journal
+        # undo menunggu sampai entrinya terbuang agar undo tidak menghidupkannya lagi.
+        if self.conn.in_transaction:
+            raise RuntimeError("Arsip tidak bisa dijalankan di dalam transaksi")
+        self.attach_archive()
+        now = datetime.now()
+        cutoff = (now - timedelta(days=days)).strftime("%Y-%m-%d %H:%M")
+        condition = "id IN (SELECT value FROM json_each(?))"
+        moved = 0
+        while True:
+            self.cursor.execute(
+                "SELECT json_group_array(id) FROM (SELECT id FROM tasks "
+                "WHERE status = 'Selesai' AND ifnull(completed_date, created_date) < ? "
+                "AND id NOT IN (SELECT task_id FROM journal_rows) LIMIT ?)",
+                (cutoff, batch_size)
+            )
+            task_ids = self.cursor.fetchone()[0]
+            if task_ids == "[]":
+                return moved
+            with self.transaction():
+                self.cursor.execute(f"DELETE FROM archive.archived_tasks WHERE {condition}", (task_ids,))
+                self.cursor.execute(
+                    f"INSERT INTO archive.archived_tasks (id, {JOURNAL_FIELDS}, notes, archived_date) "
+                    f"SELECT id, {JOURNAL_FIELDS}, body, ? FROM tasks "
+                    f"LEFT JOIN task_notes ON task_notes.task_id = tasks.id WHERE {condition}",
+                    (now.strftime("%Y-%m-%d %H:%M"), task_ids)
+                )
+            moved += self.delete_bulk(condition, (task_ids,))
+    
+    @traced("query")
+    def search_archive(self, text, limit=SEARCH_LIMIT):
+        """Baris ARCHIVE_COLUMNS yang cocok dengan teks (kosong = arsip terbaru)"""
+        # File arsip tidak dibuat hanya untuk dicari
+        if not self.attach_archive(create=False):
+            return []
+        text = text.strip()
+        if not text:
+            self.cursor.execute(
+                f"SELECT {ARCHIVE_COLUMNS} FROM archive.archived_tasks ORDER BY id DESC LIMIT ?", (limit,)
+            )
+            return self.cursor.fetchall()
+        
+        self.cursor.execute("SELECT 1 FROM archive.sqlite_master WHERE name = 'archived_fts'")
+        if self.cursor.fetchone() is None:
+            pattern = like_pattern(text)
+            self.cursor.execute(
+                f"SELECT {ARCHIVE_COLUMNS} FROM archive.archived_tasks "
+                "WHERE task LIKE ? ESCAPE '\\' OR notes LIKE ? ESCAPE '\\' ORDER BY id DESC LIMIT ?",
+                (pattern, pattern, limit)
+            )
+            return self.cursor.fetchall()
+        self.cursor.execute(
+            f"SELECT {ARCHIVE_COLUMNS} FROM archive.archived_tasks JOIN ("
+            "    SELECT rowid AS match_id, rank AS match_rank FROM archive.archived_fts "
+            "    WHERE archived_fts MATCH ? ORDER BY rank LIMIT ?"
+            ") ON id = match_id ORDER BY match_rank",
+            (fts_query(text), limit)
+        )
+        return self.cursor.fetchall()
+    
+    def compact(self, vacuum=False, full=True):
+        """Lepaskan halaman kosong file database (dan arsip); kembalikan jumlah halamannya"""
+        # auto_vacuum INCREMENTAL: dilepas per COMPACT_STEP_PAGES, setiap langkah
+        # transaksi pendek sehingga DatabaseWorker tidak lama menunggu kunci tulis.
+        # File lama tanpa auto_vacuum di-VACUUM penuh sekali (sekaligus dikonversi)
+        # jika needs_vacuum(), atau jika vacuum=True. VACUUM penuh memegang kunci
+        # tulis sampai selesai, jadi pemeliharaan latar memakai full=False.
+        if self.conn.in_transaction:
+            raise RuntimeError("Pemadatan tidak bisa dijalankan di dalam transaksi")
+        self.cursor.execute("SELECT name FROM pragma_database_list WHERE name IN ('main', 'archive')")
+        freed = 0
+        for schema in [row[0] for row in self.cursor.fetchall()]:
+            free, pages = self.page_stats(schema)
+            self.cursor.execute(f"PRAGMA {schema}.auto_vacuum")
+            incremental = self.cursor.fetchone()[0] == 2
+            if vacuum or (full and self.needs_vacuum(schema)):
+                self.cursor.execute(f"PRAGMA {schema}.auto_vacuum = INCREMENTAL")
+                self.cursor.execute(f"VACUUM {schema}")
+                freed += free
+                continue
+            while incremental and free:
+                # executescript menjalankan pragma sampai selesai (execute hanya satu langkah)
+                self.conn.executescript(f"PRAGMA {schema}.incremental_vacuum({COMPACT_STEP_PAGES})")
+                remaining = self.page_stats(schema)[0]
+                freed += free - remaining
+                free = remaining
+        return freed
+    
+    def needs_vacuum(self, schema="main"):
+        """True jika file lama tanpa auto_vacuum punya halaman kosong melewati VACUUM_FREE_RATIO"""
+        self.cursor.execute(f"PRAGMA {schema}.auto_vacuum")
+        if self.cursor.fetchone()[0] == 2:
+            return False
+        free, pages = self.page_stats(schema)
+        return free > 0 and free >= pages * VACUUM_FREE_RATIO
+    
+    def page_stats(self, schema="main"):
+        """(halaman kosong, total halaman) file database skema ini"""
+        self.cursor.execute(f"PRAGMA {schema}.freelist_count")
+        free = self.cursor.fetchone()[0]
+        self.cursor.execute(f"PRAGMA {schema}.page_count")
+        return free, self.cursor.fetchone()[0]
+    
+    @traced("write")
+    def maintain(self, days=ARCHIVE_AFTER_DAYS, vacuum=False, background=False):
+        """Arsipkan tugas lama, padatkan file, lalu perbarui statistik query planner"""
+        # background=True (thread GUI/server, berjalan bersama tulisan pengguna):
+        # batch arsip kecil dan hanya incremental_vacuum, tanpa VACUUM penuh
+        started = time.perf_counter()
+        archived = self.archive_completed(days, ARCHIVE_BACKGROUND_BATCH if background else ARCHIVE_BATCH)
+        # Hari kalender yang sudah tidak punya tugas (pindah, dihapus, diarsipkan)
+        self.cursor.execute("DELETE FROM task_days WHERE total = 0")
+        freed = self.compact(vacuum, full=not background)
+        # ANALYZE dengan sampel terbatas: cukup untuk planner, tetap cepat di jutaan baris
+        self.cursor.execute(f"PRAGMA analysis_limit = {ANALYZE_LIMIT}")
+        self.cursor.execute("ANALYZE")
+        return {"archived": archived, "freed_pages": freed, "seconds": time.perf_counter() - started}
+    
+    # ------------------------------------------------------------------
+    # Import/export massal
+    # ------------------------------------------------------------------
+    
+    @traced("write")
+    def import_tasks(self, path, fmt=None, on_batch=None, batch_size=IMPORT_BATCH):
+        """Import tugas dari CSV/JSONL secara streaming dengan executemany per batch"""
+        fmt = file_format(path, fmt)
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return self.import_records(read_records(f, fmt), on_batch, batch_size)
+    
+    @traced("write")
+    def import_chunk(self, records, entry_id=None):
+        """Satu potongan import dari klien todo_server: [[nomor baris, record], ...]"""
+        # Klien membaca file sendiri dan mengirimnya per potongan; entry_id dari
+        # potongan sebelumnya membuat seluruh file tetap satu entri Undo
+        return self.import_records(records, entry_id=entry_id)
+    
+    def import_records(self, records, on_batch=None, batch_size=IMPORT_BATCH, entry_id=None):
+        """Simpan hasil read_records per batch; kembalikan statistik import beserta entri journal-nya"""
+        # File dibaca bertahap; yang ada di memori hanya satu batch. Setiap batch
+        # satu transaction(): commit sendiri di CLI, savepoint di DatabaseWorker.
+        created_date = datetime.now().strftime("%Y-%m-%d %H:%M")
+        started = time.perf_counter()
+        stats = {"imported": 0, "skipped": 0, "errors": []}
+        
+        # Waktu baca file + validasi per batch dicatat sebagai span "parse"
+        tasks, notes = [], []
+        parse_started = time.perf_counter()
+        for line_no, record in records:
+            try:
+                values, body = import_values(record, created_date)
+            except ValueError as exc:
+                stats["skipped"] += 1
+                if len(stats["errors"]) < IMPORT_MAX_ERRORS:
+                    stats["errors"].append(f"Baris {line_no}: {exc}")
+                continue
+            if body:
+                notes.append((len(tasks), body))
+            tasks.append(values)
+            if len(tasks) >= batch_size:
+                add_span("import_values", "parse", parse_started, len(tasks))
+                entry_id = self.import_batch(entry_id, tasks, notes)
+                stats["imported"] += len(tasks)
+                if on_batch:
+                    on_batch(stats)
+                tasks, notes = [], []
+                parse_started = time.perf_counter()
+        if tasks:
+            add_span("import_values", "parse", parse_started, len(tasks))
+            entry_id = self.import_batch(entry_id, tasks, notes)
+            stats["imported"] += len(tasks)
+        
+        stats["entry_id"] = entry_id
+        stats["seconds"] = time.perf_counter() - started
+        return stats
+    
+    def import_batch(self, entry_id, tasks, notes):
+        """insert_batch yang dicatat di satu entri journal per import; kembalikan entry_id"""
+        with self.transaction():
+            if entry_id is not None:
+                # Entri potongan sebelumnya sudah di-undo atau terbuang compact_journal
+                self.cursor.execute("SELECT 1 FROM journal WHERE id = ? AND undone = 0", (entry_id,))
+                if self.cursor.fetchone() is None:
+                    entry_id = None
+            if entry_id is None:
+                entry_id = self.start_entry("Import tugas")
+            first_id = self.insert_batch(tasks, notes)
+            self.journal_added(entry_id, "id >= ?", (first_id,))
+            self.compact_journal()
+        return entry_id
+    
+    @traced("write")
+    def insert_batch(self, tasks, notes):
+        """Satu batch import: executemany tanpa trigger per baris; kembalikan ID pertama"""
+        cursor = self.cursor
+        with self.transaction(), deferred_triggers(cursor, BULK_DEFERRED_TRIGGERS) as deferred:
+            # deadline_ts dihitung SQLite dengan rumus yang sama seperti migrasi versi 3
+            cursor.executemany(
+                "INSERT INTO tasks (task, priority, status, created_date, completed_date, "
+                "deadline_date, deadline_time, recurrence, deadline_ts) VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, "
+                "CAST(strftime('%s', ?6 || ' ' || ?7, 'utc') AS INTEGER))",
+                tasks
+            )
+            # ID AUTOINCREMENT satu executemany berurutan karena kunci tulis dipegang
+            # sampai selesai, jadi ID tiap baris bisa dihitung dari last_insert_rowid()
+            cursor.execute("SELECT last_insert_rowid()")
+            first_id = cursor.fetchone()[0] - len(tasks) + 1
+            cursor.executemany(
+                "INSERT INTO task_notes (task_id, body) VALUES (?, ?)",
+                [(first_id + index, body) for index, body in notes]
+            )
+            
+            # Pekerjaan trigger yang ditunda dikerjakan sekali untuk seluruh batch
+            if "trg_task_stats_insert" in deferred:
+                cursor.execute(
+                    "UPDATE task_stats SET total = total + ?, completed = completed + ? WHERE id = 1",
+                    (len(tasks), sum(1 for values in tasks if values[2] == "Selesai"))
+                )
+            if "trg_tasks_fts_insert" in deferred:
+                cursor.execute(
+                    "INSERT INTO tasks_fts (rowid, task, notes) "
+                    "SELECT id, task, ifnull(body, '') FROM tasks "
+                    "LEFT JOIN task_notes ON task_notes.task_id = tasks.id WHERE id >= ?",
+                    (first_id,)
+                )
+            mark_bulk_change(cursor, deferred)
+        return first_id
+    
+    @traced("write")
+    def export_tasks(self, path, fmt=None):
+        """Export semua tugas ke CSV/JSONL sambil membaca cursor baris demi baris"""
+        fmt = file_format(path, fmt)
+        started = time.perf_counter()
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            exported = self.write_records(f, fmt)
+        return {"exported": exported, "seconds": time.perf_counter() - started}
+    
+    @traced("query")
+    def export_page(self, after_id=0, limit=EXPORT_PAGE):
+        """Satu halaman export untuk klien todo_server: (id, kolom EXPORT_FIELDS...) dengan id > after_id"""
+        # Keyset per id: setiap halaman satu pencarian index, berapa pun posisinya
+        self.cursor.execute(
+            f"SELECT id, {EXPORT_COLUMNS} FROM tasks LEFT JOIN task_notes ON task_notes.task_id = tasks.id "
+            "WHERE id > ? ORDER BY id LIMIT ?",
+            (after_id, limit)
+        )
+        return self.cursor.fetchall()
+    
+    def write_records(self, f, fmt):
+        """Tulis semua tugas ke file teks yang sudah dibuka; kembalikan jumlahnya"""
+        cursor = self.conn.execute(
+            f"SELECT {EXPORT_COLUMNS} FROM tasks LEFT JOIN task_notes ON task_notes.task_id = tasks.id ORDER BY tasks.id"
+        )
+        write = record_writer(f, fmt)
+        exported = 0
+        for row in cursor:
+            write(row)
+            exported += 1
+        return exported
+
+
+def maintain_database(db_path, profile=None):
+    """TodoStore.maintain latar dengan koneksi sendiri (untuk thread latar GUI dan server)"""
+    store = TodoStore(db_path, profile)
+    try:
+        return store.maintain(background=True)
+    finally:
+        store.close()
+
+
+# ----------------------------------------------------------------------
+# Perintah baris (CLI)
+# ----------------------------------------------------------------------
+
+STATE_MARKS = {"completed": "✓", "overdue": "!", "pending": " "}
+
+
+def print_rows(rows):
+    """Cetak baris TASK_COLUMNS sebagai tabel teks"""
+    for row in rows:
+        task_id, task, priority, status, _, deadline_display, _, state, has_notes = row[:9]
+        notes_mark = "✎" if has_notes else " "
+        print(f"{task_id:>8}  {STATE_MARKS[state]}{notes_mark} {deadline_display:16s}  {priority:7s} {task}")
+
+
+def print_agenda(items):
+    """Cetak hasil TodoStore.agenda per hari"""
+    day = None
+    for timestamp, row in items:
+        moment = datetime.fromtimestamp(timestamp)
+        if moment.date() != day:
+            day = moment.date()
+            print(f"{day:%d/%m/%Y}")
+        task_id, task, priority = row[:3]
+        print(f"  {moment:%H:%M}  {task_id:>8}  {priority:7s} {task}")
+
+
+def print_calendar(year, month, days):
+    """Cetak satu bulan hasil TodoStore.calendar_days: tanggal, jumlah tugas, ! jika ada yang terlambat"""
+    import calendar
+    print(f"{MONTH_NAMES[month - 1]} {year}".center(7 * 9).rstrip())
+    print("".join(f"{name:<9}" for name in DAY_NAMES).rstrip())
+    for week in calendar.Calendar().monthdatescalendar(year, month):
+        cells = []
+        for day in week:
+            count, _, overdue, _ = days.get(day.isoformat(), (0, 0, 0, None))
+            if day.month != month:
+                cells.append(" " * 9)
+            elif count:
+                cells.append(f"{day.day:>2} {count:>4}{'!' if overdue else ' '} ")
+            else:
+                cells.append(f"{day.day:>2}       ")
+        print("".join(cells).rstrip())
+
+
+def run_cli(argv=None):
+    """Perintah baris untuk skrip dan otomasi: add/list/agenda/calendar/complete/search/stats/undo/redo/import/export/maintain"""
+    # argparse hanya dibutuhkan CLI, tidak ikut dimuat saat GUI dibuka
+    import argparse
+    parser = argparse.ArgumentParser(description="To-Do List tanpa GUI")
+    parser.add_argument("--db", default=DB_PATH, help="file database (default: %(default)s)")
+    parser.add_argument("--profile", choices=sorted(STORAGE_PROFILES), help="profil penyimpanan SQLite")
+    commands = parser.add_subparsers(dest="command", required=True)
+    
+    command = commands.add_parser("add", help="tambah tugas")
+    command.add_argument("task")
+    command.add_argument("--priority", choices=PRIORITIES, default="Sedang")
+    command.add_argument("--deadline", help="tanggal YYYY-MM-DD")
+    command.add_argument("--time", default="00:00", help="jam HH:MM (default: %(default)s)")
+    command.add_argument("--repeat", metavar="ATURAN",
+                         help=f"ulangi: {'/'.join(RECURRENCE_PRESETS)} atau RRULE, misalnya FREQ=WEEKLY;INTERVAL=2;BYDAY=MO")
+    
+    command = commands.add_parser("list", help="tampilkan tugas (default urut deadline)")
+    command.add_argument("--limit", type=int, default=50, help="-1 untuk semua (default: %(default)s)")
+    command.add_argument("--offset", type=int, default=0)
+    command.add_argument("--sort", choices=sorted(SORT_COLUMNS), default="deadline")
+    command.add_argument("--desc", action="store_true", help="urutan turun")
+    command.add_argument("--status", choices=STATUSES)
+    command.add_argument("--priority", choices=PRIORITIES)
+    command.add_argument("--overdue", action="store_true", help="hanya tugas terlambat")
+    command.add_argument("--from", dest="date_from", help="deadline mulai tanggal YYYY-MM-DD")
+    command.add_argument("--to", dest="date_to", help="deadline sampai tanggal YYYY-MM-DD")
+    
+    command = commands.add_parser("agenda", help="kejadian tugas (termasuk tugas berulang) per hari")
+    command.add_argument("--from", dest="date_from", help="mulai tanggal YYYY-MM-DD (default: hari ini)")
+    command.add_argument("--to", dest="date_to", help="sampai tanggal YYYY-MM-DD (default: 7 hari)")
+    command.add_argument("--limit", type=int, default=AGENDA_LIMIT)
+    
+    command = commands.add_parser("calendar", help="jumlah tugas per hari dalam satu bulan")
+    command.add_argument("--month", help="bulan YYYY-MM (default: bulan ini)")
+    
+    command = commands.add_parser("complete", help="tandai tugas selesai")
+    command.add_argument("ids", type=int, nargs="+")
+    
+    command = commands.add_parser("search", help="cari judul dan catatan")
+    command.add_argument("text")
+    command.add_argument("--limit", type=int, default=SEARCH_LIMIT)
+    command.add_argument("--archive", action="store_true", help="cari di arsip tugas selesai")
+    
+    commands.add_parser("stats", help="ringkasan total/selesai/terlambat")
+    commands.add_parser("undo", help="batalkan operasi terakhir")
+    commands.add_parser("redo", help="ulangi operasi yang terakhir dibatalkan")
+    
+    command = commands.add_parser("maintain", help="arsipkan tugas selesai lama, padatkan file, ANALYZE")
+    command.add_argument("--days", type=int, default=ARCHIVE_AFTER_DAYS,
+                         help="arsipkan tugas yang selesai lebih dari sekian hari (default: %(default)s)")
+    command.add_argument("--vacuum", action="store_true", help="VACUUM penuh walaupun halaman kosong sedikit")
+    
+    for name, help_text in (("import", "import tugas dari file"), ("export", "export tugas ke file")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("file", help="file .csv atau .jsonl")
+        command.add_argument("--format", choices=("csv", "jsonl"), help="paksa format file")
+    
+    args = parser.parse_args(argv)
+    # Import massal memakai profil 'cepat' kecuali diminta lain
+    profile = args.profile or ("cepat" if args.command == "import" else STORAGE_PROFILE)
+    store = TodoStore(args.db, STORAGE_PROFILES[profile])
+    try:
+        if args.command == "add":
+            try:
+                task_id = store.add_task(args.task, args.priority, args.deadline, args.time, recurrence=args.repeat)
+            except ValueError as exc:
+                parser.error(str(exc))
+            print(f"Tugas {task_id} ditambahkan")
+        elif args.command == "list":
+            try:
+                view = TaskView(args.sort, args.desc, args.status, args.priority, args.overdue,
+                                parse_date(args.date_from), parse_date(args.date_to))
+            except ValueError as exc:
+                parser.error(str(exc))
+            print_rows(store.list_tasks(args.limit, args.offset, view))
+        elif args.command == "agenda":
+            try:
+                date_from = parse_date(args.date_from) or date.today().isoformat()
+                date_to = parse_date(args.date_to) or (date.fromisoformat(date_from) + timedelta(days=6)).isoformat()
+            except ValueError as exc:
+                parser.error(str(exc))
+            print_agenda(store.agenda(date_from, date_to, args.limit))
+        elif args.command == "calendar":
+            try:
+                first = parse_date(f"{args.month}-01") if args.month else date.today().replace(day=1).isoformat()
+            except ValueError as exc:
+                parser.error(str(exc))
+            first = date.fromisoformat(first)
+            last = (first + timedelta(days=31)).replace(day=1) - timedelta(days=1)
+            print_calendar(first.year, first.month, store.calendar_days(first.isoformat(), last.isoformat()))
+        elif args.command == "complete":
+            with store.transaction():
+                missing = [task_id for task_id in args.ids if not store.complete_task(task_id)]
+            for task_id in missing:
+                print(f"Tugas {task_id} tidak ditemukan", file=sys.stderr)
+            if missing:
+                return 1
+        elif args.command == "search" and args.archive:
+            for task_id, task, priority, deadline_display, completed_date, _ in store.search_archive(args.text, args.limit):
+                print(f"{task_id:>8}  ✓  {deadline_display:16s}  {priority:7s} {task} (selesai {completed_date})")
+        elif args.command == "search":
+            print_rows(store.search(args.text, args.limit))
+        elif args.command == "stats":
+            total, completed, overdue = store.count_tasks()
+            print(f"Total Tugas: {total} | Selesai: {completed} | "
+                  f"Belum Selesai: {total - completed} | Terlambat: {overdue}")
+        elif args.command in ("undo", "redo"):
+            result = store.undo() if args.command == "undo" else store.redo()
+            if result is None:
+                print(f"Tidak ada operasi untuk di-{args.command}", file=sys.stderr)
+                return 1
+            label, task_ids = result
+            print(f"{args.command.capitalize()}: {label} ({len(task_ids)} tugas)")
+        elif args.command == "maintain":
+            stats = store.maintain(args.days, args.vacuum)
+            print(f"Diarsipkan: {stats['archived']} tugas | Halaman dilepas: {stats['freed_pages']} | "
+                  f"{stats['seconds']:.1f} s")
+        elif args.command == "import":
+            def progress(stats):
+                print(f"\r{stats['imported']} tugas diimport...", end="", file=sys.stderr, flush=True)
+            
+            stats = store.import_tasks(args.file, args.format, on_batch=progress)
+            print(file=sys.stderr)
+            print(f"Diimport: {throughput(stats['imported'], stats['seconds'])}")
+            if stats["skipped"]:
+                print(f"Dilewati: {stats['skipped']} baris")
+                for error in stats["errors"]:
+                    print(f"  {error}")
+        else:
+            stats = store.export_tasks(args.file, args.format)
+            print(f"Diexport: {throughput(stats['exported'], stats['seconds'])}")
+    finally:
+        store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_cli())